@@ -362,8 +362,6 @@ CREATE INDEX idx_source_release_history_digest
     ON source_release_history(digest);
 CREATE INDEX idx_source_release_run_observations_history_observed_at
     ON source_release_run_observations(source_release_history_id, observed_at DESC);
-CREATE INDEX idx_tracker_release_history_tracker_created_at
-    ON tracker_release_history(aggregate_tracker_id, created_at DESC);
 CREATE INDEX idx_tracker_release_history_tracker_version
     ON tracker_release_history(aggregate_tracker_id, version);
 CREATE INDEX idx_tracker_release_history_sources_source_release_history_id
@@ -432,10 +430,105 @@ CREATE INDEX idx_executor_snapshots_executor_created
     ON executor_snapshots(executor_id, created_at DESC);
 CREATE INDEX idx_executor_snapshots_executor_run_id
     ON executor_snapshots(executor_run_id);
+CREATE INDEX idx_tracker_release_history_tracker_created_at
+    ON tracker_release_history(aggregate_tracker_id, created_at DESC, id DESC);
+CREATE INDEX idx_tracker_release_history_created_at
+    ON tracker_release_history(created_at DESC, id DESC);
+CREATE VIRTUAL TABLE tracker_release_history_search USING fts5(
+    search_text,
+    tokenize = 'trigram'
+);
+CREATE TABLE IF NOT EXISTS 'tracker_release_history_search_data'(id INTEGER PRIMARY KEY, block BLOB);
+CREATE TABLE IF NOT EXISTS 'tracker_release_history_search_idx'(segid, term, pgno, PRIMARY KEY(segid, term)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS 'tracker_release_history_search_content'(id INTEGER PRIMARY KEY, c0);
+CREATE TABLE IF NOT EXISTS 'tracker_release_history_search_docsize'(id INTEGER PRIMARY KEY, sz BLOB);
+CREATE TABLE IF NOT EXISTS 'tracker_release_history_search_config'(k PRIMARY KEY, v) WITHOUT ROWID;
+CREATE TRIGGER tracker_release_history_search_insert
+AFTER INSERT ON tracker_release_history
+BEGIN
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT NEW.id,
+           COALESCE(at.name, '') || char(10) ||
+           COALESCE(NEW.identity_key, '') || char(10) ||
+           COALESCE(srh.version, NEW.version, '') || char(10) ||
+           COALESCE(srh.name, '') || char(10) ||
+           COALESCE(srh.tag_name, '') || char(10) ||
+           COALESCE(NEW.digest, '')
+    FROM (SELECT 1)
+    LEFT JOIN aggregate_trackers at ON at.id = NEW.aggregate_tracker_id
+    LEFT JOIN source_release_history srh ON srh.id = NEW.primary_source_release_history_id;
+END;
+CREATE TRIGGER tracker_release_history_search_update
+AFTER UPDATE OF aggregate_tracker_id, primary_source_release_history_id, identity_key, version, digest
+ON tracker_release_history
+BEGIN
+    DELETE FROM tracker_release_history_search WHERE rowid = OLD.id;
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT NEW.id,
+           COALESCE(at.name, '') || char(10) ||
+           COALESCE(NEW.identity_key, '') || char(10) ||
+           COALESCE(srh.version, NEW.version, '') || char(10) ||
+           COALESCE(srh.name, '') || char(10) ||
+           COALESCE(srh.tag_name, '') || char(10) ||
+           COALESCE(NEW.digest, '')
+    FROM (SELECT 1)
+    LEFT JOIN aggregate_trackers at ON at.id = NEW.aggregate_tracker_id
+    LEFT JOIN source_release_history srh ON srh.id = NEW.primary_source_release_history_id;
+END;
+CREATE TRIGGER tracker_release_history_search_delete
+AFTER DELETE ON tracker_release_history
+BEGIN
+    DELETE FROM tracker_release_history_search WHERE rowid = OLD.id;
+END;
+CREATE TRIGGER source_release_history_search_update
+AFTER UPDATE OF version, name, tag_name ON source_release_history
+WHEN OLD.version IS NOT NEW.version
+    OR OLD.name IS NOT NEW.name
+    OR OLD.tag_name IS NOT NEW.tag_name
+BEGIN
+    DELETE FROM tracker_release_history_search
+    WHERE rowid IN (
+        SELECT id FROM tracker_release_history
+        WHERE primary_source_release_history_id = NEW.id
+    );
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT trh.id,
+           COALESCE(at.name, '') || char(10) ||
+           COALESCE(trh.identity_key, '') || char(10) ||
+           COALESCE(NEW.version, trh.version, '') || char(10) ||
+           COALESCE(NEW.name, '') || char(10) ||
+           COALESCE(NEW.tag_name, '') || char(10) ||
+           COALESCE(trh.digest, '')
+    FROM tracker_release_history trh
+    LEFT JOIN aggregate_trackers at ON at.id = trh.aggregate_tracker_id
+    WHERE trh.primary_source_release_history_id = NEW.id;
+END;
+CREATE TRIGGER aggregate_trackers_search_update
+AFTER UPDATE OF name ON aggregate_trackers
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM tracker_release_history_search
+    WHERE rowid IN (
+        SELECT id FROM tracker_release_history WHERE aggregate_tracker_id = NEW.id
+    );
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT trh.id,
+           COALESCE(NEW.name, '') || char(10) ||
+           COALESCE(trh.identity_key, '') || char(10) ||
+           COALESCE(srh.version, trh.version, '') || char(10) ||
+           COALESCE(srh.name, '') || char(10) ||
+           COALESCE(srh.tag_name, '') || char(10) ||
+           COALESCE(trh.digest, '')
+    FROM tracker_release_history trh
+    LEFT JOIN source_release_history srh ON srh.id = trh.primary_source_release_history_id
+    WHERE trh.aggregate_tracker_id = NEW.id;
+END;
 -- Dbmate schema migrations
 INSERT INTO "schema_migrations" (version) VALUES
   ('20000101000001'),
   ('20260508152003'),
   ('20260508153215'),
   ('20260513000001'),
-  ('20260517000001');
+  ('20260517000001'),
+  ('20261016000001'),
+  ('20261016000002');
@@ -0,0 +1,17 @@
+-- migrate:up
+
+-- History listings order by (created_at DESC, id DESC). Cover the id
+-- tie-breaker in the per-tracker index and add a global index for the
+-- all-trackers /api/releases listing, so neither query sorts in a temp B-tree.
+DROP INDEX IF EXISTS idx_tracker_release_history_tracker_created_at;
+CREATE INDEX idx_tracker_release_history_tracker_created_at
+    ON tracker_release_history(aggregate_tracker_id, created_at DESC, id DESC);
+CREATE INDEX idx_tracker_release_history_created_at
+    ON tracker_release_history(created_at DESC, id DESC);
+
+-- migrate:down
+
+DROP INDEX IF EXISTS idx_tracker_release_history_created_at;
+DROP INDEX IF EXISTS idx_tracker_release_history_tracker_created_at;
+CREATE INDEX idx_tracker_release_history_tracker_created_at
+    ON tracker_release_history(aggregate_tracker_id, created_at DESC);
@@ -0,0 +1,117 @@
+-- migrate:up
+
+-- /api/releases search is a case-insensitive substring match over the tracker
+-- name and the release's identity, version, name, tag and digest. A trigram
+-- FTS5 index answers those LIKE '%term%' filters without scanning every history
+-- row. One row per tracker_release_history row, sharing its id as the rowid;
+-- triggers keep it in step with the three tables the text is drawn from.
+CREATE VIRTUAL TABLE tracker_release_history_search USING fts5(
+    search_text,
+    tokenize = 'trigram'
+);
+
+INSERT INTO tracker_release_history_search (rowid, search_text)
+SELECT trh.id,
+       COALESCE(at.name, '') || char(10) ||
+       COALESCE(trh.identity_key, '') || char(10) ||
+       COALESCE(srh.version, trh.version, '') || char(10) ||
+       COALESCE(srh.name, '') || char(10) ||
+       COALESCE(srh.tag_name, '') || char(10) ||
+       COALESCE(trh.digest, '')
+FROM tracker_release_history trh
+LEFT JOIN aggregate_trackers at ON at.id = trh.aggregate_tracker_id
+LEFT JOIN source_release_history srh ON srh.id = trh.primary_source_release_history_id;
+
+CREATE TRIGGER tracker_release_history_search_insert
+AFTER INSERT ON tracker_release_history
+BEGIN
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT NEW.id,
+           COALESCE(at.name, '') || char(10) ||
+           COALESCE(NEW.identity_key, '') || char(10) ||
+           COALESCE(srh.version, NEW.version, '') || char(10) ||
+           COALESCE(srh.name, '') || char(10) ||
+           COALESCE(srh.tag_name, '') || char(10) ||
+           COALESCE(NEW.digest, '')
+    FROM (SELECT 1)
+    LEFT JOIN aggregate_trackers at ON at.id = NEW.aggregate_tracker_id
+    LEFT JOIN source_release_history srh ON srh.id = NEW.primary_source_release_history_id;
+END;
+
+CREATE TRIGGER tracker_release_history_search_update
+AFTER UPDATE OF aggregate_tracker_id, primary_source_release_history_id, identity_key, version, digest
+ON tracker_release_history
+BEGIN
+    DELETE FROM tracker_release_history_search WHERE rowid = OLD.id;
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT NEW.id,
+           COALESCE(at.name, '') || char(10) ||
+           COALESCE(NEW.identity_key, '') || char(10) ||
+           COALESCE(srh.version, NEW.version, '') || char(10) ||
+           COALESCE(srh.name, '') || char(10) ||
+           COALESCE(srh.tag_name, '') || char(10) ||
+           COALESCE(NEW.digest, '')
+    FROM (SELECT 1)
+    LEFT JOIN aggregate_trackers at ON at.id = NEW.aggregate_tracker_id
+    LEFT JOIN source_release_history srh ON srh.id = NEW.primary_source_release_history_id;
+END;
+
+CREATE TRIGGER tracker_release_history_search_delete
+AFTER DELETE ON tracker_release_history
+BEGIN
+    DELETE FROM tracker_release_history_search WHERE rowid = OLD.id;
+END;
+
+CREATE TRIGGER source_release_history_search_update
+AFTER UPDATE OF version, name, tag_name ON source_release_history
+WHEN OLD.version IS NOT NEW.version
+    OR OLD.name IS NOT NEW.name
+    OR OLD.tag_name IS NOT NEW.tag_name
+BEGIN
+    DELETE FROM tracker_release_history_search
+    WHERE rowid IN (
+        SELECT id FROM tracker_release_history
+        WHERE primary_source_release_history_id = NEW.id
+    );
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT trh.id,
+           COALESCE(at.name, '') || char(10) ||
+           COALESCE(trh.identity_key, '') || char(10) ||
+           COALESCE(NEW.version, trh.version, '') || char(10) ||
+           COALESCE(NEW.name, '') || char(10) ||
+           COALESCE(NEW.tag_name, '') || char(10) ||
+           COALESCE(trh.digest, '')
+    FROM tracker_release_history trh
+    LEFT JOIN aggregate_trackers at ON at.id = trh.aggregate_tracker_id
+    WHERE trh.primary_source_release_history_id = NEW.id;
+END;
+
+CREATE TRIGGER aggregate_trackers_search_update
+AFTER UPDATE OF name ON aggregate_trackers
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM tracker_release_history_search
+    WHERE rowid IN (
+        SELECT id FROM tracker_release_history WHERE aggregate_tracker_id = NEW.id
+    );
+    INSERT INTO tracker_release_history_search (rowid, search_text)
+    SELECT trh.id,
+           COALESCE(NEW.name, '') || char(10) ||
+           COALESCE(trh.identity_key, '') || char(10) ||
+           COALESCE(srh.version, trh.version, '') || char(10) ||
+           COALESCE(srh.name, '') || char(10) ||
+           COALESCE(srh.tag_name, '') || char(10) ||
+           COALESCE(trh.digest, '')
+    FROM tracker_release_history trh
+    LEFT JOIN source_release_history srh ON srh.id = trh.primary_source_release_history_id
+    WHERE trh.aggregate_tracker_id = NEW.id;
+END;
+
+-- migrate:down
+
+DROP TRIGGER IF EXISTS aggregate_trackers_search_update;
+DROP TRIGGER IF EXISTS source_release_history_search_update;
+DROP TRIGGER IF EXISTS tracker_release_history_search_delete;
+DROP TRIGGER IF EXISTS tracker_release_history_search_update;
+DROP TRIGGER IF EXISTS tracker_release_history_search_insert;
+DROP TABLE IF EXISTS tracker_release_history_search;
@@ -1,9 +1,11 @@
 """Configuration management module"""
 
+import re
+from functools import lru_cache
 from typing import Any, Literal
 
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .models import ReleaseChannel
 
@@ -20,6 +22,8 @@ class Settings(BaseModel):
 class Channel(BaseModel):
     """Release channel configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     # Channel name used for display and localization (four fixed options)
     name: Literal["stable", "prerelease", "beta", "canary"]
 
@@ -37,9 +41,17 @@ class Channel(BaseModel):
     enabled: bool = True
 
 
+@lru_cache(maxsize=512)
+def compile_channel_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a channel include/exclude regex once; raises re.error when invalid"""
+    return re.compile(pattern)
+
+
 def flatten_release_channels(release_channels: list[ReleaseChannel]) -> list[Channel]:
+    # ReleaseChannel enforces the same field constraints as Channel, so the
+    # copied values are already valid and do not need a second validation pass
     return [
-        Channel(
+        Channel.model_construct(
             name=release_channel.name,
             type=release_channel.type,
             include_pattern=release_channel.include_pattern,
@@ -53,6 +65,8 @@ def flatten_release_channels(release_channels: list[ReleaseChannel]) -> list[Cha
 class TrackerConfig(BaseModel):
     """Tracker configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: Literal["github", "gitlab", "gitea", "helm", "container"]
     enabled: bool = True
@@ -95,10 +109,28 @@ class TrackerConfig(BaseModel):
     def validate_name(cls, value: str) -> str:
         return cls.validate_tracker_name(value)
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "TrackerConfig":
+        """Build a config from already-validated models without re-running validation"""
+        values["name"] = cls.validate_tracker_name(values["name"])
+        values["channels"] = [
+            (
+                channel
+                if isinstance(channel, Channel)
+                else Channel.model_construct(
+                    **{key: channel[key] for key in Channel.model_fields if key in channel}
+                )
+            )
+            for channel in values.get("channels") or []
+        ]
+        return cls.model_construct(**values)
+
 
 class NotifierConfig(BaseModel):
     """Notifier configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: Literal["webhook", "email"]
     url: str | None = None
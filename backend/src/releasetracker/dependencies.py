@@ -1,9 +1,11 @@
 """FastAPI dependencies"""
 
+import time
 from typing import Annotated
-from fastapi import Depends, HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request, Response
 from fastapi.security import OAuth2PasswordBearer
 
+from .models import User
 from .services.auth import AuthService
 from .services.system_keys import SystemKeyManager
 
@@ -17,51 +19,65 @@ from .executor_scheduler import ExecutorScheduler
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 
+# The app.state readers below only do attribute lookups. They are declared
+# ``async def`` so FastAPI awaits them inline instead of dispatching each one
+# through the threadpool on every request.
 
-def get_storage(request: Request) -> SQLiteStorage:
+
+async def get_storage(request: Request) -> SQLiteStorage:
     """Get the Storage instance from app.state"""
-    storage = getattr(request.app.state, "storage", None)
-    if not storage:
-        raise HTTPException(status_code=503, detail="Storage service is not initialized")
-    return storage
+    try:
+        return request.app.state.storage
+    except AttributeError:
+        raise HTTPException(status_code=503, detail="Storage service is not initialized") from None
 
 
-def get_scheduler(request: Request) -> ReleaseScheduler:
+async def get_scheduler(request: Request) -> ReleaseScheduler:
     """Get the Scheduler instance from app.state"""
-    scheduler = getattr(request.app.state, "scheduler", None)
-    if not scheduler:
-        raise HTTPException(status_code=503, detail="Scheduler service is not initialized")
-    return scheduler
+    try:
+        return request.app.state.scheduler
+    except AttributeError:
+        raise HTTPException(
+            status_code=503, detail="Scheduler service is not initialized"
+        ) from None
 
 
-def get_scheduler_host(request: Request) -> SchedulerHost:
+async def get_scheduler_host(request: Request) -> SchedulerHost:
     """Get the shared SchedulerHost instance from app.state"""
-    scheduler_host = getattr(request.app.state, "scheduler_host", None)
-    if not scheduler_host:
-        raise HTTPException(status_code=503, detail="Scheduler host service is not initialized")
-    return scheduler_host
+    try:
+        return request.app.state.scheduler_host
+    except AttributeError:
+        raise HTTPException(
+            status_code=503, detail="Scheduler host service is not initialized"
+        ) from None
 
 
-def get_executor_scheduler(request: Request) -> ExecutorScheduler:
-    scheduler = getattr(request.app.state, "executor_scheduler", None)
-    if not scheduler:
-        raise HTTPException(status_code=503, detail="Executor scheduler service is not initialized")
-    return scheduler
+async def get_executor_scheduler(request: Request) -> ExecutorScheduler:
+    try:
+        return request.app.state.executor_scheduler
+    except AttributeError:
+        raise HTTPException(
+            status_code=503, detail="Executor scheduler service is not initialized"
+        ) from None
 
 
-def get_system_key_manager(request: Request) -> SystemKeyManager:
-    key_manager = getattr(request.app.state, "system_key_manager", None)
-    if not key_manager:
-        raise HTTPException(status_code=503, detail="System key service is not initialized")
-    return key_manager
+async def get_system_key_manager(request: Request) -> SystemKeyManager:
+    try:
+        return request.app.state.system_key_manager
+    except AttributeError:
+        raise HTTPException(
+            status_code=503, detail="System key service is not initialized"
+        ) from None
 
 
-def get_auth_service(
-    storage: Annotated[SQLiteStorage, Depends(get_storage)],
-    system_key_manager: Annotated[SystemKeyManager, Depends(get_system_key_manager)],
-) -> AuthService:
-    """Get the AuthService instance"""
-    return AuthService(storage, system_key_manager)
+async def get_auth_service(request: Request) -> AuthService:
+    """Get the shared AuthService instance from app.state"""
+    # Created once in lifespan; read directly instead of rebuilding it from
+    # get_storage/get_system_key_manager sub-dependencies on every request.
+    try:
+        return request.app.state.auth_service
+    except AttributeError:
+        raise HTTPException(status_code=503, detail="Auth service is not initialized") from None
 
 
 async def get_current_user(
@@ -81,21 +97,44 @@ async def get_current_user(
 
 
 async def get_current_admin_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    user: Annotated[User, Depends(get_current_user)],
 ):
     """Get the current admin user; only admin users may access this"""
-    try:
-        user = await auth_service.get_current_user(token)
-        if user.username != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Admin access required",
-            )
-        return user
-    except ValueError as e:
+    # Builds on get_current_user so a request that needs both resolves the
+    # bearer token and session once through FastAPI's per-request cache
+    if user.username != "admin":
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
         )
+    return user
+
+
+def data_version_etag(refresh_seconds: float | None = None):
+    """Build a dependency that answers conditional GETs from the storage data version
+
+    The ETag changes whenever storage is written to. ``refresh_seconds`` also rolls
+    it over periodically for responses that depend on the current time.
+    """
+
+    async def check_etag(
+        request: Request,
+        response: Response,
+        storage: Annotated[SQLiteStorage, Depends(get_storage)],
+    ) -> str:
+        version = await storage.get_data_version()
+        if refresh_seconds is not None:
+            version = f"{version}-{int(time.time() // refresh_seconds)}"
+        etag = f'W/"{version}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+            if etag in candidates or "*" in candidates:
+                raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+        return etag
+
+    return check_etag
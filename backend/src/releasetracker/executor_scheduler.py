@@ -32,7 +32,7 @@ from .models import (
     Release,
     TrackerSource,
 )
-from .notifiers import WebhookNotifier
+from .notifiers import WebhookNotifier, notify_all
 from .notifiers.base import NotificationEvent
 from .scheduler_host import SchedulerHost
 from .services.runtime_credentials import materialize_runtime_connection_credentials
@@ -2905,14 +2905,19 @@ class ExecutorScheduler:
             return
 
         active_notifiers = [
-            WebhookNotifier(
-                name=item.name,
-                url=item.url,
-                events=item.events,
-                language=item.language,
-            )
-            for item in db_notifiers
-            if item.enabled and item.type == "webhook"
+            notifier
+            for notifier in (
+                WebhookNotifier(
+                    name=item.name,
+                    url=item.url,
+                    events=item.events,
+                    language=item.language,
+                )
+                for item in db_notifiers
+                if item.enabled and item.type == "webhook"
+            )
+            # Unsubscribed notifiers are dropped before the payload is built
+            if notifier.subscribes_to(event)
         ]
         if not active_notifiers:
             return
@@ -2951,10 +2956,7 @@ class ExecutorScheduler:
             if isinstance(recovery_outcome, str):
                 payload["recovery_outcome"] = recovery_outcome
 
-        await asyncio.gather(
-            *(notifier.notify(event, payload) for notifier in active_notifiers),
-            return_exceptions=True,
-        )
+        await notify_all(active_notifiers, event, payload)
 
     def _within_maintenance_window(self, window: MaintenanceWindowConfig | None) -> bool:
         if not window:
@@ -1,5 +1,7 @@
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 # Default log format
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
@@ -9,27 +11,61 @@ DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 class LogConfig:
     """Centralized logging configuration"""
 
-    @staticmethod
+    _listener: QueueListener | None = None
+
+    @classmethod
     def setup_logging(
+        cls,
         level: int = logging.INFO,
         format: str = DEFAULT_LOG_FORMAT,
         datefmt: str = DEFAULT_DATE_FORMAT,
     ):
-        """Configure global logging"""
+        """Configure global logging
+
+        Records are handed to a background QueueListener so request handlers and
+        scheduler jobs never block on writing to stdout.
+        """
+        cls.shutdown_logging()
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(format, datefmt))
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        # The listener-side handler applies the real format; only merge args here
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
         # Configure the root logger
         logging.basicConfig(
             level=level,
-            format=format,
-            datefmt=datefmt,
-            handlers=[logging.StreamHandler(sys.stdout)],
+            handlers=[queue_handler],
             force=True,  # Force override of existing configuration
         )
 
+        cls._listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        cls._listener.start()
+
         # Tune third-party log levels to reduce noise
         logging.getLogger("httpx").setLevel(logging.WARNING)
         logging.getLogger("apscheduler").setLevel(logging.WARNING)
         logging.getLogger("aiosqlite").setLevel(logging.WARNING)
 
+    @classmethod
+    def shutdown_logging(cls):
+        """Flush queued records and write directly to the listener's handlers again"""
+        listener = cls._listener
+        if listener is None:
+            return
+        cls._listener = None
+        listener.stop()
+
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+                root_logger.removeHandler(handler)
+                for target in listener.handlers:
+                    root_logger.addHandler(target)
+
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
         """Get a standard logger"""
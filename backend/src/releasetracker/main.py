@@ -1,18 +1,27 @@
 """FastAPI application entry point"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 import logging
+import os
+
+import anyio
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.routing import Match, Mount
+from starlette.types import Scope
 
 from . import __version__
 from .scheduler import ReleaseScheduler
 from .scheduler_host import SchedulerHost
 from .executor_scheduler import ExecutorScheduler
+from .notifiers import WebhookNotifier
 from .services.auth import AuthService
 from .services.system_keys import SystemKeyManager
 from .storage.sqlite import SQLiteStorage
@@ -23,20 +32,25 @@ from .routers import executors
 from .routers import oidc as oidc_router
 from .routers import oidc_admin as oidc_admin_router
 
+# Backend root directory (holds data/ and, in release images, static/)
+BASE_DIR = Path(__file__).resolve().parents[2]
+DATA_DIR = BASE_DIR / "data"
+DB_PATH = os.fspath(DATA_DIR / "releases.db")
+SYSTEM_SECRETS_PATH = DATA_DIR / "system-secrets.json"
+
+# Expired OIDC login states are swept on this interval instead of on every callback
+OAUTH_STATE_CLEANUP_INTERVAL_SECONDS = 60
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifecycle management"""
 
     # Initialize storage
-    # data/releases.db relative to backend root
-    base_dir = Path(__file__).resolve().parent.parent.parent
-    db_path = str(base_dir / "data" / "releases.db")
-
-    system_key_manager = SystemKeyManager(base_dir / "data" / "system-secrets.json")
+    system_key_manager = SystemKeyManager(SYSTEM_SECRETS_PATH)
     await system_key_manager.initialize()
 
-    storage = SQLiteStorage(db_path, system_key_manager=system_key_manager)
+    storage = SQLiteStorage(DB_PATH, system_key_manager=system_key_manager)
     await storage.initialize()
     LogConfig.setup_logging(level=getattr(logging, await storage.get_system_log_level()))
     # Initialize configuration without AppConfig
@@ -46,9 +60,8 @@ async def lifespan(app: FastAPI):
     app.state.system_key_manager = system_key_manager
     # app.state.config = app_config # REMOVED
 
-    # Ensure an admin user exists
     auth_service = AuthService(storage, system_key_manager)
-    await auth_service.ensure_admin_user()
+    app.state.auth_service = auth_service
 
     # Initialize schedulers
     scheduler_host = SchedulerHost()
@@ -60,8 +73,15 @@ async def lifespan(app: FastAPI):
     app.state.scheduler = scheduler
     app.state.executor_scheduler = executor_scheduler
 
-    await scheduler.initialize()
+    # Ensuring the admin user and loading tracker jobs are independent
+    await asyncio.gather(auth_service.ensure_admin_user(), scheduler.initialize())
     await executor_scheduler.initialize()
+    scheduler_host.add_interval_job(
+        "oauth_state_cleanup",
+        "expired",
+        storage.cleanup_expired_oauth_states,
+        seconds=OAUTH_STATE_CLEANUP_INTERVAL_SECONDS,
+    )
     await scheduler_host.start()
     await scheduler.start()
     await executor_scheduler.start()
@@ -71,10 +91,16 @@ async def lifespan(app: FastAPI):
     # Clean up on shutdown
     if executor_scheduler:
         await executor_scheduler.shutdown()
+    if scheduler:
+        await scheduler.shutdown()
     if scheduler_host:
         await scheduler_host.shutdown()
+    # Release pooled webhook connections
+    await WebhookNotifier.close_client()
     # Close the persistent database connection
     await storage.close()
+    # Drain queued log records and stop the background log writer
+    LogConfig.shutdown_logging()
 
 
 # Create the FastAPI application
@@ -86,12 +112,15 @@ app = FastAPI(
 )
 
 # CORS configuration
+# Auth uses the Authorization header rather than cookies, so credentialed CORS isn't needed;
+# browsers may cache each preflight result for a day
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allow all origins in development
-    allow_credentials=True,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 
@@ -112,35 +141,46 @@ app.include_router(oidc_admin_router.router)
 
 # ==================== Static file serving ====================
 
-# Check whether the static files directory exists
-static_dir = Path(__file__).resolve().parent.parent.parent / "static"
 
-if static_dir.exists():
-    from fastapi import Request
-    from fastapi.responses import JSONResponse
+class SPAStaticFiles(StaticFiles):
+    """Serve the built frontend, falling back to index.html for client-side routes"""
+
+    def __init__(self, *, directory: Path, **kwargs: Any) -> None:
+        super().__init__(directory=directory, **kwargs)
+        # Resolved once; every client-side route is answered with this file
+        self.index_path = os.fspath(directory / "index.html")
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            if exc.status_code != 404:
+                raise
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, self.index_path)
+            except FileNotFoundError:
+                raise exc from None
+            return self.file_response(self.index_path, stat_result, scope)
+
+
+class SPAMount(Mount):
+    """Root mount for the SPA that never claims API or OIDC callback paths"""
 
-    # Mount the assets directory for static resources such as JS and CSS
-    app.mount("/assets", StaticFiles(directory=static_dir / "assets"), name="assets")
+    # Left to the router, so these keep FastAPI's 404s, 405s and trailing-slash redirects
+    EXCLUDED_PREFIXES = ("/api", "/auth/oidc")
 
-    # Custom 404 handler for SPA fallback
-    @app.exception_handler(404)
-    async def custom_404_handler(request: Request, exc):
-        """Handle 404 errors by returning the SPA index.html"""
-        # Return index.html only for non-API and non-OIDC callback paths
-        if request.url.path.startswith("/api") or request.url.path.startswith("/auth/oidc"):
-            return JSONResponse(status_code=404, content={"detail": "Not found"})
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] == "http" and scope["path"].startswith(self.EXCLUDED_PREFIXES):
+            return Match.NONE, {}
+        return super().matches(scope)
 
-        # Try to return a static file
-        file_path = static_dir / request.url.path.lstrip("/")
-        if file_path.is_file():
-            return FileResponse(file_path)
 
-        # SPA fallback - return index.html
-        index_path = static_dir / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path)
+STATIC_DIR = BASE_DIR / "static"
 
-        return JSONResponse(status_code=404, content={"detail": "Not found"})
+if STATIC_DIR.is_dir():
+    # Mounted last so every API route above takes precedence; Starlette serves
+    # assets directly and misses fall straight through to the cached index path
+    app.router.routes.append(SPAMount("/", app=SPAStaticFiles(directory=STATIC_DIR), name="spa"))
 
 else:
 
@@ -1,6 +1,6 @@
 """Notifier module"""
 
-from .base import BaseNotifier
+from .base import BaseNotifier, notify_all
 from .webhook import WebhookNotifier
 
-__all__ = ["BaseNotifier", "WebhookNotifier"]
+__all__ = ["BaseNotifier", "WebhookNotifier", "notify_all"]
@@ -1,8 +1,13 @@
 """Notifier base module"""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 
 class NotificationEvent:
     """Notification events"""
@@ -22,7 +27,23 @@ class BaseNotifier(ABC):
         self.name = name
         self.config = kwargs
 
+    def subscribes_to(self, event: str) -> bool:
+        """Whether this notifier wants the given event; all events by default"""
+        return True
+
     @abstractmethod
     async def notify(self, event: str, payload: Any):
         """Send a notification"""
         pass
+
+
+async def notify_all(notifiers: Iterable[BaseNotifier], event: str, payload: Any) -> None:
+    """Send one event to every subscribed notifier concurrently, isolating failures"""
+    subscribed = [notifier for notifier in notifiers if notifier.subscribes_to(event)]
+    results = await asyncio.gather(
+        *(notifier.notify(event, payload) for notifier in subscribed),
+        return_exceptions=True,
+    )
+    for notifier, result in zip(subscribed, results):
+        if isinstance(result, Exception):
+            logger.error(f"Notifier {notifier.name} failed for event {event}: {result}")
@@ -1,15 +1,26 @@
 import asyncio
+import copy
+import json
 import logging
+import random
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
-import emoji
 import httpx
 
 from .base import BaseNotifier
 
 logger = logging.getLogger(__name__)
 
+WEBHOOK_MAX_ATTEMPTS = 4
+WEBHOOK_MAX_RETRY_WAIT_SECONDS = 30.0
+# Rate limiting and transient upstream failures are worth another attempt
+WEBHOOK_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+WEBHOOK_ENCODED_PAYLOAD_CACHE_SIZE = 32
+
 WEBHOOK_TRANSLATIONS = {
     "en": {
         "executor": "Executor",
@@ -73,6 +84,11 @@ def _translated_status(status: str, labels: dict[str, str]) -> str:
 
 
 class WebhookNotifier(BaseNotifier):
+    # Notifiers are rebuilt from the database for every event, so the pooled
+    # client lives on the class to keep connections alive across sends
+    _client: httpx.AsyncClient | None = None
+    _client_loop: asyncio.AbstractEventLoop | None = None
+
     def __init__(
         self,
         name: str,
@@ -83,76 +99,194 @@ class WebhookNotifier(BaseNotifier):
     ):
         super().__init__(name, **kwargs)
         self.url = url
-        self.events = events or ["new_release"]
+        self.events = frozenset(events or ("new_release",))
         self.language = language if language in WEBHOOK_TRANSLATIONS else "en"
 
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Return the shared webhook client, creating it for the running loop"""
+        loop = asyncio.get_running_loop()
+        client = cls._client
+        if client is None or client.is_closed or cls._client_loop is not loop:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0
+                ),
+                timeout=10.0,
+            )
+            cls._client = client
+            cls._client_loop = loop
+        return client
+
+    @classmethod
+    async def close_client(cls):
+        """Close the shared webhook client"""
+        client = cls._client
+        cls._client = None
+        cls._client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    def subscribes_to(self, event: str) -> bool:
+        return event in self.events
+
     async def notify(self, event: str, payload: Any):
-        if event not in self.events:
+        if not self.subscribes_to(event):
             return
 
-        webhook_payload = _build_webhook_payload(event, payload, language=self.language)
+        client = self.get_client()
+        # Build and encode the request once; retries resend the same body
+        try:
+            request = client.build_request(
+                "POST",
+                self.url,
+                content=_encoded_webhook_payload(event, payload, self.language),
+                headers={"Content-Type": "application/json"},
+                timeout=10.0,
+            )
+        except Exception as e:
+            logger.error(f"Webhook notification could not be encoded: {self.name}: {e}")
+            return
 
-        async with httpx.AsyncClient() as client:
-            for attempt in range(4):
-                try:
-                    response = await client.post(
-                        self.url,
-                        json=webhook_payload,
-                        timeout=10.0,
-                    )
+        for attempt in range(WEBHOOK_MAX_ATTEMPTS):
+            is_last_attempt = attempt >= WEBHOOK_MAX_ATTEMPTS - 1
+            await _wait_for_webhook_rate_limit(self.url)
+            try:
+                response = await client.send(request)
+                _record_webhook_rate_limit(self.url, response)
 
-                    if response.status_code == 429:
-                        if attempt >= 3:
-                            logger.warning(
-                                f"Webhook 429 Too Many Requests after {attempt + 1} attempts, giving up"
-                            )
-                            return
-
-                        wait_time = 1.0
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after:
-                            try:
-                                wait_time = float(retry_after)
-                            except ValueError:
-                                pass
-                        else:
-                            try:
-                                data = response.json()
-                                if isinstance(data, dict) and "retry_after" in data:
-                                    raw = float(data["retry_after"])
-                                    wait_time = raw / 1000.0 if raw > 60 else raw
-                            except Exception:
-                                pass
-
-                        wait_time = min(wait_time + 0.5, 30.0)
+                if response.status_code in WEBHOOK_RETRY_STATUS_CODES:
+                    if is_last_attempt:
                         logger.warning(
-                            f"Webhook 429 Too Many Requests (attempt {attempt + 1}/4). "
-                            f"Waiting {wait_time:.1f}s before retry..."
+                            f"Webhook HTTP {response.status_code} after {attempt + 1} attempts, "
+                            "giving up"
                         )
-                        await asyncio.sleep(wait_time)
-                        continue
+                        return
 
-                    response.raise_for_status()
-                    logger.debug(
-                        f"Webhook notification sent successfully: {self.name} (attempt {attempt + 1})"
+                    wait_time = _retry_wait_seconds(attempt, response)
+                    logger.warning(
+                        f"Webhook HTTP {response.status_code} "
+                        f"(attempt {attempt + 1}/{WEBHOOK_MAX_ATTEMPTS}). "
+                        f"Waiting {wait_time:.1f}s before retry..."
                     )
-                    return
-
-                except httpx.HTTPStatusError as e:
-                    logger.error(
-                        f"Webhook notification failed with HTTP {e.response.status_code}: {self.name}"
+                    if response.status_code == 429:
+                        # Hold back every notifier posting to this webhook, not just this retry
+                        _defer_webhook(self.url, wait_time)
+                    else:
+                        await asyncio.sleep(wait_time)
+                    continue
+
+                response.raise_for_status()
+                logger.debug(
+                    f"Webhook notification sent successfully: {self.name} (attempt {attempt + 1})"
+                )
+                return
+
+            except httpx.HTTPStatusError as e:
+                logger.error(
+                    f"Webhook notification failed with HTTP {e.response.status_code}: {self.name}"
+                )
+                return
+            except Exception as e:
+                if not is_last_attempt:
+                    wait_time = _retry_wait_seconds(attempt)
+                    logger.warning(
+                        f"Webhook notification error (attempt {attempt + 1}/{WEBHOOK_MAX_ATTEMPTS}), "
+                        f"retrying in {wait_time:.1f}s: {e}"
                     )
-                    return
-                except Exception as e:
-                    if attempt < 3:
-                        wait = 2.0**attempt
-                        logger.warning(
-                            f"Webhook notification error (attempt {attempt + 1}/4), retrying in {wait}s: {e}"
-                        )
-                        await asyncio.sleep(wait)
-                        continue
-                    logger.error(f"Webhook notification failed after 4 attempts: {e}")
-                    return
+                    await asyncio.sleep(wait_time)
+                    continue
+                logger.error(
+                    f"Webhook notification failed after {WEBHOOK_MAX_ATTEMPTS} attempts: {e}"
+                )
+                return
+
+
+# Webhook URL -> monotonic time before which it should not be posted to. Discord and
+# Slack rate limit per webhook, so a throttled URL doesn't hold back others on the host
+_webhook_deferred_until: dict[str, float] = {}
+
+
+def _defer_webhook(url: str, seconds: float) -> None:
+    deferred_until = time.monotonic() + seconds
+    if deferred_until > _webhook_deferred_until.get(url, 0.0):
+        _webhook_deferred_until[url] = deferred_until
+
+
+async def _wait_for_webhook_rate_limit(url: str) -> None:
+    delay = _webhook_deferred_until.get(url, 0.0) - time.monotonic()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+def _record_webhook_rate_limit(url: str, response: httpx.Response) -> None:
+    """Defer the next post when the response says the bucket is exhausted"""
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return
+    try:
+        reset_after = float(response.headers["X-RateLimit-Reset-After"])
+    except (KeyError, ValueError):
+        return
+    _defer_webhook(url, min(reset_after, WEBHOOK_MAX_RETRY_WAIT_SECONDS))
+
+
+def _retry_wait_seconds(attempt: int, response: httpx.Response | None = None) -> float:
+    """Seconds to wait before retrying, preferring the server's own hint"""
+    if response is not None:
+        # Discord mirrors its body's retry_after in X-RateLimit-Reset-After, so the
+        # headers usually answer without decoding the body
+        retry_after = response.headers.get("Retry-After") or response.headers.get(
+            "X-RateLimit-Reset-After"
+        )
+        if retry_after:
+            try:
+                return _with_retry_jitter(float(retry_after) + 0.5)
+            except ValueError:
+                pass
+        elif response.status_code == 429:
+            # Discord reports its rate limit window in the JSON body
+            try:
+                data = json.loads(response.content)
+                if isinstance(data, dict) and "retry_after" in data:
+                    raw = float(data["retry_after"])
+                    wait_time = raw / 1000.0 if raw > 60 else raw
+                    return _with_retry_jitter(wait_time + 0.5)
+            except Exception:
+                pass
+
+    return min(WEBHOOK_MAX_RETRY_WAIT_SECONDS, 2.0**attempt * (1.0 + random.uniform(0, 0.5)))
+
+
+def _with_retry_jitter(wait_time: float) -> float:
+    # Jitter keeps notifiers throttled by the same endpoint from retrying in lockstep
+    return min(WEBHOOK_MAX_RETRY_WAIT_SECONDS, wait_time + random.uniform(0, 0.5))
+
+
+# (event, language, id(payload)) -> (payload, snapshot, encoded body). Holding the payload
+# keeps its id from being reused while the entry lives; the snapshot taken at encode time
+# catches a payload mutated in place since, so a hit always matches the current content
+_encoded_payloads: OrderedDict[tuple[str, str, int], tuple[Any, Any, bytes]] = OrderedDict()
+
+
+def _encoded_webhook_payload(event: str, payload: Any, language: str) -> bytes:
+    """Encode a notification once per payload and language for the whole fan-out"""
+    key = (event, language, id(payload))
+    cached = _encoded_payloads.get(key)
+    if cached is not None and cached[0] is payload and cached[1] == payload:
+        _encoded_payloads.move_to_end(key)
+        return cached[2]
+
+    body = json.dumps(
+        _build_webhook_payload(event, payload, language=language),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+    ).encode("utf-8")
+    _encoded_payloads[key] = (payload, copy.deepcopy(payload), body)
+    _encoded_payloads.move_to_end(key)
+    while len(_encoded_payloads) > WEBHOOK_ENCODED_PAYLOAD_CACHE_SIZE:
+        _encoded_payloads.popitem(last=False)
+    return body
 
 
 def _build_webhook_payload(
@@ -178,6 +312,21 @@ def _build_webhook_payload(
     }
 
 
+@lru_cache(maxsize=256)
+def _emojize_release_body(body: str) -> str:
+    # Shortcodes are delimited by colons; most release notes have none to expand
+    if body.count(":") < 2:
+        return body
+
+    # emoji loads its full code table on import (tens of ms), so defer it
+    # until a release notification actually carries notes
+    import emoji
+
+    # The alias table is a superset of the English names, so one pass covers both;
+    # the cache serves the same release body to every configured webhook
+    return emoji.emojize(body, language="alias")
+
+
 def _build_release_payload(
     event: str,
     release: Any,
@@ -186,6 +335,7 @@ def _build_release_payload(
     message = f"[{release.tracker_name}] {_translated_event(event, labels)}: {release.version}"
     if release.prerelease:
         message += f" ({labels['prerelease']})"
+    published_at = release.published_at.isoformat()
 
     return {
         "event": event,
@@ -197,9 +347,7 @@ def _build_release_payload(
             {
                 "title": f"{release.tracker_name} {release.version}",
                 "description": (
-                    emoji.emojize(
-                        emoji.emojize(release.body[:2000], language="alias"), language="en"
-                    )
+                    _emojize_release_body(release.body[:2000])
                     if release.body
                     else labels["no_release_notes"]
                 ),
@@ -214,12 +362,12 @@ def _build_release_payload(
                     },
                     {
                         "name": labels["published"],
-                        "value": release.published_at.isoformat(),
+                        "value": published_at,
                         "inline": True,
                     },
                 ],
                 "footer": {"text": labels["event_footer"].format(event=event)},
-                "timestamp": release.published_at.isoformat(),
+                "timestamp": published_at,
             }
         ],
     }
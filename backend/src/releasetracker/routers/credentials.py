@@ -37,10 +37,18 @@ def _mask_secret_value(value: Any):
 
 
 def _serialize_credential(credential: Credential) -> dict[str, Any]:
-    payload = credential.model_dump()
-    payload["token"] = _mask_secret_value(credential.token) if credential.token else ""
-    payload["secrets"] = _mask_secret_value(credential.secrets)
-    payload["secret_keys"] = sorted(credential.secrets.keys())
+    payload = credential.model_dump(exclude={"token", "secrets"})
+    masked_secrets = _mask_secret_value(credential.secrets)
+    token = credential.token
+    if not token:
+        payload["token"] = ""
+    elif credential.secrets.get("token") == token:
+        # The token is mirrored into secrets, so reuse the mask computed there
+        payload["token"] = masked_secrets["token"]
+    else:
+        payload["token"] = _mask_secret_value(token)
+    payload["secrets"] = masked_secrets
+    payload["secret_keys"] = sorted(credential.secrets)
     return payload
 
 
@@ -48,21 +56,22 @@ def _credential_reference_counts(references: dict[str, list[dict[str, Any]]]) ->
     return {key: len(items) for key, items in references.items()}
 
 
-@router.get("", dependencies=[Depends(get_current_user)])
+@router.get("", response_model=dict[str, Any], dependencies=[Depends(get_current_user)])
 async def get_credentials(
     storage: Annotated[SQLiteStorage, Depends(get_storage)], skip: int = 0, limit: int = 20
 ):
     """Get the paginated credential list"""
 
-    total = await storage.get_total_credentials_count()
-    credentials = await storage.get_credentials_paginated(skip, limit)
+    credentials, total = await storage.get_credentials_page(skip, limit)
 
     result = [_serialize_credential(credential) for credential in credentials]
 
     return {"items": result, "total": total, "skip": skip, "limit": limit}
 
 
-@router.get("/{credential_id}", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{credential_id}", response_model=dict[str, Any], dependencies=[Depends(get_current_user)]
+)
 async def get_credential(
     credential_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
@@ -87,7 +96,7 @@ async def create_credential(
         if existing:
             raise HTTPException(status_code=400, detail="Credential name already exists")
 
-        credential = Credential(**credential_data.model_dump())
+        credential = Credential.model_validate(credential_data.model_dump())
         credential_id = await storage.create_credential(credential)
 
         return {"message": f"Credential {credential.name} created", "id": credential_id}
@@ -97,7 +106,11 @@ async def create_credential(
         raise HTTPException(status_code=400, detail=f"Create failed: {str(e)}")
 
 
-@router.get("/{credential_id}/references", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{credential_id}/references",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user)],
+)
 async def get_credential_references(
     credential_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
@@ -127,26 +140,21 @@ async def update_credential(
         if not existing:
             raise HTTPException(status_code=404, detail="Credential not found")
 
-        payload = credential_data.model_dump(exclude_unset=True)
-
-        # Update other fields while keeping the name unchanged
-        # Keep the existing token if the frontend sends an empty or missing token
-        new_token = payload.get("token")
-        if not new_token:
-            new_token = existing.token
-
-        new_secrets = payload.get("secrets")
-        if new_secrets is None:
-            new_secrets = existing.secrets
-
-        credential = Credential(
-            name=existing.name,
-            type=payload.get("type", existing.type),
-            token=new_token,
-            secrets=new_secrets,
-            description=payload.get("description", existing.description),
-            created_at=existing.created_at,
-            updated_at=datetime.now(),
+        updates = credential_data.model_dump(exclude_unset=True)
+        # The name stays fixed; keep the existing token if the frontend sends an empty
+        # or missing token, and the existing secrets if none are sent
+        if not updates.get("token"):
+            updates.pop("token", None)
+        if updates.get("secrets") is None:
+            updates.pop("secrets", None)
+
+        # Validate rather than model_copy so token/secrets normalization still runs
+        credential = Credential.model_validate(
+            {
+                **existing.model_dump(exclude={"id"}),
+                **updates,
+                "updated_at": datetime.now(),
+            }
         )
 
         await storage.update_credential(credential_id, credential)
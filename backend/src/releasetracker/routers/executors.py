@@ -464,7 +464,7 @@ async def _validate_executor_payload(
     return executor
 
 
-@router.get("", dependencies=[Depends(get_current_user)])
+@router.get("", response_model=dict[str, Any], dependencies=[Depends(get_current_user)])
 async def get_executors(
     storage: Annotated[SQLiteStorage, Depends(get_storage)], skip: int = 0, limit: int = 20
 ):
@@ -521,7 +521,9 @@ async def discover_runtime_targets(
     }
 
 
-@router.get("/{executor_id}", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{executor_id}", response_model=dict[str, Any], dependencies=[Depends(get_current_user)]
+)
 async def get_executor_status_detail(
     executor_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
@@ -556,7 +558,11 @@ async def get_executor_status_detail(
     }
 
 
-@router.get("/{executor_id}/config", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{executor_id}/config",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user)],
+)
 async def get_executor_config_detail(
     executor_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
@@ -567,7 +573,11 @@ async def get_executor_config_detail(
     return {**_serialize_executor_config(executor), "current_image": current_image}
 
 
-@router.get("/{executor_id}/history", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{executor_id}/history",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user)],
+)
 async def get_executor_history(
     executor_id: int,
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
@@ -873,10 +883,7 @@ async def unlock_executor_snapshot(
     return {"message": "Snapshot unlocked", "locked": False}
 
 
-@router.post(
-    "/{executor_id}/rollback",
-    dependencies=[Depends(get_current_user)],
-)
+@router.post("/{executor_id}/rollback")
 async def rollback_executor(
     executor_id: int,
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
@@ -1,48 +1,55 @@
 """Notifier routes"""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from typing import Annotated
-from datetime import datetime
-
-from ..models import Notifier, User
+import logging
 
-# ...
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+from typing import Annotated, Any
+from datetime import datetime
 
+from ..models import Notifier
 from ..storage.sqlite import SQLiteStorage
-from ..dependencies import get_current_user
+from ..notifiers import WebhookNotifier
+from ..dependencies import get_current_user, get_storage
 
 router = APIRouter(prefix="/api/notifiers", tags=["notifiers"])
+logger = logging.getLogger(__name__)
+
+
+class CreateNotifierRequest(BaseModel):
+    # name and url default to empty so a missing value keeps the explicit 400 below
+    name: str = ""
+    url: str = ""
+    type: str = "webhook"
+    events: list[str] = Field(default_factory=lambda: ["new_release"])
+    enabled: bool = True
+    language: str = "en"
+    description: str | None = None
 
 
-def get_storage(request):
-    storage = getattr(request.app.state, "storage", None)
-    if not storage:
-        raise HTTPException(status_code=503, detail="Storage service is not initialized")
-    return storage
+class UpdateNotifierRequest(BaseModel):
+    name: str | None = None
+    url: str | None = None
+    type: str | None = None
+    events: list[str] | None = None
+    enabled: bool | None = None
+    language: str | None = None
+    description: str | None = None
 
 
-@router.get("", dependencies=[Depends(get_current_user)])
+@router.get("", response_model=dict[str, Any], dependencies=[Depends(get_current_user)])
 async def get_notifiers(
-    request: Request,
-    current_user: Annotated[User, Depends(get_current_user)],
-    skip: int = 0,
-    limit: int = 20,
+    storage: Annotated[SQLiteStorage, Depends(get_storage)], skip: int = 0, limit: int = 20
 ):
     """Get all notifiers with pagination"""
-    storage: SQLiteStorage = get_storage(request)
-
-    total = await storage.get_total_notifiers_count()
-    notifiers = await storage.get_notifiers_paginated(skip, limit)
+    notifiers, total = await storage.get_notifiers_page(skip, limit)
 
     return {"items": notifiers, "total": total, "skip": skip, "limit": limit}
 
 
 @router.get("/{notifier_id}", response_model=Notifier, dependencies=[Depends(get_current_user)])
-async def get_notifier(
-    notifier_id: int, request: Request, current_user: Annotated[User, Depends(get_current_user)]
-):
+async def get_notifier(notifier_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]):
     """Get a single notifier"""
-    storage: SQLiteStorage = get_storage(request)
     notifier = await storage.get_notifier(notifier_id)
     if not notifier:
         raise HTTPException(status_code=404, detail="Notifier not found")
@@ -56,19 +63,18 @@ async def get_notifier(
     dependencies=[Depends(get_current_user)],
 )
 async def create_notifier(
-    notifier_data: dict, request: Request, current_user: Annotated[User, Depends(get_current_user)]
+    notifier_data: CreateNotifierRequest, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
     """Create a notifier"""
-    storage: SQLiteStorage = get_storage(request)
 
     # Basic validation
-    if "name" not in notifier_data or not notifier_data["name"]:
+    if not notifier_data.name:
         raise HTTPException(status_code=400, detail="Name is required")
-    if "url" not in notifier_data or not notifier_data["url"]:
+    if not notifier_data.url:
         raise HTTPException(status_code=400, detail="URL is required")
 
     try:
-        return await storage.create_notifier(notifier_data)
+        return await storage.create_notifier(notifier_data.model_dump())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -76,14 +82,15 @@ async def create_notifier(
 @router.put("/{notifier_id}", response_model=Notifier, dependencies=[Depends(get_current_user)])
 async def update_notifier(
     notifier_id: int,
-    notifier_data: dict,
-    request: Request,
-    current_user: Annotated[User, Depends(get_current_user)],
+    notifier_data: UpdateNotifierRequest,
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
 ):
     """Update a notifier"""
-    storage: SQLiteStorage = get_storage(request)
     try:
-        return await storage.update_notifier(notifier_id, notifier_data)
+        # Only fields present in the request body are written
+        return await storage.update_notifier(
+            notifier_id, notifier_data.model_dump(exclude_unset=True)
+        )
     except ValueError as e:
         if "not found" in str(e):
             raise HTTPException(status_code=404, detail=str(e))
@@ -92,10 +99,9 @@ async def update_notifier(
 
 @router.delete("/{notifier_id}", dependencies=[Depends(get_current_user)])
 async def delete_notifier(
-    notifier_id: int, request: Request, current_user: Annotated[User, Depends(get_current_user)]
+    notifier_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
     """Delete a notifier"""
-    storage: SQLiteStorage = get_storage(request)
     try:
         await storage.delete_notifier(notifier_id)
         return {"message": "Notifier deleted"}
@@ -104,20 +110,12 @@ async def delete_notifier(
 
 
 @router.post("/{notifier_id}/test", dependencies=[Depends(get_current_user)])
-async def test_notifier(
-    notifier_id: int, request: Request, current_user: Annotated[User, Depends(get_current_user)]
-):
+async def test_notifier(notifier_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]):
     """Test a notifier"""
-    storage: SQLiteStorage = get_storage(request)
     notifier = await storage.get_notifier(notifier_id)
     if not notifier:
         raise HTTPException(status_code=404, detail="Notifier not found")
 
-    import httpx
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     message = (
         "这是一条来自 ReleaseTracker 的测试通知"
         if notifier.language == "zh"
@@ -132,13 +130,13 @@ async def test_notifier(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(notifier.url, json=payload, timeout=10.0)
-            response.raise_for_status()
-            logger.info(f"Webhook test sent to {notifier.url}, status: {response.status_code}")
-            return {
-                "message": f"Test notification sent to {notifier.url}. Status: {response.status_code}"
-            }
+        client = WebhookNotifier.get_client()
+        response = await client.post(notifier.url, json=payload, timeout=10.0)
+        response.raise_for_status()
+        logger.info(f"Webhook test sent to {notifier.url}, status: {response.status_code}")
+        return {
+            "message": f"Test notification sent to {notifier.url}. Status: {response.status_code}"
+        }
     except Exception as e:
         logger.error(f"Webhook test failed for {notifier.url}: {e}")
         raise HTTPException(status_code=400, detail=f"Webhook test failed: {str(e)}")
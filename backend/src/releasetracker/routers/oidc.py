@@ -1,14 +1,13 @@
 """Public OIDC routes for login entry and callback handling"""
 
 import logging
-import secrets
 from typing import Annotated
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import RedirectResponse
 
-from ..services.oidc_service import OIDCService, generate_pkce_pair
+from ..services.oidc_service import OIDCService, generate_state_and_pkce_pair
 from ..services.auth import AuthService
 from ..storage.sqlite import SQLiteStorage
 from ..dependencies import get_storage, get_auth_service
@@ -18,7 +17,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["OIDC Auth"])
 
 
-def get_oidc_service(
+async def get_oidc_service(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> OIDCService:
@@ -32,22 +31,13 @@ async def _build_public_url(storage: SQLiteStorage, request: Request, path: str)
     return str(request.base_url).rstrip("/") + path
 
 
-@router.get("/api/auth/oidc/providers")
+@router.get("/api/auth/oidc/providers", response_model=list[dict[str, str | None]])
 async def list_oidc_providers(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
 ):
     """List enabled OIDC providers for login page buttons"""
-    providers = await storage.list_oauth_providers(enabled_only=True)
-    # Do not return sensitive configuration fields
-    return [
-        {
-            "slug": p.slug,
-            "name": p.name,
-            "icon_url": p.icon_url,
-            "description": p.description,
-        }
-        for p in providers
-    ]
+    # Only the public display columns are read; configuration and secrets never leave storage
+    return await storage.list_public_oauth_providers()
 
 
 @router.get("/api/auth/oidc/{provider_slug}/authorize")
@@ -64,10 +54,9 @@ async def oidc_authorize(
         raise HTTPException(status_code=404, detail="OIDC provider does not exist or is disabled")
 
     # Generate state for CSRF protection and a PKCE pair
-    state = secrets.token_urlsafe(32)
-    code_verifier, code_challenge = generate_pkce_pair()
+    state, code_verifier, code_challenge = generate_state_and_pkce_pair()
 
-    # Store state and PKCE verifier in the database with a 10-minute TTL
+    # Keep state and PKCE verifier in storage memory with a 10-minute TTL
     await storage.save_oauth_state(state, provider_slug, code_verifier)
 
     callback_path = request.app.url_path_for("oidc_callback", provider_slug=provider_slug)
@@ -92,10 +81,8 @@ async def oidc_callback(
     oidc_service: Annotated[OIDCService, Depends(get_oidc_service)],
 ):
     """Handle the OIDC callback after browser redirect"""
-    # 1. Clean up expired state records
-    await storage.cleanup_expired_oauth_states()
-
-    # 2. Validate and consume state atomically to prevent replay attacks
+    # 1. Validate and consume state atomically to prevent replay attacks; expired
+    # states never match and are removed by the periodic sweep
     oauth_state = await storage.get_and_delete_oauth_state(state)
     if not oauth_state:
         logger.warning(f"Invalid or expired OIDC state: {state[:8]}...")
@@ -105,17 +92,11 @@ async def oidc_callback(
         logger.warning(f"OIDC state provider mismatch: {oauth_state.provider_slug} != {provider_slug}")
         raise HTTPException(status_code=400, detail="Provider mismatch")
 
-    # Check whether state is expired
-    from datetime import datetime
-
-    if oauth_state.expires_at < datetime.now():
-        raise HTTPException(status_code=400, detail="OAuth state expired")
-
-    # 3. Build the callback URL consistently with the authorize endpoint
+    # 2. Build the callback URL consistently with the authorize endpoint
     callback_path = request.app.url_path_for("oidc_callback", provider_slug=provider_slug)
     redirect_uri = await _build_public_url(storage, request, callback_path)
 
-    # 4. Exchange the code for tokens, fetch user info, and create or link the user
+    # 3. Exchange the code for tokens, fetch user info, and create or link the user
     try:
         user, token_pair = await oidc_service.handle_callback(
             provider_slug=provider_slug,
@@ -132,7 +113,7 @@ async def oidc_callback(
         logger.error(f"OIDC callback unexpected error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="OIDC authentication failed")
 
-    # 5. Redirect to the frontend with the token in the URL hash so it does not appear in server logs
+    # 4. Redirect to the frontend with the token in the URL hash so it does not appear in server logs
     frontend_url = await _build_public_url(storage, request, "")
     callback_payload = urlencode(
         {
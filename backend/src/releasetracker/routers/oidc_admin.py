@@ -1,7 +1,7 @@
 """OIDC provider admin routes; admin only"""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Depends, status
@@ -54,27 +54,34 @@ class UpdateOIDCProviderRequest(BaseModel):
     description: str | None = None
 
 
-def _provider_to_response(p: OIDCProvider) -> dict:
-    """Convert OIDCProvider to a response dictionary without client_secret"""
-    return {
-        "id": p.id,
-        "name": p.name,
-        "slug": p.slug,
-        "issuer_url": p.issuer_url,
-        "discovery_enabled": p.discovery_enabled,
-        "client_id": p.client_id,
-        # Never return client_secret to the frontend
-        "authorization_url": p.authorization_url,
-        "token_url": p.token_url,
-        "userinfo_url": p.userinfo_url,
-        "jwks_uri": p.jwks_uri,
-        "scopes": p.scopes,
-        "enabled": p.enabled,
-        "icon_url": p.icon_url,
-        "description": p.description,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-        "updated_at": p.updated_at.isoformat() if p.updated_at else None,
+# Fields returned to the frontend. An allowlist, so client_secret and any secret added
+# to OIDCProvider later stay server-side unless listed here
+_PROVIDER_RESPONSE_FIELDS = frozenset(
+    {
+        "id",
+        "name",
+        "slug",
+        "issuer_url",
+        "discovery_enabled",
+        "client_id",
+        "authorization_url",
+        "token_url",
+        "userinfo_url",
+        "jwks_uri",
+        "scopes",
+        "enabled",
+        "icon_url",
+        "description",
+        "created_at",
+        "updated_at",
     }
+)
+
+
+def _provider_to_response(p: OIDCProvider) -> dict[str, Any]:
+    """Convert OIDCProvider to a response dictionary without client_secret"""
+    # pydantic-core walks the fields and renders datetimes as ISO strings in one call
+    return p.model_dump(mode="json", include=_PROVIDER_RESPONSE_FIELDS)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -117,7 +124,7 @@ async def create_oidc_provider(
     return {"message": "OIDC provider created", "id": saved.id}
 
 
-@router.get("")
+@router.get("", response_model=list[dict[str, Any]])
 async def list_oidc_providers_admin(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
     _: Annotated[User, Depends(get_current_admin_user)],
@@ -127,7 +134,7 @@ async def list_oidc_providers_admin(
     return [_provider_to_response(p) for p in providers]
 
 
-@router.get("/{provider_id}")
+@router.get("/{provider_id}", response_model=dict[str, Any])
 async def get_oidc_provider(
     provider_id: int,
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
@@ -152,33 +159,14 @@ async def update_oidc_provider(
     if not existing:
         raise HTTPException(status_code=404, detail="OIDC provider not found")
 
-    # Merge updated fields
-    updated = OIDCProvider(
-        id=provider_id,
-        name=req.name if req.name is not None else existing.name,
-        slug=existing.slug,  # Slug changes are not allowed
-        issuer_url=req.issuer_url if req.issuer_url is not None else existing.issuer_url,
-        discovery_enabled=(
-            req.discovery_enabled
-            if req.discovery_enabled is not None
-            else existing.discovery_enabled
-        ),
-        client_id=req.client_id if req.client_id is not None else existing.client_id,
-        client_secret=req.client_secret,  # None means do not update
-        authorization_url=(
-            req.authorization_url
-            if req.authorization_url is not None
-            else existing.authorization_url
-        ),
-        token_url=req.token_url if req.token_url is not None else existing.token_url,
-        userinfo_url=req.userinfo_url if req.userinfo_url is not None else existing.userinfo_url,
-        jwks_uri=req.jwks_uri if req.jwks_uri is not None else existing.jwks_uri,
-        scopes=req.scopes if req.scopes is not None else existing.scopes,
-        enabled=req.enabled if req.enabled is not None else existing.enabled,
-        icon_url=req.icon_url if req.icon_url is not None else existing.icon_url,
-        description=req.description if req.description is not None else existing.description,
-        created_at=existing.created_at,
-        updated_at=datetime.now(),
+    # Merge updated fields; the request has no slug, since slug changes are not allowed,
+    # and client_secret is always passed through because None means do not update
+    updated = existing.model_copy(
+        update={
+            **req.model_dump(exclude_none=True),
+            "client_secret": req.client_secret,
+            "updated_at": datetime.now(),
+        }
     )
     await storage.update_oauth_provider(provider_id, updated)
     return {"message": "OIDC provider updated"}
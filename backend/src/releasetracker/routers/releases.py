@@ -4,9 +4,9 @@ from typing import Annotated, Any
 import aiosqlite
 from fastapi import APIRouter, Depends, HTTPException
 
-from ..dependencies import get_current_user, get_storage
+from ..dependencies import data_version_etag, get_current_user, get_storage
 from ..models import Release, ReleaseStats
-from ..storage.sqlite import SQLiteStorage
+from ..storage.sqlite import STATS_CACHE_TTL_SECONDS, SQLiteStorage
 
 router = APIRouter(prefix="/api", tags=["releases"])
 
@@ -60,7 +60,10 @@ async def _get_release_history_items(
     search: str | None = None,
     prerelease: bool | None = None,
     channel: str | None = None,
-) -> list[dict[str, Any]]:
+    skip: int = 0,
+    limit: int = 20,
+) -> tuple[list[dict[str, Any]], int]:
+    """Return one page of release history items and the total matching count"""
     if channel is not None and tracker_name is None:
         raise HTTPException(
             status_code=400,
@@ -105,20 +108,30 @@ async def _get_release_history_items(
 
     normalized_search = search.strip().lower() if search and search.strip() else None
     if normalized_search is not None:
-        like = f"%{normalized_search}%"
+        # The trigram index holds the tracker name, identity, version, name, tag and
+        # digest of each history row and answers case-insensitive substring LIKEs
         clauses.append(
-            "("  # noqa: ISC003
-            "LOWER(at.name) LIKE ? "
-            "OR LOWER(COALESCE(trh.identity_key, '')) LIKE ? "
-            "OR LOWER(COALESCE(srh.version, trh.version, '')) LIKE ? "
-            "OR LOWER(COALESCE(srh.name, '')) LIKE ? "
-            "OR LOWER(COALESCE(srh.tag_name, '')) LIKE ? "
-            "OR LOWER(COALESCE(trh.digest, '')) LIKE ?"
+            "trh.id IN ("
+            "SELECT rowid FROM tracker_release_history_search WHERE search_text LIKE ?"
             ")"
         )
-        params.extend([like, like, like, like, like, like])
+        params.append(f"%{normalized_search}%")
 
     where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    from_sql = f"""
+            FROM tracker_release_history trh
+            JOIN aggregate_trackers at ON at.id = trh.aggregate_tracker_id
+            JOIN source_release_history srh ON srh.id = trh.primary_source_release_history_id
+            LEFT JOIN aggregate_tracker_sources ats ON ats.id = srh.tracker_source_id
+            {where_sql}
+    """
+    # Without a channel filter SQLite pages directly off the created_at indexes;
+    # channel matching happens in Python and needs every candidate
+    page_sql = ""
+    page_params: tuple[Any, ...] = ()
+    if tracker_channel is None:
+        page_sql = "LIMIT ? OFFSET ?"
+        page_params = (limit, skip)
     rows = await (
         await db.execute(
             f"""
@@ -142,14 +155,11 @@ async def _get_release_history_items(
                    srh.body,
                    srh.commit_sha,
                    srh.raw_payload
-            FROM tracker_release_history trh
-            JOIN aggregate_trackers at ON at.id = trh.aggregate_tracker_id
-            JOIN source_release_history srh ON srh.id = trh.primary_source_release_history_id
-            LEFT JOIN aggregate_tracker_sources ats ON ats.id = srh.tracker_source_id
-            {where_sql}
+            {from_sql}
             ORDER BY trh.created_at DESC, trh.id DESC
+            {page_sql}
             """,
-            tuple(params),
+            (*params, *page_params),
         )
     ).fetchall()
 
@@ -209,6 +219,22 @@ async def _get_release_history_items(
                 continue
         items.append(item)
 
+    if tracker_channel is not None:
+        return items[skip : skip + limit], len(items)
+    # A short page that starts inside the result set is the last one, so it already
+    # tells the total; otherwise count separately, since a window count over the page
+    # query would make SQLite sort every matching row instead of walking the index
+    if len(rows) < limit and (rows or not skip):
+        return items, skip + len(rows)
+    total_row = await (await db.execute(f"SELECT COUNT(*) {from_sql}", tuple(params))).fetchone()
+    return items, total_row[0] if total_row else 0
+
+
+async def _annotate_release_history_channels(
+    storage: SQLiteStorage,
+    items: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Resolve channel name/type for the history items that are actually returned."""
     tracker_channels_by_name: dict[str, tuple[Any, list[dict[str, Any]]]] = {}
 
     for item in items:
@@ -233,28 +259,33 @@ async def _get_release_history_items(
             tracker_channels_by_name[history_tracker_name] = (aggregate_tracker, enabled_channels)
 
         if aggregate_tracker is not None and enabled_channels:
-            release_for_channel = Release(
-                tracker_name=item["tracker_name"],
-                tracker_type=item.get("_primary_source_type_raw") or "github",
-                version=item["version"] or "",
-                tag_name=item["tag_name"] or item["version"] or item["identity_key"],
-                name=item["name"] or item["tag_name"] or item["version"] or item["identity_key"],
-                url=item["url"] or "",
-                published_at=datetime.fromisoformat(item["published_at"]),
-                prerelease=bool(item["prerelease"]),
-                body=item["body"],
-                changelog_url=item["changelog_url"],
-                channel_name=item.get("channel_name"),
-                commit_sha=item.get("commit_sha"),
-            )
             matched_channel = _find_channel_by_stored_name(
                 item.get("channel_name"),
                 enabled_channels,
-            ) or _infer_release_channel(
-                storage,
-                release_for_channel,
-                enabled_channels,
             )
+            if matched_channel is None:
+                # Only inference needs a Release; the fields come straight from stored rows
+                release_for_channel = Release.model_construct(
+                    tracker_name=item["tracker_name"],
+                    tracker_type=item.get("_primary_source_type_raw") or "github",
+                    version=item["version"] or "",
+                    tag_name=item["tag_name"] or item["version"] or item["identity_key"],
+                    name=(
+                        item["name"] or item["tag_name"] or item["version"] or item["identity_key"]
+                    ),
+                    url=item["url"] or "",
+                    published_at=datetime.fromisoformat(item["published_at"]),
+                    prerelease=bool(item["prerelease"]),
+                    body=item["body"],
+                    changelog_url=item["changelog_url"],
+                    channel_name=item.get("channel_name"),
+                    commit_sha=item.get("commit_sha"),
+                )
+                matched_channel = _infer_release_channel(
+                    storage,
+                    release_for_channel,
+                    enabled_channels,
+                )
             if matched_channel is not None:
                 item["channel_name"] = item.get("channel_name") or matched_channel.get("name")
                 item["channel_type"] = matched_channel.get("type")
@@ -379,12 +410,19 @@ async def _load_aggregate_tracker_or_404(storage: SQLiteStorage, tracker_name: s
     return aggregate_tracker
 
 
-@router.get("/stats", response_model=ReleaseStats, dependencies=[Depends(get_current_user)])
+@router.get(
+    "/stats",
+    response_model=ReleaseStats,
+    dependencies=[
+        Depends(get_current_user),
+        Depends(data_version_etag(refresh_seconds=STATS_CACHE_TTL_SECONDS)),
+    ],
+)
 async def get_stats(storage: Annotated[SQLiteStorage, Depends(get_storage)]):
     return await storage.get_stats()
 
 
-@router.get("/releases", dependencies=[Depends(get_current_user)])
+@router.get("/releases", response_model=dict[str, Any], dependencies=[Depends(get_current_user)])
 async def get_releases(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
     tracker: str | None = None,
@@ -401,23 +439,31 @@ async def get_releases(
         limit = 100
     if limit < 1:
         limit = 1
+    if skip < 0:
+        skip = 0
 
-    items = await _get_release_history_items(
+    items, total = await _get_release_history_items(
         storage,
         tracker_name=tracker,
         search=search,
         prerelease=prerelease,
         channel=channel,
+        skip=skip,
+        limit=limit,
     )
     return {
-        "total": len(items),
-        "items": items[skip : skip + limit],
+        "total": total,
+        "items": await _annotate_release_history_channels(storage, items),
         "skip": skip,
         "limit": limit,
     }
 
 
-@router.get("/releases/latest", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/releases/latest",
+    response_model=list[dict[str, Any]],
+    dependencies=[Depends(get_current_user), Depends(data_version_etag())],
+)
 async def get_latest_releases(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
     tracker: str | None = None,
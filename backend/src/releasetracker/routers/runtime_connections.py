@@ -133,7 +133,7 @@ async def _build_portainer_endpoint_discovery_config(
     )
 
 
-@router.get("", dependencies=[Depends(get_current_user)])
+@router.get("", response_model=dict[str, Any], dependencies=[Depends(get_current_user)])
 async def get_runtime_connections(
     storage: Annotated[SQLiteStorage, Depends(get_storage)], skip: int = 0, limit: int = 20
 ):
@@ -149,7 +149,11 @@ async def get_runtime_connections(
     }
 
 
-@router.get("/{runtime_connection_id}", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{runtime_connection_id}",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user)],
+)
 async def get_runtime_connection(
     runtime_connection_id: int, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
@@ -10,7 +10,6 @@ from pydantic import BaseModel
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from ..models import User
 from ..storage.sqlite import (
     MAX_EXECUTOR_SNAPSHOT_RETENTION_COUNT,
     MAX_RELEASE_HISTORY_RETENTION_COUNT,
@@ -24,7 +23,13 @@ from ..storage.sqlite import (
     ALLOWED_SYSTEM_LOG_LEVELS,
     SQLiteStorage,
 )
-from ..dependencies import get_current_admin_user, get_current_user, get_system_key_manager
+from ..dependencies import (
+    data_version_etag,
+    get_current_admin_user,
+    get_current_user,
+    get_storage,
+    get_system_key_manager,
+)
 from ..services.system_keys import SystemKeyManager, rotate_encryption_key, rotate_jwt_secret
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
@@ -95,13 +100,6 @@ class EncryptionKeyRotationResponse(BaseModel):
     undecryptable_count: int
 
 
-def get_storage(request: Request):
-    storage = getattr(request.app.state, "storage", None)
-    if not storage:
-        raise HTTPException(status_code=503, detail="Storage service is not initialized")
-    return storage
-
-
 async def _build_security_keys_status(
     storage: SQLiteStorage,
     key_manager: SystemKeyManager,
@@ -209,11 +207,9 @@ def _normalize_setting_value(key: str, value: str) -> str:
     dependencies=[Depends(get_current_admin_user)],
 )
 async def get_security_keys_status(
-    request: Request,
-    current_user: Annotated[User, Depends(get_current_admin_user)],
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
     key_manager: Annotated[SystemKeyManager, Depends(get_system_key_manager)],
 ):
-    storage: SQLiteStorage = get_storage(request)
     return await _build_security_keys_status(storage, key_manager)
 
 
@@ -224,11 +220,9 @@ async def get_security_keys_status(
 )
 async def rotate_jwt_secret_endpoint(
     req: SecurityKeyRotationRequest,
-    request: Request,
-    current_user: Annotated[User, Depends(get_current_admin_user)],
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
     key_manager: Annotated[SystemKeyManager, Depends(get_system_key_manager)],
 ):
-    storage: SQLiteStorage = get_storage(request)
     try:
         return await rotate_jwt_secret(
             storage,
@@ -247,11 +241,9 @@ async def rotate_jwt_secret_endpoint(
 )
 async def rotate_encryption_key_endpoint(
     req: SecurityKeyRotationRequest,
-    request: Request,
-    current_user: Annotated[User, Depends(get_current_admin_user)],
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
     key_manager: Annotated[SystemKeyManager, Depends(get_system_key_manager)],
 ):
-    storage: SQLiteStorage = get_storage(request)
     try:
         return await rotate_encryption_key(
             storage,
@@ -268,11 +260,7 @@ async def rotate_encryption_key_endpoint(
     response_model=ReleaseHistoryCleanupResponse,
     dependencies=[Depends(get_current_user)],
 )
-async def cleanup_release_history_endpoint(
-    request: Request,
-    current_user: Annotated[User, Depends(get_current_user)],
-):
-    storage: SQLiteStorage = get_storage(request)
+async def cleanup_release_history_endpoint(storage: Annotated[SQLiteStorage, Depends(get_storage)]):
     result = await storage.cleanup_release_history()
     return ReleaseHistoryCleanupResponse(
         action="release_history_cleanup",
@@ -287,9 +275,8 @@ async def cleanup_release_history_endpoint(
 )
 async def cleanup_snapshot_history_endpoint(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_user)],
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
 ):
-    storage: SQLiteStorage = get_storage(request)
     executor_scheduler = getattr(request.app.state, "executor_scheduler", None)
     snapshot_service = getattr(executor_scheduler, "snapshot_service", None)
     if snapshot_service is None:
@@ -321,26 +308,26 @@ async def cleanup_snapshot_history_endpoint(
     )
 
 
-@router.get("", response_model=List[SettingItem], dependencies=[Depends(get_current_user)])
-async def get_settings(request: Request, current_user: Annotated[User, Depends(get_current_user)]):
+@router.get(
+    "",
+    response_model=List[SettingItem],
+    dependencies=[Depends(get_current_user), Depends(data_version_etag())],
+)
+async def get_settings(storage: Annotated[SQLiteStorage, Depends(get_storage)]):
     """Get all system settings"""
-    storage: SQLiteStorage = get_storage(request)
     settings_dict = await storage.get_all_settings()
-    return [
-        SettingItem(
-            key=k, value=v, updated_at=datetime.now().isoformat()
-        )  # TODO: Fetch real updated_at from DB
-        for k, v in settings_dict.items()
-    ]
+    # TODO: Fetch real updated_at from DB
+    updated_at = datetime.now().isoformat()
+    # Plain dicts; response_model validates each item once on the way out
+    return [{"key": k, "value": v, "updated_at": updated_at} for k, v in settings_dict.items()]
 
 
 @router.post("", response_model=SettingItem, dependencies=[Depends(get_current_user)])
 async def update_setting(
-    setting: SettingItem, request: Request, current_user: Annotated[User, Depends(get_current_user)]
+    setting: SettingItem,
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
 ):
     """Update system settings"""
-    storage: SQLiteStorage = get_storage(request)
-
     setting.value = _normalize_setting_value(setting.key, setting.value)
     await storage.set_setting(setting.key, setting.value)
     if setting.key == SYSTEM_LOG_LEVEL_SETTING_KEY:
@@ -350,9 +337,9 @@ async def update_setting(
 
 @router.delete("/{key}", dependencies=[Depends(get_current_user)])
 async def delete_setting(
-    key: str, request: Request, current_user: Annotated[User, Depends(get_current_user)]
+    key: str,
+    storage: Annotated[SQLiteStorage, Depends(get_storage)],
 ):
     """Delete a system setting"""
-    storage: SQLiteStorage = get_storage(request)
     await storage.delete_setting(key)
     return {"message": "Setting deleted"}
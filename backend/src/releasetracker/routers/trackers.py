@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Annotated, Any, Literal
@@ -7,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..config import Channel, TrackerConfig
-from ..dependencies import get_current_user, get_scheduler, get_storage
+from ..dependencies import data_version_etag, get_current_user, get_scheduler, get_storage
 from ..models import AggregateTracker, Release, TrackerReleaseNotesConfig, TrackerSource
 from ..scheduler import ReleaseScheduler
 from ..storage.sqlite import SQLiteStorage
@@ -58,8 +59,9 @@ class AggregateTrackerPayload(BaseModel):
             sources=self.sources,
         )
 
-    def to_runtime_config(self) -> TrackerConfig:
-        aggregate_tracker = self.to_aggregate_tracker()
+    def to_runtime_config(self, aggregate_tracker: AggregateTracker | None = None) -> TrackerConfig:
+        if aggregate_tracker is None:
+            aggregate_tracker = self.to_aggregate_tracker()
         selected_source = next(
             (
                 source
@@ -569,13 +571,20 @@ async def _build_tracker_response(
     tracker: AggregateTracker,
     *,
     current_status_map: dict[str, dict[str, Any]] | None = None,
+    runtime_config_map: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    runtime_config = await storage.get_tracker_config(tracker.name)
+    # Single-tracker callers reuse the page loaders, which build the runtime config
+    # from the already loaded aggregate and derive status from one projection query
+    if runtime_config_map is None or tracker.name not in runtime_config_map:
+        runtime_config_map = await storage.get_tracker_configs_for_aggregates([tracker])
+    runtime_config = runtime_config_map[tracker.name]
     tracker_status = (
         current_status_map.get(tracker.name) if current_status_map is not None else None
     )
     if tracker_status is None:
-        tracker_status = await storage.get_tracker_current_status_derivation(tracker.name)
+        tracker_status = (
+            await storage.get_tracker_current_status_derivations([tracker], runtime_config_map)
+        )[tracker.name]
 
     enabled_sources = [source for source in tracker.sources if source.enabled]
     source_channel_values = await _build_container_source_release_channel_current_values(
@@ -626,7 +635,7 @@ async def _build_tracker_response(
     }
 
 
-@router.get("", dependencies=[Depends(get_current_user)])
+@router.get("", response_model=dict[str, Any], dependencies=[Depends(get_current_user)])
 async def get_trackers(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
     skip: int = 0,
@@ -640,24 +649,29 @@ async def get_trackers(
     total = len(filtered_trackers)
     paginated_trackers = filtered_trackers[skip : skip + limit]
 
-    current_status_map: dict[str, dict[str, Any]] = {}
-    for tracker in paginated_trackers:
-        current_status_map[tracker.name] = await storage.get_tracker_current_status_derivation(
-            tracker.name
-        )
+    runtime_config_map = await storage.get_tracker_configs_for_aggregates(paginated_trackers)
+    current_status_map = await storage.get_tracker_current_status_derivations(
+        paginated_trackers, runtime_config_map
+    )
 
-    items = [
-        await _build_tracker_response(
-            storage,
-            tracker,
-            current_status_map=current_status_map,
+    # Each response only reads storage, so the page's trackers are built concurrently
+    items = await asyncio.gather(
+        *(
+            _build_tracker_response(
+                storage,
+                tracker,
+                current_status_map=current_status_map,
+                runtime_config_map=runtime_config_map,
+            )
+            for tracker in paginated_trackers
         )
-        for tracker in paginated_trackers
-    ]
+    )
     return {"items": items, "total": total, "skip": skip, "limit": limit}
 
 
-@router.get("/{tracker_name}", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{tracker_name}", response_model=dict[str, Any], dependencies=[Depends(get_current_user)]
+)
 async def get_tracker(tracker_name: str, storage: Annotated[SQLiteStorage, Depends(get_storage)]):
     tracker = await storage.get_aggregate_tracker(tracker_name)
     if not tracker:
@@ -665,7 +679,11 @@ async def get_tracker(tracker_name: str, storage: Annotated[SQLiteStorage, Depen
     return await _build_tracker_response(storage, tracker)
 
 
-@router.get("/{tracker_name}/config", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{tracker_name}/config",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user), Depends(data_version_etag())],
+)
 async def get_tracker_config_detail(
     tracker_name: str, storage: Annotated[SQLiteStorage, Depends(get_storage)]
 ):
@@ -675,7 +693,11 @@ async def get_tracker_config_detail(
     return await _build_tracker_response(storage, tracker)
 
 
-@router.get("/{tracker_name}/releases/history", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{tracker_name}/releases/history",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user)],
+)
 async def get_tracker_release_history(
     tracker_name: str,
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
@@ -705,7 +727,11 @@ async def get_tracker_release_history(
     }
 
 
-@router.get("/{tracker_name}/current", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{tracker_name}/current",
+    response_model=dict[str, Any],
+    dependencies=[Depends(get_current_user)],
+)
 async def get_tracker_current_view(
     tracker_name: str,
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
@@ -743,7 +769,7 @@ async def create_tracker(
 ):
     try:
         aggregate_tracker = tracker_data.to_aggregate_tracker()
-        runtime_config = tracker_data.to_runtime_config()
+        runtime_config = tracker_data.to_runtime_config(aggregate_tracker)
         existing = await storage.get_aggregate_tracker(aggregate_tracker.name)
         if existing:
             raise HTTPException(status_code=400, detail="Tracker name already exists")
@@ -761,9 +787,9 @@ async def create_tracker(
         if created_tracker is None:
             raise HTTPException(status_code=500, detail="Failed to read tracker after creation")
         return await _build_tracker_response(storage, created_tracker)
-    except HTTPException:
-        raise
-    except Exception as e:
+    except (ValueError, aiosqlite.IntegrityError) as e:
+        # Validation errors and constraint violations (such as a duplicate name) are the
+        # client's to fix; locked databases, I/O errors and anything else surface as a 500
         raise HTTPException(status_code=400, detail=f"Create failed: {str(e)}")
 
 
@@ -776,18 +802,20 @@ async def update_tracker(
 ):
     try:
         aggregate_tracker = tracker_data.to_aggregate_tracker()
-        runtime_config = tracker_data.to_runtime_config()
-        existing = await storage.get_aggregate_tracker(tracker_name)
-        if not existing:
-            raise HTTPException(status_code=404, detail="Tracker not found")
-
+        runtime_config = tracker_data.to_runtime_config(aggregate_tracker)
         normalized_name = aggregate_tracker.name
         if normalized_name != tracker_name:
+            if not await storage.get_aggregate_tracker(tracker_name):
+                raise HTTPException(status_code=404, detail="Tracker not found")
             raise HTTPException(status_code=400, detail="Renaming a tracker is not supported")
 
-        await storage.update_aggregate_tracker(
-            aggregate_tracker.model_copy(update={"id": existing.id})
-        )
+        # The update reports a missing tracker itself, so there is no existence preflight
+        try:
+            updated_tracker = await storage.update_aggregate_tracker(aggregate_tracker)
+        except ValueError as e:
+            if "not found" in str(e):
+                raise HTTPException(status_code=404, detail="Tracker not found")
+            raise
         await storage.save_tracker_runtime_config(runtime_config)
         persisted_runtime = await storage.get_tracker_config(tracker_name)
         if persisted_runtime is None:
@@ -797,13 +825,8 @@ async def update_tracker(
         await scheduler.refresh_tracker(tracker_name)
         await scheduler.rebuild_tracker_views_from_storage(tracker_name)
 
-        updated_tracker = await storage.get_aggregate_tracker(tracker_name)
-        if updated_tracker is None:
-            raise HTTPException(status_code=500, detail="Failed to read tracker after update")
         return await _build_tracker_response(storage, updated_tracker)
-    except HTTPException:
-        raise
-    except Exception as e:
+    except (ValueError, aiosqlite.IntegrityError) as e:
         raise HTTPException(status_code=400, detail=f"Update failed: {str(e)}")
 
 
@@ -813,13 +836,10 @@ async def delete_tracker(
     storage: Annotated[SQLiteStorage, Depends(get_storage)],
     scheduler: Annotated[ReleaseScheduler, Depends(get_scheduler)],
 ):
-    existing = await storage.get_aggregate_tracker(tracker_name)
-    if not existing:
+    # The delete reports whether the tracker existed, so no separate lookup is needed
+    if not await storage.delete_tracker(tracker_name):
         raise HTTPException(status_code=404, detail="Tracker not found")
 
-    await storage.delete_aggregate_tracker(tracker_name)
-    await storage.delete_tracker_config(tracker_name)
-    await storage.delete_tracker_status(tracker_name)
     await scheduler.remove_tracker(tracker_name)
 
     return {"name": tracker_name, "deleted": True}
@@ -1,12 +1,15 @@
 """Scheduler module"""
 
 import asyncio
+import functools
 import inspect
 import logging
 from datetime import datetime
 from typing import Any, Literal, cast
 
-from .config import TrackerConfig
+import httpx
+
+from .config import Channel, TrackerConfig, flatten_release_channels
 from .models import (
     AggregateTracker,
     Credential,
@@ -16,11 +19,11 @@ from .models import (
     TrackerSourceType,
     TrackerStatus,
 )
-from .notifiers import WebhookNotifier
+from .notifiers import WebhookNotifier, notify_all
 from .notifiers.base import BaseNotifier, NotificationEvent
 from .scheduler_host import SchedulerHost
 from .services.changelog import fetch_and_extract_changelog
-from .storage.sqlite import SQLiteStorage
+from .storage.sqlite import SQLiteStorage, TrackerReleaseHistoryUpsert
 from .trackers import GitHubTracker, GitLabTracker, GiteaTracker, HelmTracker, DockerTracker
 from .trackers.base import BaseTracker
 
@@ -34,6 +37,15 @@ MAX_CONCURRENT_FETCHES_PER_PROVIDER = {
     "container": 2,
     "helm": 2,
 }
+# Notifications are queued for background workers so a slow webhook never holds up a check;
+# enough workers to fan one release out to several webhooks in parallel
+NOTIFICATION_QUEUE_SIZE = 1000
+NOTIFICATION_WORKER_COUNT = 8
+# How long shutdown waits for queued notifications to be delivered
+NOTIFICATION_DRAIN_TIMEOUT_SECONDS = 30
+# Python 3.12+; used as a direct task constructor so only the scheduler's own fan-outs
+# start eagerly and the application loop keeps its default task factory
+EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
 MANUAL_CHECK_ALREADY_RUNNING_MESSAGE = "Check already in progress; skipping duplicate request"
 MANUAL_CHECK_COOLDOWN_MESSAGE = "Recently checked; skipping duplicate request"
 
@@ -88,28 +100,41 @@ class ReleaseScheduler:
         self.scheduler_host = scheduler_host or SchedulerHost()
         self._job_namespace = "tracker"
         self.trackers: dict[str, BaseTracker] = {}
+        # Runtime configs for scheduled checks, tagged with the storage tracker config
+        # generation they were read at; a check re-reads any entry older than storage
+        self.tracker_configs: dict[str, tuple[int, TrackerConfig]] = {}
         self.notifiers: list[BaseNotifier] = []
+        # Storage notifier generation the list above was built from; None forces a reload
+        self._notifiers_generation: int | None = None
+        # Serializes reloads so concurrent senders that see a stale list rebuild it once
+        self._notifiers_lock = asyncio.Lock()
         self._check_all_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRACKER_CHECKS)
         self._manual_checks_in_progress: set[str] = set()
         self._provider_fetch_semaphores = {
             provider: asyncio.Semaphore(limit)
             for provider, limit in MAX_CONCURRENT_FETCHES_PER_PROVIDER.items()
         }
+        self._notification_queue: asyncio.Queue[tuple[BaseNotifier, str, Any]] = asyncio.Queue(
+            maxsize=NOTIFICATION_QUEUE_SIZE
+        )
+        self._notification_workers: list[asyncio.Task[None]] = []
 
     async def initialize(self):
         """Initialize schedulers"""
         # Load tracker configuration from the database
+        generation = self.storage.tracker_configs_generation
         tracker_configs = await self.storage.get_all_tracker_configs()
 
         for tracker_config in tracker_configs:
-            await self._add_or_update_tracker_job(tracker_config)
+            await self._add_or_update_tracker_job(tracker_config, generation)
 
         # Load notifiers from the database
         await self._refresh_notifiers()
 
     async def _refresh_notifiers(self):
         """Refresh the notifier list"""
-        self.notifiers = []
+        generation = self.storage.notifiers_generation
+        notifiers: list[BaseNotifier] = []
         try:
             db_notifiers = await self.storage.get_notifiers()
             for n in db_notifiers:
@@ -120,27 +145,36 @@ class ReleaseScheduler:
                         events=n.events,
                         language=n.language,
                     )
-                    self.notifiers.append(notifier)
+                    notifiers.append(notifier)
         except Exception as e:
             logger.error(f"Failed to load notifiers: {e}")
+            self.notifiers = []
+            self._notifiers_generation = None
+            return
+        # Swap in the finished list so concurrent readers never see a partial one
+        self.notifiers = notifiers
+        self._notifiers_generation = generation
 
     async def refresh_tracker(self, name: str):
         """Refresh a single tracker after configuration updates."""
+        generation = self.storage.tracker_configs_generation
         tracker_config = await self.storage.get_tracker_config(name)
         if tracker_config:
-            await self._add_or_update_tracker_job(tracker_config)
+            await self._add_or_update_tracker_job(tracker_config, generation)
 
     async def remove_tracker(self, name: str):
         """Remove a tracker"""
         if name in self.trackers:
             del self.trackers[name]
+        self.tracker_configs.pop(name, None)
 
         self.scheduler_host.remove_job(self._job_namespace, name)
 
-    async def _add_or_update_tracker_job(self, tracker_config):
+    async def _add_or_update_tracker_job(self, tracker_config, generation: int):
         """Add or update a tracker job"""
         tracker = await self._create_tracker(tracker_config)
         self.trackers[tracker_config.name] = tracker
+        self.tracker_configs[tracker_config.name] = (generation, tracker_config)
 
         # Add or update the scheduled job
         # interval unit is minutes; convert to seconds
@@ -157,17 +191,70 @@ class ReleaseScheduler:
     async def start(self):
         """Start the scheduler"""
         await self.scheduler_host.start()
+        if not self._notification_workers:
+            self._notification_workers = [
+                asyncio.create_task(self._notification_worker())
+                for _ in range(NOTIFICATION_WORKER_COUNT)
+            ]
         logger.info("Scheduler started")
 
+    async def shutdown(self) -> None:
+        """Deliver queued notifications, then stop the notification workers"""
+        workers = self._notification_workers
+        if workers:
+            try:
+                await asyncio.wait_for(
+                    self._notification_queue.join(), NOTIFICATION_DRAIN_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Timed out delivering queued notifications on shutdown; "
+                    f"{self._notification_queue.qsize()} not sent"
+                )
+
+        self._notification_workers = []
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _notification_worker(self):
+        while True:
+            notifier, event, payload = await self._notification_queue.get()
+            try:
+                await notifier.notify(event, payload)
+            except Exception as e:
+                logger.error(f"Notifier {notifier.name} failed for event {event}: {e}")
+            finally:
+                self._notification_queue.task_done()
+
     async def check_all(self):
         """Check all trackers"""
 
-        async def _bounded_check(name: str):
+        async def _bounded_check(name: str) -> str:
             async with self._check_all_semaphore:
-                return await self._check_tracker(name)
-
-        tasks = [_bounded_check(name) for name in self.trackers.keys()]
-        await asyncio.gather(*tasks, return_exceptions=True)
+                try:
+                    await self._check_tracker(name)
+                except Exception as e:
+                    logger.error(f"Scheduled check failed for {name}: {e}")
+            return name
+
+        loop = asyncio.get_running_loop()
+        # Each check runs up to its first real suspension inline instead of waiting a loop turn
+        create_task = (
+            functools.partial(EAGER_TASK_FACTORY, loop)
+            if EAGER_TASK_FACTORY is not None
+            else loop.create_task
+        )
+        tasks = [create_task(_bounded_check(name)) for name in self.trackers.keys()]
+        try:
+            # Results are logged as each check lands, so one slow tracker never holds back the rest
+            for next_done in asyncio.as_completed(tasks):
+                logger.debug(f"Scheduled check finished for {await next_done}")
+        finally:
+            # Cancelling check_all must not leave its checks running unobserved
+            for task in tasks:
+                task.cancel()
 
     async def _fetch_tracker_releases(
         self,
@@ -252,30 +339,41 @@ class ReleaseScheduler:
         if not channels:
             return releases
 
+        # Resolve each enabled channel once rather than once per release
+        active_channels: list[tuple[str, Channel, str | None]] = []
+        for channel in channels:
+            if isinstance(channel, dict):
+                if not channel.get("enabled", True):
+                    continue
+                candidate_channel_name = channel.get("name")
+                channel_source_type = channel.get("source_type") or source_type
+                match_channel = Channel(**channel)
+            else:
+                if not channel.enabled:
+                    continue
+                candidate_channel_name = channel.name
+                channel_source_type = getattr(channel, "source_type", None) or source_type
+                match_channel = channel
+
+            if candidate_channel_name:
+                active_channels.append(
+                    (str(candidate_channel_name), match_channel, channel_source_type)
+                )
+
         assigned_releases: list[Release] = []
         for release in releases:
-            channel_name = None
-            for channel in channels:
-                if isinstance(channel, dict):
-                    if not channel.get("enabled", True):
-                        continue
-                    candidate_channel_name = channel.get("name")
-                    channel_source_type = channel.get("source_type") or source_type
-                else:
-                    if not channel.enabled:
-                        continue
-                    candidate_channel_name = channel.name
-                    channel_source_type = getattr(channel, "source_type", None) or source_type
-
-                if not candidate_channel_name:
-                    continue
-                if storage._release_matches_channel(
-                    release,
-                    channel,
-                    channel_source_type=channel_source_type,
-                ):
-                    channel_name = str(candidate_channel_name)
-                    break
+            channel_name = next(
+                (
+                    candidate_channel_name
+                    for candidate_channel_name, match_channel, channel_source_type in active_channels
+                    if storage._release_matches_channel(
+                        release,
+                        match_channel,
+                        channel_source_type=channel_source_type,
+                    )
+                ),
+                None,
+            )
 
             assigned_releases.append(
                 release.model_copy(update={"channel_name": channel_name})
@@ -530,25 +628,39 @@ class ReleaseScheduler:
             append_truth=False,
         )
 
-        for release in self.storage.dedupe_releases_by_immutable_identity(releases_to_persist):
-            identity_key = self.storage.release_identity_key_for_source(
+        keyed_releases = [
+            (
+                self.storage.release_identity_key_for_source(
+                    release,
+                    source_type=runtime_source.source_type,
+                ),
                 release,
-                source_type=runtime_source.source_type,
             )
+            for release in self.storage.dedupe_releases_by_immutable_identity(releases_to_persist)
+        ]
+        # Rows not appended by this run are resolved in one lookup rather than one per release
+        source_history_ids_by_identity.update(
+            await self.storage.get_source_release_history_ids(
+                runtime_source.id,
+                [key for key, _ in keyed_releases if key not in source_history_ids_by_identity],
+            )
+        )
+        history_upserts: list[TrackerReleaseHistoryUpsert] = []
+        for identity_key, release in keyed_releases:
             source_history_id = source_history_ids_by_identity.get(identity_key)
-            if source_history_id is None:
-                source_history_id = await self.storage.get_source_release_history_id(
-                    runtime_source.id,
-                    identity_key,
-                )
             if source_history_id is None:
                 continue
-            await self.storage.upsert_tracker_release_history(
-                aggregate_tracker.id,
-                release,
-                primary_source_release_history_id=source_history_id,
-                source_type=runtime_source.source_type,
+            history_upserts.append(
+                TrackerReleaseHistoryUpsert(
+                    release=release,
+                    primary_source_release_history_id=source_history_id,
+                    source_type=runtime_source.source_type,
+                )
             )
+        # Commit the whole check in one transaction instead of one per release
+        await self.storage.upsert_tracker_release_history_batch(
+            aggregate_tracker.id, history_upserts
+        )
 
         projection_releases, latest_version = await self._refresh_tracker_projection_and_notify(
             aggregate_tracker_id=aggregate_tracker.id,
@@ -617,6 +729,9 @@ class ReleaseScheduler:
         if source.source_key != release_notes.changelog_source_key:
             return [release.model_copy(update={"body": None, "changelog_url": None}) for release in releases], []
 
+        if not releases:
+            return [], []
+
         token = None
         if source.credential_name:
             credential = await self.storage.get_credential_by_name(source.credential_name)
@@ -625,23 +740,29 @@ class ReleaseScheduler:
 
         rewritten_releases: list[Release] = []
         diagnostics: list[str] = []
-        for release in releases:
-            try:
-                result = await fetch_and_extract_changelog(
-                    source=source,
-                    release=release,
-                    config=release_notes,
-                    token=token,
-                    timeout=source_config.fetch_timeout,
-                )
-                rewritten_releases.append(
-                    release.model_copy(update={"body": result.body, "changelog_url": None})
-                )
-            except Exception as exc:
-                diagnostics.append(
-                    f"{source.source_key}/{release.tag_name or release.version}: {str(exc) or exc.__class__.__name__}"
-                )
-                rewritten_releases.append(release.model_copy(update={"body": None, "changelog_url": None}))
+        # Every release in the batch reads from the same repository host; share one
+        # client so the fetches reuse a keep-alive connection instead of new handshakes
+        async with httpx.AsyncClient() as client:
+            for release in releases:
+                try:
+                    result = await fetch_and_extract_changelog(
+                        source=source,
+                        release=release,
+                        config=release_notes,
+                        token=token,
+                        timeout=source_config.fetch_timeout,
+                        client=client,
+                    )
+                    rewritten_releases.append(
+                        release.model_copy(update={"body": result.body, "changelog_url": None})
+                    )
+                except Exception as exc:
+                    diagnostics.append(
+                        f"{source.source_key}/{release.tag_name or release.version}: {str(exc) or exc.__class__.__name__}"
+                    )
+                    rewritten_releases.append(
+                        release.model_copy(update={"body": None, "changelog_url": None})
+                    )
 
         return rewritten_releases, diagnostics
 
@@ -653,13 +774,12 @@ class ReleaseScheduler:
         primary_changelog_source_key: str | None = None,
     ) -> TrackerConfig:
         _ = primary_changelog_source_key
-        effective_channels = source.release_channels
-
-        channels = [
-            channel.model_dump() if hasattr(channel, "model_dump") else channel
-            for channel in effective_channels
-        ]
-        return TrackerConfig(
+        # release_channels are already validated ReleaseChannel models; hand
+        # TrackerConfig ready-made Channel instances instead of dumping them to
+        # dicts that pydantic would parse and validate again on every check.
+        channels = flatten_release_channels(source.release_channels)
+        # Every input below comes from validated TrackerSource/TrackerConfig models.
+        return TrackerConfig.from_trusted(
             name=tracker_name,
             type=cast(TrackerSourceType, source.source_type),
             enabled=source.enabled,
@@ -683,7 +803,7 @@ class ReleaseScheduler:
             fallback_tags=tracker_config.fallback_tags if tracker_config else False,
             github_fetch_mode=source.source_config.get("fetch_mode")
             or (tracker_config.github_fetch_mode if tracker_config else "rest_first"),
-            channels=cast(list[Any], channels),
+            channels=channels,
         )
 
     @staticmethod
@@ -839,7 +959,8 @@ class ReleaseScheduler:
 
         source_errors: list[str] = []
         selection_candidates: list[Release] = []
-        candidate_sources: dict[str, list[tuple[TrackerSource, Release]]] = {}
+        # Identity key -> (source, release, source_release_history id) for every source carrying it
+        candidate_sources: dict[str, list[tuple[TrackerSource, Release, int]]] = {}
         sort_mode = tracker_config.version_sort_mode if tracker_config else "published_at"
 
         for source in enabled_sources:
@@ -950,20 +1071,34 @@ class ReleaseScheduler:
                 )
 
                 selection_candidates.extend(eligible_releases_for_history)
-                for release in eligible_releases_for_history:
-                    identity_key = self.storage.release_identity_key_for_source(
+                keyed_releases = [
+                    (
+                        self.storage.release_identity_key_for_source(
+                            release,
+                            source_type=source.source_type,
+                        ),
                         release,
-                        source_type=source.source_type,
                     )
+                    for release in eligible_releases_for_history
+                ]
+                # Earlier history rows are resolved in one lookup rather than one per release
+                source_history_ids_by_identity.update(
+                    await self.storage.get_source_release_history_ids(
+                        source.id,
+                        [
+                            key
+                            for key, _ in keyed_releases
+                            if key not in source_history_ids_by_identity
+                        ],
+                    )
+                )
+                for identity_key, release in keyed_releases:
                     source_history_id = source_history_ids_by_identity.get(identity_key)
-                    if source_history_id is None:
-                        source_history_id = await self.storage.get_source_release_history_id(
-                            source.id,
-                            identity_key,
-                        )
                     if source_history_id is None:
                         continue
-                    candidate_sources.setdefault(identity_key, []).append((source, release))
+                    candidate_sources.setdefault(identity_key, []).append(
+                        (source, release, source_history_id)
+                    )
             except Exception as e:
                 error_msg = str(e) or getattr(e, "__class__", Exception).__name__
                 logger.error(
@@ -991,6 +1126,7 @@ class ReleaseScheduler:
             selection_candidates
         )
 
+        history_upserts: list[TrackerReleaseHistoryUpsert] = []
         for release in unique_selection_candidates:
             identity_key = self.storage.release_identity_key_for_source(release)
             source_candidates = candidate_sources.get(identity_key, [])
@@ -1001,35 +1137,28 @@ class ReleaseScheduler:
                 source_candidates,
                 key=lambda item: item[0].source_rank,
             )
-            primary_source = source_candidates[0][0]
+            primary_source, _, primary_source_history_id = source_candidates[0]
             if primary_source.id is None:
                 continue
 
-            primary_source_history_id = await self.storage.get_source_release_history_id(
-                primary_source.id,
-                identity_key,
-            )
-            if primary_source_history_id is None:
-                continue
+            # Ids were resolved per source above, so no lookups are repeated here
+            supporting_source_history_ids = [
+                source_history_id
+                for candidate_source, _, source_history_id in source_candidates[1:]
+                if candidate_source.id is not None
+            ]
 
-            supporting_source_history_ids: list[int] = []
-            for candidate_source, _ in source_candidates[1:]:
-                if candidate_source.id is None:
-                    continue
-                source_history_id = await self.storage.get_source_release_history_id(
-                    candidate_source.id,
-                    identity_key,
+            history_upserts.append(
+                TrackerReleaseHistoryUpsert(
+                    release=release,
+                    primary_source_release_history_id=primary_source_history_id,
+                    supporting_source_release_history_ids=supporting_source_history_ids,
+                    source_type=primary_source.source_type,
                 )
-                if source_history_id is not None:
-                    supporting_source_history_ids.append(source_history_id)
-
-            await self.storage.upsert_tracker_release_history(
-                aggregate_tracker.id,
-                release,
-                primary_source_release_history_id=primary_source_history_id,
-                supporting_source_release_history_ids=supporting_source_history_ids,
-                source_type=primary_source.source_type,
             )
+        await self.storage.upsert_tracker_release_history_batch(
+            aggregate_tracker.id, history_upserts
+        )
 
         projection_releases, latest_version = await self._refresh_tracker_projection_and_notify(
             aggregate_tracker_id=aggregate_tracker.id,
@@ -1053,10 +1182,19 @@ class ReleaseScheduler:
 
     async def _check_tracker(self, tracker_name: str):
         """Check one tracker"""
+        generation = self.storage.tracker_configs_generation
         aggregate_tracker = await self.storage.get_aggregate_tracker(tracker_name)
 
-        # Fetch the latest configuration from the database to keep status synchronized
-        tracker_config = await self.storage.get_tracker_config(tracker_name)
+        # Reuse the cached config only while no tracker write has happened since it was read
+        cached = self.tracker_configs.get(tracker_name)
+        if cached is not None and cached[0] == generation:
+            tracker_config = cached[1]
+        else:
+            tracker_config = await self.storage.get_tracker_config(tracker_name)
+            if tracker_config is None:
+                self.tracker_configs.pop(tracker_name, None)
+            else:
+                self.tracker_configs[tracker_name] = (generation, tracker_config)
         if not tracker_config and aggregate_tracker is None:
             logger.warning(f"Tracker config missing during check: {tracker_name}")
             return None
@@ -1133,33 +1271,21 @@ class ReleaseScheduler:
             return status
 
     async def _send_notifications(self, event: str, release):
-        """Send a notification with fresh notifiers from the database each time."""
+        """Send a notification to the current notifiers, rebuilt only after notifier changes."""
         logger.info(
             f"Preparing to send notifications for event: {event}, release: {release.version}"
         )
 
-        active_notifiers = []
+        # Storage bumps the generation on every notifier write, so a stale list is never used
+        if self._notifiers_generation != self.storage.notifiers_generation:
+            async with self._notifiers_lock:
+                if self._notifiers_generation != self.storage.notifiers_generation:
+                    await self._refresh_notifiers()
 
-        # Load directly from the database instead of self.notifiers cache to avoid duplicate sends
-        try:
-            db_notifiers = await self.storage.get_notifiers()
-            logger.debug(f"Found {len(db_notifiers)} notifiers in DB")
-
-            for n in db_notifiers:
-                logger.debug(
-                    f"Checking notifier: {n.name}, enabled: {n.enabled}, type: {n.type}, events: {n.events}"
-                )
-                if n.enabled and n.type == "webhook":
-                    active_notifiers.append(
-                        WebhookNotifier(
-                            name=n.name,
-                            url=n.url,
-                            events=n.events,
-                            language=n.language,
-                        )
-                    )
-        except Exception as e:
-            logger.error(f"Failed to load notifiers from DB: {e}")
+        # Skip unsubscribed notifiers here so they never take a queue slot or a task
+        active_notifiers = [
+            notifier for notifier in self.notifiers if notifier.subscribes_to(event)
+        ]
 
         logger.info(f"Active notifiers count: {len(active_notifiers)}")
 
@@ -1167,8 +1293,14 @@ class ReleaseScheduler:
             logger.warning("No active notifiers found to send notification")
             return
 
-        tasks = [notifier.notify(event, release) for notifier in active_notifiers]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if not self._notification_workers:
+            # Not started (e.g. one-off checks): deliver inline
+            await notify_all(active_notifiers, event, release)
+            return
+
+        # A full queue makes the sender wait rather than lose a saved release's notification
+        for notifier in active_notifiers:
+            await self._notification_queue.put((notifier, event, release))
 
     async def _create_tracker(self, config: TrackerConfig) -> BaseTracker:
         """Create a tracker instance"""
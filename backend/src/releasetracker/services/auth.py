@@ -1,8 +1,11 @@
 """Authentication service module"""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 import hashlib
 import uuid
 
@@ -28,10 +31,30 @@ logger = logging.getLogger(__name__)
 # Password hashing configuration
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+
+async def _hash_password(password: str) -> str:
+    # bcrypt is deliberately slow; keep it off the event loop
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+async def _verify_password(password: str, password_hash: str) -> bool:
+    return await asyncio.to_thread(pwd_context.verify, password, password_hash)
+
+
 # JWT Configuration
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Rejected access tokens are remembered briefly so scans and stale clients
+# replaying the same bad token do not hit the database on every request
+REJECTED_TOKEN_CACHE_SIZE = 1024
+REJECTED_TOKEN_CACHE_TTL_SECONDS = 60
+
+# Accepted access tokens are remembered for a short window so the burst of API
+# calls behind one page load decodes the JWT and looks up the session only once
+AUTHENTICATED_TOKEN_CACHE_SIZE = 1024
+AUTHENTICATED_TOKEN_CACHE_TTL_SECONDS = 30
+
 
 class AuthService:
     """Authentication service"""
@@ -39,6 +62,12 @@ class AuthService:
     def __init__(self, storage: SQLiteStorage, system_key_manager: "SystemKeyManager"):
         self.storage = storage
         self.system_key_manager = system_key_manager
+        # blake2s(token) -> (monotonic expiry, rejection reason)
+        self._rejected_tokens: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        # blake2s(token) -> (monotonic expiry, signing secret, session id, user)
+        self._authenticated_tokens: OrderedDict[bytes, tuple[float, str, int | None, User]] = (
+            OrderedDict()
+        )
 
     @property
     def secret_key(self) -> str:
@@ -52,7 +81,7 @@ class AuthService:
             raise ValueError("Username already exists")
 
         # Hash the password
-        password_hash = pwd_context.hash(req.password)
+        password_hash = await _hash_password(req.password)
 
         # Create the user
         user = User(
@@ -69,7 +98,7 @@ class AuthService:
         if not user:
             raise ValueError("Invalid credentials")
 
-        if not pwd_context.verify(req.password, user.password_hash):
+        if not await _verify_password(req.password, user.password_hash):
             raise ValueError("Invalid credentials")
 
         if user.status != "active":
@@ -100,6 +129,7 @@ class AuthService:
     async def logout(self, token: str) -> None:
         """User logout"""
         token_hash = self._hash_token(token)
+        self._authenticated_tokens.pop(hashlib.blake2s(token.encode()).digest(), None)
         await self.storage.delete_session(token_hash)
 
     async def change_password(self, token: str, req: ChangePasswordRequest) -> None:
@@ -107,15 +137,17 @@ class AuthService:
         user = await self.get_current_user(token)
 
         # Verify the old password
-        if not pwd_context.verify(req.old_password, user.password_hash):
+        if not await _verify_password(req.old_password, user.password_hash):
             raise ValueError("Invalid old password")
 
         # Update password
         if user.id is None:
             raise ValueError("User not found")
 
-        new_password_hash = pwd_context.hash(req.new_password)
+        new_password_hash = await _hash_password(req.new_password)
         await self.storage.update_user_password(user.id, new_password_hash)
+        # Cached users still carry the old password hash
+        self._forget_authenticated_tokens(lambda _session_id, cached: cached.id == user.id)
 
     async def refresh_token(self, refresh_token: str) -> TokenPair:
         """Refresh token"""
@@ -139,6 +171,7 @@ class AuthService:
             if session.id is None:
                 raise ValueError("Invalid refresh token")
 
+            session_id = session.id
             token_pair = self._create_token_pair(user)
             session_updated = await self.storage.update_session_tokens(
                 session_id=session.id,
@@ -151,6 +184,9 @@ class AuthService:
             )
             if not session_updated:
                 raise ValueError("Invalid refresh token")
+            # Evict only once the row is updated, so a request racing the update cannot
+            # re-cache the superseded access token from the old session row
+            self._forget_authenticated_tokens(lambda cached_id, _user: cached_id == session_id)
             return token_pair
 
         except JWTTokenError:
@@ -158,6 +194,66 @@ class AuthService:
 
     async def get_current_user(self, token: str) -> User:
         """Get the current user from a token"""
+        cache_key = hashlib.blake2s(token.encode()).digest()
+        authenticated = self._authenticated_tokens.get(cache_key)
+        if authenticated is not None:
+            expires_at, secret_key, _session_id, user = authenticated
+            # A rotated JWT secret invalidates every session, cached or not
+            if expires_at > time.monotonic() and secret_key == self.secret_key:
+                return user.model_copy()
+            del self._authenticated_tokens[cache_key]
+
+        rejected = self._rejected_tokens.get(cache_key)
+        if rejected is not None:
+            expires_at, reason = rejected
+            if expires_at > time.monotonic():
+                raise ValueError(reason)
+            del self._rejected_tokens[cache_key]
+
+        try:
+            user, session = await self._resolve_current_user(token)
+        except ValueError as e:
+            self._remember_rejected_token(cache_key, str(e))
+            raise
+        self._remember_authenticated_token(cache_key, session, user)
+        return user
+
+    def _remember_rejected_token(self, cache_key: bytes, reason: str) -> None:
+        """Cache a rejected token so repeats skip JWT decoding and session lookups"""
+        self._rejected_tokens[cache_key] = (
+            time.monotonic() + REJECTED_TOKEN_CACHE_TTL_SECONDS,
+            reason,
+        )
+        self._rejected_tokens.move_to_end(cache_key)
+        while len(self._rejected_tokens) > REJECTED_TOKEN_CACHE_SIZE:
+            self._rejected_tokens.popitem(last=False)
+
+    def _remember_authenticated_token(self, cache_key: bytes, session: Session, user: User) -> None:
+        """Cache an accepted token, never past the expiry of its session"""
+        ttl = min(
+            AUTHENTICATED_TOKEN_CACHE_TTL_SECONDS,
+            (session.expires_at - datetime.now()).total_seconds(),
+        )
+        self._authenticated_tokens[cache_key] = (
+            time.monotonic() + ttl,
+            self.secret_key,
+            session.id,
+            user.model_copy(),
+        )
+        self._authenticated_tokens.move_to_end(cache_key)
+        while len(self._authenticated_tokens) > AUTHENTICATED_TOKEN_CACHE_SIZE:
+            self._authenticated_tokens.popitem(last=False)
+
+    def _forget_authenticated_tokens(self, predicate: Callable[[int | None, User], bool]) -> None:
+        stale_keys = [
+            cache_key
+            for cache_key, (_, _, session_id, user) in self._authenticated_tokens.items()
+            if predicate(session_id, user)
+        ]
+        for cache_key in stale_keys:
+            del self._authenticated_tokens[cache_key]
+
+    async def _resolve_current_user(self, token: str) -> tuple[User, Session]:
         try:
             payload = decode_jwt(token, self.secret_key)
             username = payload.get("sub")
@@ -177,7 +273,7 @@ class AuthService:
             if not user:
                 raise ValueError("User not found")
 
-            return user
+            return user, session
 
         except JWTTokenError:
             raise ValueError("Invalid token")
@@ -226,7 +322,7 @@ class AuthService:
         user = await self.storage.get_user_by_username("admin")
         if not user:
             logger.info("Creating default admin user")
-            password_hash = pwd_context.hash("admin")
+            password_hash = await _hash_password("admin")
             admin_user = User(
                 username="admin",
                 email="admin@example.com",
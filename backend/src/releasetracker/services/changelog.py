@@ -144,9 +144,17 @@ def extract_changelog_content(
 
 
 class RepositoryChangelogFetcher:
-    def __init__(self, *, token: str | None = None, timeout: int = 15):
+    def __init__(
+        self,
+        *,
+        token: str | None = None,
+        timeout: int = 15,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.token = token
         self.timeout = timeout
+        # Optional caller-owned client so a batch of fetches reuses its connections
+        self.client = client
 
     async def fetch_file(
         self,
@@ -176,6 +184,26 @@ class RepositoryChangelogFetcher:
             return configured_ref
         return None
 
+    async def _get_text(
+        self, url: str, *, headers: dict[str, str], params: dict[str, str] | None
+    ) -> str:
+        if self.client is not None:
+            return await self._request_text(self.client, url, headers=headers, params=params)
+        async with httpx.AsyncClient() as client:
+            return await self._request_text(client, url, headers=headers, params=params)
+
+    async def _request_text(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, str] | None,
+    ) -> str:
+        response = await client.get(url, headers=headers, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
     def _github_headers(self) -> dict[str, str]:
         headers = {
             "Accept": "application/vnd.github.raw+json",
@@ -200,15 +228,7 @@ class RepositoryChangelogFetcher:
             raise ValueError("GitHub repository is required for custom changelog")
         url = f"https://api.github.com/repos/{repo}/contents/{quote(path, safe='/')}"
         params = {"ref": ref} if ref else None
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self._github_headers(),
-                params=params,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.text
+        return await self._get_text(url, headers=self._github_headers(), params=params)
 
     async def _fetch_gitlab(self, source: TrackerSource, path: str, ref: str | None) -> str:
         project = str(source.source_config.get("project") or "").strip()
@@ -219,15 +239,7 @@ class RepositoryChangelogFetcher:
         encoded_path = quote(path, safe="")
         url = f"{instance}/api/v4/projects/{project_id}/repository/files/{encoded_path}/raw"
         params = {"ref": ref or "HEAD"}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self._gitlab_headers(),
-                params=params,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.text
+        return await self._get_text(url, headers=self._gitlab_headers(), params=params)
 
     async def _fetch_gitea(self, source: TrackerSource, path: str, ref: str | None) -> str:
         repo = str(source.source_config.get("repo") or "").strip()
@@ -236,15 +248,7 @@ class RepositoryChangelogFetcher:
         instance = str(source.source_config.get("instance") or "https://gitea.com").rstrip("/")
         url = f"{instance}/api/v1/repos/{repo}/raw/{quote(path, safe='/')}"
         params = {"ref": ref} if ref else None
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self._gitea_headers(),
-                params=params,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.text
+        return await self._get_text(url, headers=self._gitea_headers(), params=params)
 
 
 async def fetch_and_extract_changelog(
@@ -254,9 +258,10 @@ async def fetch_and_extract_changelog(
     config: TrackerReleaseNotesConfig,
     token: str | None = None,
     timeout: int = 15,
+    client: httpx.AsyncClient | None = None,
 ) -> ChangelogExtractionResult:
     path = render_changelog_template(config.path_template, release)
-    fetcher = RepositoryChangelogFetcher(token=token, timeout=timeout)
+    fetcher = RepositoryChangelogFetcher(token=token, timeout=timeout, client=client)
     content = await fetcher.fetch_file(source, path, config.ref_strategy, release, config.ref)
     body = extract_changelog_content(content, release, config)
     return ChangelogExtractionResult(body=body, path=path)
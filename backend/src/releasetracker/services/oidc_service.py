@@ -1,7 +1,9 @@
 """OIDC Authentication service"""
 
+import asyncio
 import logging
 import secrets
+import time
 import hashlib
 import base64
 import json
@@ -16,18 +18,51 @@ from ..models import User, Session, TokenPair
 
 logger = logging.getLogger(__name__)
 
+# Discovery documents change on IdP reconfiguration, not per login
+OIDC_DISCOVERY_CACHE_TTL_SECONDS = 3600.0
 
-def generate_pkce_pair() -> tuple[str, str]:
-    """Generate PKCE code_verifier and code_challenge"""
-    # code_verifier: 43-128 character random URL-safe string
-    code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode().rstrip("=")
+# Discovery URL -> (monotonic expiry, parsed openid-configuration)
+_discovery_cache: dict[str, tuple[float, dict]] = {}
+# One lock per discovery URL so a cold cache triggers a single fetch
+_discovery_locks: dict[str, asyncio.Lock] = {}
+
+
+async def _fetch_discovery_document(discovery_url: str) -> dict:
+    cached = _discovery_cache.get(discovery_url)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    lock = _discovery_locks.setdefault(discovery_url, asyncio.Lock())
+    async with lock:
+        # Another request may have filled the cache while this one waited
+        cached = _discovery_cache.get(discovery_url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        async with httpx.AsyncClient(timeout=10) as client:
+            resp = await client.get(discovery_url)
+            resp.raise_for_status()
+            config = resp.json()
+        _discovery_cache[discovery_url] = (
+            time.monotonic() + OIDC_DISCOVERY_CACHE_TTL_SECONDS,
+            config,
+        )
+        return config
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def generate_state_and_pkce_pair() -> tuple[str, str, str]:
+    """Generate the OAuth state plus a PKCE code_verifier and code_challenge"""
+    # One CSPRNG draw covers both secrets: 32 bytes each for state and verifier
+    random_bytes = secrets.token_bytes(64)
+    state = _b64url(random_bytes[:32])
+    # code_verifier: 43-character random URL-safe string
+    code_verifier = _b64url(random_bytes[32:])
     # code_challenge: SHA256(code_verifier) then Base64URL encode
-    code_challenge = (
-        base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode()).digest())
-        .decode()
-        .rstrip("=")
-    )
-    return code_verifier, code_challenge
+    code_challenge = _b64url(hashlib.sha256(code_verifier.encode("ascii")).digest())
+    return state, code_verifier, code_challenge
 
 
 def _require_user_id(user: User) -> int:
@@ -48,10 +83,7 @@ class OIDCService:
         if provider.discovery_enabled and provider.issuer_url:
             discovery_url = f"{provider.issuer_url.rstrip('/')}/.well-known/openid-configuration"
             try:
-                async with httpx.AsyncClient(timeout=10) as client:
-                    resp = await client.get(discovery_url)
-                    resp.raise_for_status()
-                    config = resp.json()
+                config = await _fetch_discovery_document(discovery_url)
                 provider.authorization_url = config["authorization_endpoint"]
                 provider.token_url = config["token_endpoint"]
                 provider.userinfo_url = config.get("userinfo_endpoint") or provider.userinfo_url
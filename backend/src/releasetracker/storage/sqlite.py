@@ -5,14 +5,21 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import re
 import sqlite3
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, cast
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal, cast
 from zoneinfo import ZoneInfo
 
 import aiosqlite
+from packaging.version import InvalidVersion, parse as parse_version
 
 from . import (
     sqlite_aggregate_trackers,
@@ -38,9 +45,13 @@ from ..models import (
     CanonicalRelease,
     CanonicalReleaseObservation,
 )
+from ..oidc_models import OAuthState
 from ..config import (
+    Channel,
     RuntimeConnectionConfig,
     ExecutorConfig,
+    TrackerConfig,
+    compile_channel_pattern,
 )
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -64,9 +75,37 @@ MIN_RELEASE_HISTORY_RETENTION_COUNT = 1
 MAX_RELEASE_HISTORY_RETENTION_COUNT = 1000
 MIN_EXECUTOR_SNAPSHOT_RETENTION_COUNT = 1
 MAX_EXECUTOR_SNAPSHOT_RETENTION_COUNT = 1000
+READ_POOL_SIZE = min(4, os.cpu_count() or 1)
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+# Per-connection settings shared by the writer and every pooled reader. Foreign key
+# enforcement stays off: write paths order parent and child rows freely and delete
+# dependents explicitly, which enforcement and the schema's ON DELETE actions would break.
+SQLITE_CONNECTION_PRAGMAS = (
+    # Wait up to 5s for a lock instead of failing with "database is locked"
+    "PRAGMA busy_timeout=5000",
+    # Page cache in KiB (about 20MB) rather than the ~2MB default
+    "PRAGMA cache_size=-20000",
+    # Keep sort/GROUP BY scratch tables for history cleanup and stats off disk
+    "PRAGMA temp_store=MEMORY",
+    # Memory-map the database so page reads skip the read() syscall and buffer copy
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+)
+STATS_CACHE_TTL_SECONDS = 30.0
+OAUTH_STATE_TTL = timedelta(minutes=10)
+OAUTH_STATE_CACHE_SIZE = 10_000
 _DOCKER_DISPLAY_VERSION_RE = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?([.\-].*)?$")
 
 
+@dataclass(frozen=True)
+class TrackerReleaseHistoryUpsert:
+    """One pending row for SQLiteStorage.upsert_tracker_release_history_batch"""
+
+    release: Release
+    primary_source_release_history_id: int
+    supporting_source_release_history_ids: list[int] | None = None
+    source_type: str | None = None
+
+
 class SQLiteStorage:
     """SQLite database storage"""
 
@@ -77,9 +116,43 @@ class SQLiteStorage:
 
         # Persistent database connection, lazily created via _get_connection()
         self._db: aiosqlite.Connection | None = None
+        # Distinguishes change counters of successive connections in get_data_version()
+        self._connection_epoch = 0
 
-        # Notifier in-memory cache, invalidated after CRUD operations
+        # Read-only connections for hot read paths, lazily opened via _read_connection()
+        self._read_pool: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._read_connections: list[aiosqlite.Connection] = []
+        self._read_pool_lock = asyncio.Lock()
+
+        # Notifier in-memory cache, invalidated after CRUD operations. The generation
+        # moves on every invalidation so derived caches know when to rebuild
         self._notifiers_cache: list | None = None
+        self.notifiers_generation = 0
+
+        # Moves on every tracker config, channel or source write so the scheduler knows
+        # when the runtime configs it holds for scheduled checks are stale
+        self.tracker_configs_generation = 0
+
+        # Decrypted credentials keyed by name, read on every tracker check and
+        # invalidated after credential CRUD operations or key changes
+        self._credentials_by_name_cache: dict[str, Any] = {}
+
+        # Decrypted OIDC providers keyed by slug, read on every login redirect and
+        # callback and invalidated after provider CRUD operations or key changes
+        self._oauth_providers_by_slug_cache: dict[str, Any] = {}
+
+        # OIDC provider lists for the admin page and the anonymous login page, keyed
+        # by list variant and invalidated together with the slug cache
+        self._oauth_provider_lists_cache: dict[str, list] = {}
+
+        # Pending OIDC logins keyed by state. Each is read once within minutes of
+        # being written, so they live in memory instead of the oauth_states table
+        self._oauth_states: dict[str, OAuthState] = {}
+
+        # Dashboard statistics keyed by the write connection's change counter, so any
+        # committed write invalidates them; the TTL keeps "recent"/"today" buckets fresh
+        self._stats_cache: tuple[float, int, ReleaseStats] | None = None
+        self._stats_cache_lock = asyncio.Lock()
 
         if system_key_manager is None:
             raise RuntimeError("SQLiteStorage requires SystemKeyManager")
@@ -91,20 +164,69 @@ class SQLiteStorage:
         if self._db is None:
             self._db = await aiosqlite.connect(self.db_path)
             self._db.row_factory = aiosqlite.Row
+            self._connection_epoch = time.time_ns()
             # Enable WAL mode to allow concurrent reads and writes and improve high-load concurrency
             await self._db.execute("PRAGMA journal_mode=WAL")
-            # Set busy timeout in milliseconds to avoid immediate database is locked errors under concurrency
-            await self._db.execute("PRAGMA busy_timeout=5000")
-            # Increase cache size in pages; default is 4KB per page, here about 16MB
-            await self._db.execute("PRAGMA cache_size=-16384")
+            # WAL stays crash-safe with NORMAL; it skips the fsync on every commit
+            await self._db.execute("PRAGMA synchronous=NORMAL")
+            for pragma in SQLITE_CONNECTION_PRAGMAS:
+                await self._db.execute(pragma)
             await self._db.commit()
             logger.info(
                 f"SQLite persistent connection established with WAL mode enabled: {self.db_path}"
             )
         return self._db
 
+    async def get_data_version(self) -> str:
+        """Opaque token that changes whenever a write is made through this storage"""
+        db = await self._get_connection()
+        return f"{self._connection_epoch:x}-{db.total_changes}"
+
+    async def _open_read_pool(self) -> asyncio.Queue[aiosqlite.Connection]:
+        async with self._read_pool_lock:
+            if self._read_pool is None:
+                # The write connection switches the database to WAL before readers attach
+                await self._get_connection()
+                pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+                for _ in range(READ_POOL_SIZE):
+                    db = await aiosqlite.connect(self.db_path)
+                    db.row_factory = aiosqlite.Row
+                    for pragma in SQLITE_CONNECTION_PRAGMAS:
+                        await db.execute(pragma)
+                    await db.execute("PRAGMA query_only=ON")
+                    self._read_connections.append(db)
+                    pool.put_nowait(db)
+                self._read_pool = pool
+            return self._read_pool
+
+    @asynccontextmanager
+    async def _read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only connection so hot reads do not queue behind writes.
+
+        Listing pages, stats, the anonymous login page and the scheduler's per-tracker
+        lookups read through this pool, which WAL lets run alongside the single writer.
+        Reads that must see uncommitted writes stay on _get_connection(), and helpers
+        called while a connection is borrowed take it as a db argument instead of
+        borrowing a second one.
+        """
+        if self.db_path == ":memory:":
+            yield await self._get_connection()
+            return
+
+        pool = self._read_pool or await self._open_read_pool()
+        db = await pool.get()
+        try:
+            yield db
+        finally:
+            pool.put_nowait(db)
+
     async def close(self) -> None:
         """Close the persistent database connection at application shutdown."""
+        self._stats_cache = None
+        read_connections, self._read_connections = self._read_connections, []
+        self._read_pool = None
+        for read_db in read_connections:
+            await read_db.close()
         if self._db is not None:
             await self._db.close()
             self._db = None
@@ -114,6 +236,20 @@ class SQLiteStorage:
     def invalidate_notifiers_cache(self) -> None:
         """Invalidate notifier in-memory cache after CRUD operations"""
         self._notifiers_cache = None
+        self.notifiers_generation += 1
+
+    def invalidate_tracker_configs(self) -> None:
+        """Mark tracker configs derived from storage stale after a tracker write"""
+        self.tracker_configs_generation += 1
+
+    def invalidate_credentials_cache(self) -> None:
+        """Invalidate decrypted credential cache after CRUD operations"""
+        self._credentials_by_name_cache.clear()
+
+    def invalidate_oauth_providers_cache(self) -> None:
+        """Invalidate decrypted OIDC provider cache after CRUD operations"""
+        self._oauth_providers_by_slug_cache.clear()
+        self._oauth_provider_lists_cache.clear()
 
     @staticmethod
     def _normalize_notifier_language(value: Any) -> str:
@@ -122,6 +258,8 @@ class SQLiteStorage:
         raise ValueError("notifier language must be one of: en, zh")
 
     def set_encryption_key(self, key: str) -> None:
+        self.invalidate_credentials_cache()
+        self.invalidate_oauth_providers_cache()
         try:
             self.fernet = Fernet(key.encode("utf-8") if isinstance(key, str) else key)
         except Exception as e:
@@ -439,8 +577,6 @@ class SQLiteStorage:
 
     @staticmethod
     def _load_tracker_channels(value: str | None):
-        from ..config import Channel
-
         if not value:
             return []
 
@@ -533,8 +669,6 @@ class SQLiteStorage:
         tracker: AggregateTracker,
         runtime_row: aiosqlite.Row | None = None,
     ):
-        from ..config import TrackerConfig
-
         selected_source = cls._select_runtime_source(tracker)
         if selected_source is None:
             return None
@@ -544,7 +678,8 @@ class SQLiteStorage:
             runtime_config = cls._row_to_tracker_config(runtime_row)
 
         source_config = selected_source.source_config
-        return TrackerConfig(
+        # The aggregate tracker and its sources were validated when loaded.
+        return TrackerConfig.from_trusted(
             name=tracker.name,
             type=cast(TrackerSourceType, selected_source.source_type),
             enabled=tracker.enabled,
@@ -567,9 +702,8 @@ class SQLiteStorage:
             fetch_timeout=runtime_config.fetch_timeout if runtime_config else 15,
             fallback_tags=runtime_config.fallback_tags if runtime_config else False,
             github_fetch_mode=runtime_config.github_fetch_mode if runtime_config else "rest_first",
-            channels=cast(
-                list[Any],
-                cls._flatten_runtime_release_channels(tracker, runtime_config, selected_source),
+            channels=cls._flatten_runtime_release_channels(
+                tracker, runtime_config, selected_source
             ),
         )
 
@@ -935,6 +1069,7 @@ class SQLiteStorage:
             ),
         )
         await db.commit()
+        self.invalidate_tracker_configs()
 
     async def get_all_tracker_configs(self) -> list:
         """Get all tracker configurations."""
@@ -996,13 +1131,14 @@ class SQLiteStorage:
             await db.execute("DELETE FROM trackers WHERE TRIM(name) = ''")
         await db.commit()
 
-    async def get_tracker_config(self, name: str):
+    async def get_tracker_config(self, name: str, *, db: aiosqlite.Connection | None = None):
         """Get a single tracker configuration."""
-        await self.cleanup_blank_tracker_rows()
+        if db is None:
+            async with self._read_connection() as read_db:
+                return await self.get_tracker_config(name, db=read_db)
+
         has_trackers_table = await self._table_exists("trackers")
         has_aggregate_schema = await self._aggregate_schema_available()
-        db = await self._get_connection()
-        db.row_factory = aiosqlite.Row
         runtime_row = (
             await (await db.execute("SELECT * FROM trackers WHERE name = ?", (name,))).fetchone()
             if has_trackers_table
@@ -1020,11 +1156,34 @@ class SQLiteStorage:
             return self._aggregate_tracker_to_runtime_config(aggregate_tracker, runtime_row)
         return None
 
+    async def get_tracker_configs_for_aggregates(
+        self, trackers: list[AggregateTracker]
+    ) -> dict[str, Any]:
+        """Build runtime configurations for already loaded aggregate trackers."""
+        runtime_rows_by_name: dict[str, aiosqlite.Row] = {}
+        names = [tracker.name for tracker in trackers]
+        if names and await self._table_exists("trackers"):
+            placeholders = ", ".join("?" for _ in names)
+            db = await self._get_connection()
+            db.row_factory = aiosqlite.Row
+            cursor = await db.execute(
+                f"SELECT * FROM trackers WHERE name IN ({placeholders})", tuple(names)
+            )
+            runtime_rows_by_name = {row["name"]: row for row in await cursor.fetchall()}
+
+        return {
+            tracker.name: self._aggregate_tracker_to_runtime_config(
+                tracker, runtime_rows_by_name.get(tracker.name)
+            )
+            for tracker in trackers
+        }
+
     async def delete_tracker_config(self, name: str) -> None:
         """Delete a tracker configuration."""
         db = await self._get_connection()
         await db.execute("DELETE FROM trackers WHERE name = ?", (name,))
         await db.commit()
+        self.invalidate_tracker_configs()
 
     async def create_aggregate_tracker(self, tracker: AggregateTracker) -> AggregateTracker:
         return await sqlite_aggregate_trackers.create_aggregate_tracker(self, tracker)
@@ -1072,6 +1231,20 @@ class SQLiteStorage:
     async def delete_aggregate_tracker(self, name: str) -> None:
         await sqlite_aggregate_trackers.delete_aggregate_tracker(self, name)
 
+    async def delete_tracker(self, name: str) -> bool:
+        """Delete a tracker with its runtime config and status in one transaction.
+
+        Returns False, deleting nothing, when no aggregate tracker with that name exists.
+        """
+        db = await self._get_connection()
+        if not await sqlite_aggregate_trackers.delete_aggregate_tracker_rows(db, name):
+            return False
+        await db.execute("DELETE FROM trackers WHERE name = ?", (name,))
+        await db.execute("DELETE FROM tracker_status WHERE name = ?", (name,))
+        await db.commit()
+        self.invalidate_tracker_configs()
+        return True
+
     async def get_canonical_releases(self, aggregate_tracker_name: str) -> list[CanonicalRelease]:
         db = await self._get_connection()
         db.row_factory = aiosqlite.Row
@@ -1678,6 +1851,7 @@ class SQLiteStorage:
         db.row_factory = aiosqlite.Row
         timestamp = (observed_at or datetime.now()).isoformat()
         source_history_ids_by_identity: dict[str, int] = {}
+        observation_rows: list[tuple[int, int, str, str]] = []
 
         for release in releases:
             version, app_version, chart_version = self._release_version_metadata(
@@ -1722,18 +1896,8 @@ class SQLiteStorage:
                 ).fetchone()
                 if prior_digest_row is not None:
                     source_history_ids_by_identity[identity_key] = prior_digest_row["id"]
-                    await db.execute(
-                        """
-                        INSERT OR IGNORE INTO source_release_run_observations
-                        (source_fetch_run_id, source_release_history_id, observed_at, created_at)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (
-                            source_fetch_run_id,
-                            prior_digest_row["id"],
-                            timestamp,
-                            timestamp,
-                        ),
+                    observation_rows.append(
+                        (source_fetch_run_id, prior_digest_row["id"], timestamp, timestamp)
                     )
                     continue
 
@@ -1876,15 +2040,17 @@ class SQLiteStorage:
                     ),
                 )
 
-            await db.execute(
-                """
-                INSERT OR IGNORE INTO source_release_run_observations
-                (source_fetch_run_id, source_release_history_id, observed_at, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (source_fetch_run_id, source_history_id, timestamp, timestamp),
-            )
+            observation_rows.append((source_fetch_run_id, source_history_id, timestamp, timestamp))
 
+        # Run observations don't feed back into the loop, so write them in one batch
+        await db.executemany(
+            """
+            INSERT OR IGNORE INTO source_release_run_observations
+            (source_fetch_run_id, source_release_history_id, observed_at, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            observation_rows,
+        )
         await db.commit()
         return source_history_ids_by_identity
 
@@ -1950,6 +2116,29 @@ class SQLiteStorage:
         ).fetchone()
         return row["id"] if row else None
 
+    async def get_source_release_history_ids(
+        self,
+        tracker_source_id: int,
+        identity_keys: list[str],
+    ) -> dict[str, int]:
+        """Return {immutable_key → source_release_history id} for the keys already stored."""
+        if not identity_keys:
+            return {}
+        placeholders = ", ".join("?" for _ in identity_keys)
+        db = await self._get_connection()
+        db.row_factory = aiosqlite.Row
+        rows = await (
+            await db.execute(
+                f"""
+                SELECT immutable_key, id
+                FROM source_release_history
+                WHERE tracker_source_id = ? AND immutable_key IN ({placeholders})
+                """,
+                (tracker_source_id, *identity_keys),
+            )
+        ).fetchall()
+        return {row["immutable_key"]: row["id"] for row in rows}
+
     async def get_source_release_history_digests(
         self,
         tracker_source_id: int,
@@ -1993,7 +2182,52 @@ class SQLiteStorage:
     ) -> tuple[int, bool]:
         db = await self._get_connection()
         db.row_factory = aiosqlite.Row
+        result = await self._upsert_tracker_release_history_row(
+            db,
+            aggregate_tracker_id,
+            release,
+            primary_source_release_history_id=primary_source_release_history_id,
+            supporting_source_release_history_ids=supporting_source_release_history_ids,
+            source_type=source_type,
+        )
+        await db.commit()
+        return result
+
+    async def upsert_tracker_release_history_batch(
+        self,
+        aggregate_tracker_id: int,
+        entries: list[TrackerReleaseHistoryUpsert],
+    ) -> list[tuple[int, bool]]:
+        """Upsert several tracker history rows and commit them as one transaction"""
+        if not entries:
+            return []
+
+        db = await self._get_connection()
+        db.row_factory = aiosqlite.Row
+        results = [
+            await self._upsert_tracker_release_history_row(
+                db,
+                aggregate_tracker_id,
+                entry.release,
+                primary_source_release_history_id=entry.primary_source_release_history_id,
+                supporting_source_release_history_ids=entry.supporting_source_release_history_ids,
+                source_type=entry.source_type,
+            )
+            for entry in entries
+        ]
+        await db.commit()
+        return results
 
+    async def _upsert_tracker_release_history_row(
+        self,
+        db: aiosqlite.Connection,
+        aggregate_tracker_id: int,
+        release: Release,
+        *,
+        primary_source_release_history_id: int,
+        supporting_source_release_history_ids: list[int] | None = None,
+        source_type: str | None = None,
+    ) -> tuple[int, bool]:
         identity_key = self.release_identity_key_for_source(release, source_type=source_type)
         digest = self._release_digest_value(release, source_type=source_type)
         version, _, _ = self._release_version_metadata(release, source_type=source_type)
@@ -2096,14 +2330,16 @@ class SQLiteStorage:
                 (tracker_release_history_id, source_release_history_id, timestamp),
             )
 
-        await db.commit()
         return tracker_release_history_id, is_new
 
     async def get_tracker_release_history_releases(
         self,
         aggregate_tracker_id: int,
+        *,
+        db: aiosqlite.Connection | None = None,
     ) -> list[Release]:
-        db = await self._get_connection()
+        if db is None:
+            db = await self._get_connection()
         db.row_factory = aiosqlite.Row
         rows = await (
             await db.execute(
@@ -2133,11 +2369,13 @@ class SQLiteStorage:
             )
         ).fetchall()
 
+        # History rows were validated when written, so build releases without
+        # re-running pydantic validation for every row of every listed tracker
         releases: list[Release] = []
         for row in rows:
             raw_payload = self._load_json(row["raw_payload"])
             releases.append(
-                Release(
+                Release.model_construct(
                     id=row["tracker_release_history_id"],
                     tracker_name="",
                     tracker_type=row["source_type"],
@@ -2529,35 +2767,36 @@ class SQLiteStorage:
             (aggregate_tracker_id,),
         )
 
-        for release in self.dedupe_releases_by_immutable_identity(projection_releases):
-            identity_key = self.release_identity_key_for_source(release, source_type=source_type)
-            digest = self._release_digest_value(release, source_type=source_type)
-            history_row = await (
-                await db.execute(
-                    """
-                    SELECT id
-                    FROM tracker_release_history
-                    WHERE aggregate_tracker_id = ? AND immutable_key = ?
-                    """,
-                    (aggregate_tracker_id, identity_key),
-                )
-            ).fetchone()
-            if history_row is None:
-                continue
-
-            await db.execute(
-                """
-                INSERT INTO tracker_current_releases
-                (aggregate_tracker_id, identity_key, immutable_key, version, digest, tracker_release_history_id, name, tag_name, published_at, url, changelog_url, prerelease, body, projected_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        keyed_releases = [
+            (self.release_identity_key_for_source(release, source_type=source_type), release)
+            for release in self.dedupe_releases_by_immutable_identity(projection_releases)
+        ]
+        history_ids: dict[str, int] = {}
+        if keyed_releases:
+            placeholders = ", ".join("?" for _ in keyed_releases)
+            async with db.execute(
+                f"""
+                SELECT immutable_key, id
+                FROM tracker_release_history
+                WHERE aggregate_tracker_id = ? AND immutable_key IN ({placeholders})
                 """,
+                (aggregate_tracker_id, *(identity_key for identity_key, _ in keyed_releases)),
+            ) as cursor:
+                history_ids = {row["immutable_key"]: row["id"] async for row in cursor}
+
+        projection_rows = []
+        for identity_key, release in keyed_releases:
+            history_id = history_ids.get(identity_key)
+            if history_id is None:
+                continue
+            projection_rows.append(
                 (
                     aggregate_tracker_id,
                     identity_key,
                     identity_key,
                     release.version,
-                    digest,
-                    history_row["id"],
+                    self._release_digest_value(release, source_type=source_type),
+                    history_id,
                     release.name,
                     release.tag_name,
                     release.published_at.isoformat(),
@@ -2567,9 +2806,17 @@ class SQLiteStorage:
                     release.body,
                     projected_at,
                     projected_at,
-                ),
+                )
             )
 
+        await db.executemany(
+            """
+            INSERT INTO tracker_current_releases
+            (aggregate_tracker_id, identity_key, immutable_key, version, digest, tracker_release_history_id, name, tag_name, published_at, url, changelog_url, prerelease, body, projected_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            projection_rows,
+        )
         await db.commit()
 
     async def get_tracker_current_releases(self, aggregate_tracker_id: int) -> list[Release]:
@@ -2579,11 +2826,23 @@ class SQLiteStorage:
     async def _get_tracker_current_projection_rows(
         self, aggregate_tracker_id: int
     ) -> list[dict[str, Any]]:
+        rows_by_tracker_id = await self._get_trackers_current_projection_rows(
+            [aggregate_tracker_id]
+        )
+        return rows_by_tracker_id.get(aggregate_tracker_id, [])
+
+    async def _get_trackers_current_projection_rows(
+        self, aggregate_tracker_ids: list[int]
+    ) -> dict[int, list[dict[str, Any]]]:
+        if not aggregate_tracker_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in aggregate_tracker_ids)
         db = await self._get_connection()
         db.row_factory = aiosqlite.Row
         rows = await (
             await db.execute(
-                """
+                f"""
                 SELECT tcr.*,
                        trh.id AS tracker_release_history_id,
                        trh.created_at AS tracker_created_at,
@@ -2596,17 +2855,17 @@ class SQLiteStorage:
                 JOIN tracker_release_history trh ON trh.id = tcr.tracker_release_history_id
                 JOIN source_release_history srh ON srh.id = trh.primary_source_release_history_id
                 LEFT JOIN aggregate_tracker_sources ats ON ats.id = srh.tracker_source_id
-                WHERE tcr.aggregate_tracker_id = ?
+                WHERE tcr.aggregate_tracker_id IN ({placeholders})
                 ORDER BY tcr.published_at DESC, tcr.id DESC
                 """,
-                (aggregate_tracker_id,),
+                tuple(aggregate_tracker_ids),
             )
         ).fetchall()
 
-        projection_rows: list[dict[str, Any]] = []
+        projection_rows_by_tracker_id: dict[int, list[dict[str, Any]]] = {}
         for row in rows:
             raw_payload = self._load_json(row["raw_payload"])
-            projection_rows.append(
+            projection_rows_by_tracker_id.setdefault(row["aggregate_tracker_id"], []).append(
                 {
                     "tracker_release_history_id": row["tracker_release_history_id"],
                     "identity_key": row["identity_key"],
@@ -2629,7 +2888,7 @@ class SQLiteStorage:
                         if row["primary_source_release_history_id"] is not None
                         else None
                     ),
-                    "release": Release(
+                    "release": Release.model_construct(
                         id=row["tracker_release_history_id"],
                         tracker_name="",
                         tracker_type=row["primary_source_type"] or "github",
@@ -2649,7 +2908,7 @@ class SQLiteStorage:
                     ),
                 }
             )
-        return projection_rows
+        return projection_rows_by_tracker_id
 
     @classmethod
     def _select_top_current_projection_release(
@@ -2735,6 +2994,18 @@ class SQLiteStorage:
             return None
 
         tracker_config = await self.get_tracker_config(tracker_name)
+        return self._summarize_latest_current_release(tracker_name, current_rows, tracker_config)
+
+    @classmethod
+    def _summarize_latest_current_release(
+        cls,
+        tracker_name: str,
+        current_rows: list[dict[str, Any]],
+        tracker_config: Any,
+    ) -> dict[str, Any] | None:
+        if not current_rows:
+            return None
+
         sort_mode = (
             tracker_config.version_sort_mode if tracker_config is not None else "published_at"
         )
@@ -2742,7 +3013,7 @@ class SQLiteStorage:
         current_releases = [
             row["release"].model_copy(update={"tracker_name": tracker_name}) for row in current_rows
         ]
-        latest_release = self._select_top_current_projection_release(
+        latest_release = cls._select_top_current_projection_release(
             current_releases,
             channels,
             sort_mode,
@@ -2750,7 +3021,7 @@ class SQLiteStorage:
         if latest_release is None:
             return None
 
-        latest_identity_key = self.release_identity_key_for_source(
+        latest_identity_key = cls.release_identity_key_for_source(
             latest_release,
             source_type=latest_release.tracker_type,
         )
@@ -2788,6 +3059,42 @@ class SQLiteStorage:
     async def get_tracker_current_status_derivation(self, tracker_name: str) -> dict[str, Any]:
         tracker_status = await self.get_tracker_status(tracker_name)
         latest_summary = await self.get_tracker_latest_current_release_summary(tracker_name)
+        return self._build_tracker_current_status_derivation(
+            tracker_name, tracker_status, latest_summary
+        )
+
+    async def get_tracker_current_status_derivations(
+        self,
+        trackers: list[AggregateTracker],
+        tracker_configs: dict[str, Any],
+    ) -> dict[str, dict[str, Any]]:
+        """Derive current status for a page of trackers with one query per table."""
+        status_map = await self.get_tracker_statuses([tracker.name for tracker in trackers])
+        current_rows_by_tracker_id = await self._get_trackers_current_projection_rows(
+            [tracker.id for tracker in trackers if tracker.id is not None]
+        )
+
+        derivations: dict[str, dict[str, Any]] = {}
+        for tracker in trackers:
+            tracker_config = tracker_configs.get(tracker.name)
+            channels = tracker_config.channels if tracker_config is not None else []
+            current_rows = self._filter_projection_rows_by_channels(
+                current_rows_by_tracker_id.get(tracker.id, []) if tracker.id is not None else [],
+                channels,
+            )
+            derivations[tracker.name] = self._build_tracker_current_status_derivation(
+                tracker.name,
+                status_map.get(tracker.name),
+                self._summarize_latest_current_release(tracker.name, current_rows, tracker_config),
+            )
+        return derivations
+
+    @staticmethod
+    def _build_tracker_current_status_derivation(
+        tracker_name: str,
+        tracker_status: TrackerStatus | None,
+        latest_summary: dict[str, Any] | None,
+    ) -> dict[str, Any]:
         return {
             "tracker_name": tracker_name,
             "last_check": tracker_status.last_check if tracker_status is not None else None,
@@ -3027,8 +3334,6 @@ class SQLiteStorage:
     @staticmethod
     def _row_to_tracker_config(row):
         """Convert a database row to a TrackerConfig object"""
-        from ..config import TrackerConfig
-
         channels = (
             SQLiteStorage._load_tracker_channels(row["channels"])
             if "channels" in row.keys()
@@ -3078,7 +3383,8 @@ class SQLiteStorage:
     @staticmethod
     def _row_to_tracker_status(row) -> TrackerStatus:
         """Convert a database row to a TrackerStatus object"""
-        return TrackerStatus(
+        # Rows are written by update_tracker_status from a validated model
+        return TrackerStatus.model_construct(
             name=row["name"],
             type=row["type"],
             enabled=bool(row["enabled"]),
@@ -3105,69 +3411,78 @@ class SQLiteStorage:
             aggregate_trackers = await self.get_all_aggregate_trackers()
 
         releases: list[Release] = []
-        for aggregate_tracker in aggregate_trackers:
-            tracker_releases: list[Release] = []
-            if aggregate_tracker.id is not None:
-                if include_history:
-                    tracker_releases = await self.get_tracker_release_history_releases(
-                        aggregate_tracker.id
-                    )
-                else:
-                    tracker_releases = await self.get_tracker_current_releases(aggregate_tracker.id)
+        async with self._read_connection() as read_db:
+            for aggregate_tracker in aggregate_trackers:
+                tracker_releases: list[Release] = []
+                if aggregate_tracker.id is not None:
+                    if include_history:
+                        tracker_releases = await self.get_tracker_release_history_releases(
+                            aggregate_tracker.id, db=read_db
+                        )
+                    else:
+                        tracker_releases = await self.get_tracker_current_releases(
+                            aggregate_tracker.id
+                        )
 
-            if tracker_releases:
-                if not include_history:
-                    tracker_config = await self.get_tracker_config(aggregate_tracker.name)
-                    channels = tracker_config.channels if tracker_config is not None else []
-                    if channels:
-                        tracker_releases = list(
-                            self.select_best_releases_by_channel(
-                                tracker_releases,
-                                channels,
-                                sort_mode=(
-                                    tracker_config.version_sort_mode
-                                    if tracker_config is not None
-                                    else "published_at"
-                                ),
-                                use_immutable_identity=True,
-                            ).values()
+                if tracker_releases:
+                    if not include_history:
+                        tracker_config = await self.get_tracker_config(
+                            aggregate_tracker.name, db=read_db
                         )
-                for tracker_release in tracker_releases:
-                    tracker_release.tracker_name = aggregate_tracker.name
-                releases.extend(tracker_releases)
-                continue
+                        channels = tracker_config.channels if tracker_config is not None else []
+                        if channels:
+                            tracker_releases = list(
+                                self.select_best_releases_by_channel(
+                                    tracker_releases,
+                                    channels,
+                                    sort_mode=(
+                                        tracker_config.version_sort_mode
+                                        if tracker_config is not None
+                                        else "published_at"
+                                    ),
+                                    use_immutable_identity=True,
+                                ).values()
+                            )
+                    for tracker_release in tracker_releases:
+                        tracker_release.tracker_name = aggregate_tracker.name
+                    releases.extend(tracker_releases)
+                    continue
 
-            if not include_history:
-                continue
+                if not include_history:
+                    continue
 
-            canonical_releases = await self.get_canonical_releases(aggregate_tracker.name)
-            source_observations = await self.get_source_release_observations(aggregate_tracker.name)
-            observations_by_id = {
-                observation.id: observation
-                for observation in source_observations
-                if observation.id is not None
-            }
-            sources_by_id = {
-                source.id: source for source in aggregate_tracker.sources if source.id is not None
-            }
-            visible_canonical_releases = [
-                canonical_release
-                for canonical_release in canonical_releases
-                if self._canonical_release_should_be_listed_in_history(
-                    aggregate_tracker,
-                    canonical_release,
-                    observations_by_id,
-                    sources_by_id,
+                canonical_releases = await self.get_canonical_releases(aggregate_tracker.name)
+                source_observations = await self.get_source_release_observations(
+                    aggregate_tracker.name
                 )
-            ]
-            releases.extend(
-                self._canonical_release_to_release(
-                    aggregate_tracker,
-                    canonical_release,
-                    observations_by_id,
+                observations_by_id = {
+                    observation.id: observation
+                    for observation in source_observations
+                    if observation.id is not None
+                }
+                sources_by_id = {
+                    source.id: source
+                    for source in aggregate_tracker.sources
+                    if source.id is not None
+                }
+                visible_canonical_releases = [
+                    canonical_release
+                    for canonical_release in canonical_releases
+                    if self._canonical_release_should_be_listed_in_history(
+                        aggregate_tracker,
+                        canonical_release,
+                        observations_by_id,
+                        sources_by_id,
+                    )
+                ]
+                releases.extend(
+                    self._canonical_release_to_release(
+                        aggregate_tracker,
+                        canonical_release,
+                        observations_by_id,
+                    )
+                    for canonical_release in visible_canonical_releases
                 )
-                for canonical_release in visible_canonical_releases
-            )
 
         releases = [
             release
@@ -3360,19 +3675,43 @@ class SQLiteStorage:
         """
         Fetch recent release records for multiple trackers in one query
 
-        Use a window function to avoid N+1 queries
+        Current projections and runtime configs are loaded once for all trackers, so
+        only the per-channel selection runs per tracker
         Returns:{tracker_name: [Release, ...]}
         """
         if not tracker_names:
             return {}
 
-        result = {name: [] for name in tracker_names}
-        for tracker_name in tracker_names:
-            result[tracker_name] = await self.get_releases(
-                tracker_name=tracker_name,
-                limit=limit_per_tracker,
-                include_history=False,
-            )
+        result: dict[str, list[Release]] = {name: [] for name in tracker_names}
+        trackers = [
+            tracker
+            for tracker in await self.get_all_aggregate_trackers()
+            if tracker.name in result and tracker.id is not None
+        ]
+        if not trackers:
+            return result
+
+        tracker_configs = await self.get_tracker_configs_for_aggregates(trackers)
+        rows_by_tracker_id = await self._get_trackers_current_projection_rows(
+            [tracker.id for tracker in trackers]
+        )
+        for tracker in trackers:
+            tracker_releases = [row["release"] for row in rows_by_tracker_id.get(tracker.id, [])]
+            tracker_config = tracker_configs.get(tracker.name)
+            channels = tracker_config.channels if tracker_config is not None else []
+            if tracker_releases and channels:
+                tracker_releases = list(
+                    self.select_best_releases_by_channel(
+                        tracker_releases,
+                        channels,
+                        sort_mode=tracker_config.version_sort_mode,
+                        use_immutable_identity=True,
+                    ).values()
+                )
+            for tracker_release in tracker_releases:
+                tracker_release.tracker_name = tracker.name
+            tracker_releases.sort(key=self._release_listing_sort_key, reverse=True)
+            result[tracker.name] = tracker_releases[:limit_per_tracker]
 
         return result
 
@@ -3453,9 +3792,6 @@ class SQLiteStorage:
     def _release_matches_channel(
         release: Release, channel, *, channel_source_type: str | None = None
     ) -> bool:
-        from ..config import Channel
-        import re
-
         if isinstance(channel, dict):
             channel = Channel(**channel)
 
@@ -3467,15 +3803,16 @@ class SQLiteStorage:
 
         if channel.include_pattern:
             try:
-                if not re.search(channel.include_pattern, release.tag_name):
+                if not compile_channel_pattern(channel.include_pattern).search(release.tag_name):
                     return False
             except re.error:
                 pass
 
         if channel.exclude_pattern:
             try:
+                exclude_re = compile_channel_pattern(channel.exclude_pattern)
                 if any(
-                    re.search(channel.exclude_pattern, candidate)
+                    exclude_re.search(candidate)
                     for candidate in SQLiteStorage._channel_exclude_match_candidates(release)
                 ):
                     return False
@@ -3494,25 +3831,20 @@ class SQLiteStorage:
 
     @staticmethod
     def _release_order_key(release: Release, sort_mode: str = "published_at") -> tuple:
-        from packaging.version import InvalidVersion, parse as parse_version
-
-        normalized_version = SQLiteStorage._normalize_version_for_ordering(release.version)
-        semver_key: tuple[int, Any] | None = None
-        try:
-            semver_key = (1, parse_version(normalized_version))
-        except InvalidVersion:
-            semver_key = None
-
-        if sort_mode == "semver":
-            if semver_key is not None:
-                return (*semver_key, release.published_at.timestamp())
-            return (0, release.published_at.timestamp())
-
+        semver_key = SQLiteStorage._version_order_key(release.version)
         if semver_key is not None:
             return (*semver_key, release.published_at.timestamp())
-
         return (0, release.published_at.timestamp())
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _version_order_key(version: str) -> tuple[int, Any] | None:
+        """Parse a version for ordering once; the same versions are ranked on every check"""
+        try:
+            return (1, parse_version(SQLiteStorage._normalize_version_for_ordering(version)))
+        except InvalidVersion:
+            return None
+
     @staticmethod
     def _channel_selection_key(channel, index: int) -> str:
         release_channel_key = getattr(channel, "release_channel_key", None)
@@ -3552,6 +3884,11 @@ class SQLiteStorage:
             if use_immutable_identity
             else SQLiteStorage.dedupe_releases_by_identity(releases)
         )
+        # Ordering parses every version, so key each release once rather than once per channel
+        keyed_releases = [
+            (SQLiteStorage._release_order_key(release, sort_mode), release)
+            for release in unique_releases
+        ]
         winners: dict[str, Release] = {}
 
         for index, channel in enumerate(channels):
@@ -3559,29 +3896,31 @@ class SQLiteStorage:
                 if not channel.get("enabled", True):
                     continue
                 channel_name = channel.get("name")
+                match_channel = Channel(**channel)
             else:
                 if not channel.enabled:
                     continue
                 channel_name = channel.name
+                match_channel = channel
 
             if not channel_name:
                 continue
-            channel_candidates = [
-                release
-                for release in unique_releases
-                if SQLiteStorage._release_matches_channel(
-                    release, channel, channel_source_type=channel_source_type
-                )
-            ]
+            best = max(
+                (
+                    keyed
+                    for keyed in keyed_releases
+                    if SQLiteStorage._release_matches_channel(
+                        keyed[1], match_channel, channel_source_type=channel_source_type
+                    )
+                ),
+                key=itemgetter(0),
+                default=None,
+            )
 
-            if not channel_candidates:
+            if best is None:
                 continue
 
-            winner = max(
-                channel_candidates,
-                key=lambda release: SQLiteStorage._release_order_key(release, sort_mode),
-            )
-            winner = SQLiteStorage._copy_release_with_channel_name(winner, channel_name)
+            winner = SQLiteStorage._copy_release_with_channel_name(best[1], channel_name)
             winners[SQLiteStorage._channel_selection_key(channel, index)] = winner
 
         return winners
@@ -3682,18 +4021,28 @@ class SQLiteStorage:
 
     async def get_tracker_status(self, name: str) -> TrackerStatus | None:
         """Get tracker status."""
-        db = await self._get_connection()
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM tracker_status WHERE name = ?", (name,))
-        row = await cursor.fetchone()
+        async with self._read_connection() as db:
+            cursor = await db.execute("SELECT * FROM tracker_status WHERE name = ?", (name,))
+            row = await cursor.fetchone()
         return self._row_to_tracker_status(row) if row else None
 
+    async def get_tracker_statuses(self, names: list[str]) -> dict[str, TrackerStatus]:
+        """Get tracker statuses keyed by tracker name."""
+        if not names:
+            return {}
+        placeholders = ", ".join("?" for _ in names)
+        async with self._read_connection() as db:
+            cursor = await db.execute(
+                f"SELECT * FROM tracker_status WHERE name IN ({placeholders})", tuple(names)
+            )
+            rows = await cursor.fetchall()
+        return {row["name"]: self._row_to_tracker_status(row) for row in rows}
+
     async def get_all_tracker_status(self) -> list[TrackerStatus]:
         """Get all tracker statuses."""
-        db = await self._get_connection()
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM tracker_status")
-        rows = await cursor.fetchall()
+        async with self._read_connection() as db:
+            cursor = await db.execute("SELECT * FROM tracker_status")
+            rows = await cursor.fetchall()
         return [self._row_to_tracker_status(row) for row in rows]
 
     async def delete_tracker_status(self, name: str):
@@ -3703,17 +4052,37 @@ class SQLiteStorage:
         await db.commit()
 
     async def get_stats(self) -> ReleaseStats:
-        """Get statistics"""
+        """Get statistics, reusing the last result until data changes or the TTL expires"""
+        db = await self._get_connection()
+        async with self._stats_cache_lock:
+            total_changes = db.total_changes
+            cached = self._stats_cache
+            if cached is not None:
+                cached_at, cached_total_changes, cached_stats = cached
+                if (
+                    cached_total_changes == total_changes
+                    and time.monotonic() - cached_at < STATS_CACHE_TTL_SECONDS
+                ):
+                    return cached_stats
+
+            stats = await self._compute_stats()
+            self._stats_cache = (time.monotonic(), total_changes, stats)
+            return stats
+
+    async def _compute_stats(self) -> ReleaseStats:
         aggregate_trackers = await self.get_all_aggregate_trackers()
         trackers_by_name = {tracker.name: tracker for tracker in aggregate_trackers}
         releases: list[Release] = []
-        for aggregate_tracker in aggregate_trackers:
-            if aggregate_tracker.id is None:
-                continue
-            tracker_releases = await self.get_tracker_release_history_releases(aggregate_tracker.id)
-            for tracker_release in tracker_releases:
-                tracker_release.tracker_name = aggregate_tracker.name
-            releases.extend(tracker_releases)
+        async with self._read_connection() as read_db:
+            for aggregate_tracker in aggregate_trackers:
+                if aggregate_tracker.id is None:
+                    continue
+                tracker_releases = await self.get_tracker_release_history_releases(
+                    aggregate_tracker.id, db=read_db
+                )
+                for tracker_release in tracker_releases:
+                    tracker_release.tracker_name = aggregate_tracker.name
+                releases.extend(tracker_releases)
 
         total_trackers = await self.get_total_tracker_configs_count()
         if total_trackers == 0 and releases:
@@ -3811,7 +4180,7 @@ class SQLiteStorage:
     @staticmethod
     def _row_to_release(row) -> Release:
         """Convert a database row to a Release object"""
-        return Release(
+        return Release.model_construct(
             id=row["id"],
             tracker_name=row["tracker_name"],
             name=row["name"],
@@ -3830,7 +4199,9 @@ class SQLiteStorage:
     # ==================== Credential management ====================
 
     async def create_credential(self, credential) -> int:
-        return await sqlite_credentials.create_credential(self, credential)
+        credential_id = await sqlite_credentials.create_credential(self, credential)
+        self.invalidate_credentials_cache()
+        return credential_id
 
     async def get_all_credentials(self) -> list:
         return await sqlite_credentials.get_all_credentials(self)
@@ -3838,6 +4209,9 @@ class SQLiteStorage:
     async def get_credentials_paginated(self, skip: int = 0, limit: int = 20) -> list:
         return await sqlite_credentials.get_credentials_paginated(self, skip, limit)
 
+    async def get_credentials_page(self, skip: int = 0, limit: int = 20) -> tuple[list, int]:
+        return await sqlite_credentials.get_credentials_page(self, skip, limit)
+
     async def get_total_credentials_count(self) -> int:
         return await sqlite_credentials.get_total_credentials_count(self)
 
@@ -3845,13 +4219,23 @@ class SQLiteStorage:
         return await sqlite_credentials.get_credential(self, credential_id)
 
     async def get_credential_by_name(self, name: str):
-        return await sqlite_credentials.get_credential_by_name(self, name)
+        cached = self._credentials_by_name_cache.get(name)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        credential = await sqlite_credentials.get_credential_by_name(self, name)
+        if credential is not None:
+            self._credentials_by_name_cache[name] = credential.model_copy(deep=True)
+        return credential
 
     async def update_credential(self, credential_id: int, credential) -> bool:
-        return await sqlite_credentials.update_credential(self, credential_id, credential)
+        updated = await sqlite_credentials.update_credential(self, credential_id, credential)
+        self.invalidate_credentials_cache()
+        return updated
 
     async def delete_credential(self, credential_id: int) -> bool:
-        return await sqlite_credentials.delete_credential(self, credential_id)
+        deleted = await sqlite_credentials.delete_credential(self, credential_id)
+        self.invalidate_credentials_cache()
+        return deleted
 
     async def get_credential_references(self, credential) -> dict[str, list[dict[str, Any]]]:
         return await sqlite_credentials.get_credential_references(self, credential)
@@ -4234,15 +4618,14 @@ class SQLiteStorage:
     @classmethod
     def _row_to_notifier(cls, row) -> Notifier:
         """Convert a database row to a Notifier object"""
-        import json
-
         try:
             events = json.loads(row["events"]) if row["events"] else []
         except (json.JSONDecodeError, TypeError):
             events = []
 
         keys = set(row.keys())
-        return Notifier(
+        # Rows are only written through create/update_notifier, which validate first
+        return Notifier.model_construct(
             id=row["id"],
             name=row["name"],
             type=row["type"],
@@ -4261,13 +4644,12 @@ class SQLiteStorage:
         """Get all notifiers, preferring the memory cache to avoid frequent database queries."""
         if self._notifiers_cache is not None:
             return list(self._notifiers_cache)
-        db = await self._get_connection()
-        db.row_factory = aiosqlite.Row
-        async with db.execute("SELECT * FROM notifiers ORDER BY created_at DESC") as cursor:
-            rows = await cursor.fetchall()
-            notifiers = [self._row_to_notifier(row) for row in rows]
-            self._notifiers_cache = notifiers
-            return list(notifiers)
+        async with self._read_connection() as db:
+            async with db.execute("SELECT * FROM notifiers ORDER BY created_at DESC") as cursor:
+                rows = await cursor.fetchall()
+        notifiers = [self._row_to_notifier(row) for row in rows]
+        self._notifiers_cache = notifiers
+        return list(notifiers)
 
     async def get_total_notifiers_count(self) -> int:
         """Get the notifier count."""
@@ -4286,6 +4668,23 @@ class SQLiteStorage:
             rows = await cursor.fetchall()
             return [self._row_to_notifier(row) for row in rows]
 
+    async def get_notifiers_page(
+        self, skip: int = 0, limit: int = 20
+    ) -> tuple[list[Notifier], int]:
+        """Get a page of notifiers together with the total notifier count"""
+        db = await self._get_connection()
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            "SELECT *, COUNT(*) OVER () AS total FROM notifiers "
+            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (limit, skip),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        if not rows:
+            # A page past the end carries no total column to read
+            return [], await self.get_total_notifiers_count() if skip else 0
+        return [self._row_to_notifier(row) for row in rows], rows[0]["total"]
+
     async def get_notifier(self, notifier_id: int) -> Notifier | None:
         """Get a single notifier"""
         db = await self._get_connection()
@@ -4304,8 +4703,6 @@ class SQLiteStorage:
 
     async def create_notifier(self, notifier_data: dict) -> Notifier:
         """Create a notifier"""
-        import json
-
         now = datetime.now().isoformat()
 
         # Ensure name uniqueness
@@ -4346,8 +4743,6 @@ class SQLiteStorage:
 
     async def update_notifier(self, notifier_id: int, notifier_data: dict) -> Notifier:
         """Update a notifier"""
-        import json
-
         current = await self.get_notifier(notifier_id)
         if not current:
             raise ValueError(f"Notifier with id {notifier_id} not found")
@@ -4409,11 +4804,10 @@ class SQLiteStorage:
 
     async def get_all_settings(self) -> dict:
         """Get all system settings"""
-        db = await self._get_connection()
-        db.row_factory = aiosqlite.Row
-        async with db.execute("SELECT * FROM settings") as cursor:
-            rows = await cursor.fetchall()
-            return {row["key"]: row["value"] for row in rows}
+        async with self._read_connection() as db:
+            async with db.execute("SELECT * FROM settings") as cursor:
+                rows = await cursor.fetchall()
+        return {row["key"]: row["value"] for row in rows}
 
     async def get_setting(self, key: str) -> str | None:
         """Get one setting"""
@@ -4506,25 +4900,47 @@ class SQLiteStorage:
     # ==================== OIDC Provider Operations ====================
 
     async def save_oauth_provider(self, provider):
-        return await sqlite_auth_oidc.save_oauth_provider(self, provider)
+        saved = await sqlite_auth_oidc.save_oauth_provider(self, provider)
+        self.invalidate_oauth_providers_cache()
+        return saved
 
     async def get_total_oauth_providers_count(self) -> int:
         return await sqlite_auth_oidc.get_total_oauth_providers_count(self)
 
     async def list_oauth_providers(self, enabled_only: bool = False) -> list:
-        return await sqlite_auth_oidc.list_oauth_providers(self, enabled_only)
+        cache_key = "enabled" if enabled_only else "all"
+        providers = self._oauth_provider_lists_cache.get(cache_key)
+        if providers is None:
+            providers = await sqlite_auth_oidc.list_oauth_providers(self, enabled_only)
+            self._oauth_provider_lists_cache[cache_key] = providers
+        return list(providers)
+
+    async def list_public_oauth_providers(self) -> list[dict[str, Any]]:
+        providers = self._oauth_provider_lists_cache.get("public")
+        if providers is None:
+            providers = await sqlite_auth_oidc.list_public_oauth_providers(self)
+            self._oauth_provider_lists_cache["public"] = providers
+        return list(providers)
 
     async def get_oauth_provider(self, slug: str):
-        return await sqlite_auth_oidc.get_oauth_provider(self, slug)
+        cached = self._oauth_providers_by_slug_cache.get(slug)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        provider = await sqlite_auth_oidc.get_oauth_provider(self, slug)
+        if provider is not None:
+            self._oauth_providers_by_slug_cache[slug] = provider.model_copy(deep=True)
+        return provider
 
     async def get_oauth_provider_by_id(self, provider_id: int):
         return await sqlite_auth_oidc.get_oauth_provider_by_id(self, provider_id)
 
     async def update_oauth_provider(self, provider_id: int, provider) -> None:
         await sqlite_auth_oidc.update_oauth_provider(self, provider_id, provider)
+        self.invalidate_oauth_providers_cache()
 
     async def delete_oauth_provider(self, provider_id: int) -> None:
         await sqlite_auth_oidc.delete_oauth_provider(self, provider_id)
+        self.invalidate_oauth_providers_cache()
 
     def _row_to_oidc_provider(self, row, decrypt_secret: bool = False):
         return sqlite_auth_oidc._row_to_oidc_provider(self, row, decrypt_secret)
@@ -4532,13 +4948,29 @@ class SQLiteStorage:
     # ==================== OAuth State Operations ====================
 
     async def save_oauth_state(self, state: str, provider_slug: str, code_verifier: str) -> None:
-        await sqlite_auth_oidc.save_oauth_state(self, state, provider_slug, code_verifier)
+        self._oauth_states.pop(state, None)
+        self._oauth_states[state] = OAuthState(
+            state=state,
+            provider_slug=provider_slug,
+            code_verifier=code_verifier,
+            expires_at=datetime.now() + OAUTH_STATE_TTL,
+        )
+        # Insertion order is expiry order, so the oldest pending login goes first
+        while len(self._oauth_states) > OAUTH_STATE_CACHE_SIZE:
+            del self._oauth_states[next(iter(self._oauth_states))]
 
-    async def get_and_delete_oauth_state(self, state: str):
-        return await sqlite_auth_oidc.get_and_delete_oauth_state(self, state)
+    async def get_and_delete_oauth_state(self, state: str) -> OAuthState | None:
+        oauth_state = self._oauth_states.pop(state, None)
+        if oauth_state is None or oauth_state.expires_at < datetime.now():
+            return None
+        return oauth_state
 
     async def cleanup_expired_oauth_states(self) -> None:
-        await sqlite_auth_oidc.cleanup_expired_oauth_states(self)
+        now = datetime.now()
+        for state, oauth_state in list(self._oauth_states.items()):
+            if oauth_state.expires_at >= now:
+                break
+            del self._oauth_states[state]
 
     # ==================== OIDC User Operations ====================
 
@@ -116,9 +116,13 @@ async def load_tracker_sources(
 
 
 async def load_aggregate_tracker_from_row(
-    storage: "SQLiteStorage", db: aiosqlite.Connection, row: aiosqlite.Row
+    storage: "SQLiteStorage",
+    db: aiosqlite.Connection,
+    row: aiosqlite.Row,
+    sources: list[TrackerSource] | None = None,
 ) -> AggregateTracker:
-    sources = await load_tracker_sources(storage, db, row["id"])
+    if sources is None:
+        sources = await load_tracker_sources(storage, db, row["id"])
     primary_source_key = None
     if row["primary_changelog_source_id"] is not None:
         primary_source = next(
@@ -285,6 +289,7 @@ async def create_aggregate_tracker(
         (primary_source_id, now.isoformat(), aggregate_tracker_id),
     )
     await db.commit()
+    storage.invalidate_tracker_configs()
 
     created_tracker = await get_aggregate_tracker(storage, tracker.name)
     if created_tracker is None:
@@ -307,11 +312,29 @@ async def get_aggregate_tracker(storage: "SQLiteStorage", name: str) -> Aggregat
 async def get_all_aggregate_trackers(storage: "SQLiteStorage") -> list[AggregateTracker]:
     if not await storage._aggregate_schema_available():
         return []
-    db = await storage._get_connection()
-    db.row_factory = aiosqlite.Row
-    cursor = await db.execute("SELECT * FROM aggregate_trackers ORDER BY name ASC")
-    rows = await cursor.fetchall()
-    return [await load_aggregate_tracker_from_row(storage, db, row) for row in rows]
+    async with storage._read_connection() as db:
+        db.row_factory = aiosqlite.Row
+        cursor = await db.execute("SELECT * FROM aggregate_trackers ORDER BY name ASC")
+        rows = await cursor.fetchall()
+
+        # Load every tracker's sources in one pass instead of one query per tracker
+        cursor = await db.execute("""
+            SELECT *
+            FROM aggregate_tracker_sources
+            ORDER BY aggregate_tracker_id ASC, source_rank ASC, id ASC
+            """)
+        sources_by_tracker_id: dict[int, list[TrackerSource]] = {}
+        for source_row in await cursor.fetchall():
+            sources_by_tracker_id.setdefault(source_row["aggregate_tracker_id"], []).append(
+                row_to_tracker_source(source_row)
+            )
+
+        return [
+            await load_aggregate_tracker_from_row(
+                storage, db, row, sources_by_tracker_id.get(row["id"], [])
+            )
+            for row in rows
+        ]
 
 
 async def get_executor_binding(
@@ -347,13 +370,12 @@ async def update_aggregate_tracker(
 ) -> AggregateTracker:
     db = await storage._get_connection()
     db.row_factory = aiosqlite.Row
-    if tracker.id is not None:
-        cursor = await db.execute("SELECT * FROM aggregate_trackers WHERE id = ?", (tracker.id,))
-    else:
-        cursor = await db.execute(
-            "SELECT * FROM aggregate_trackers WHERE name = ?", (tracker.name,)
-        )
-
+    # Check existence before writing so a missing tracker never opens a write transaction
+    # on the shared connection
+    cursor = await db.execute(
+        f"SELECT id FROM aggregate_trackers WHERE {'id' if tracker.id is not None else 'name'} = ?",
+        (tracker.id if tracker.id is not None else tracker.name,),
+    )
     existing_row = await cursor.fetchone()
     if existing_row is None:
         raise ValueError(f"Aggregate tracker not found: {tracker.name}")
@@ -381,6 +403,7 @@ async def update_aggregate_tracker(
             existing_row["id"],
         ),
     )
+
     primary_source_id = await persist_tracker_sources(
         storage,
         db,
@@ -397,6 +420,7 @@ async def update_aggregate_tracker(
         (primary_source_id, now, existing_row["id"]),
     )
     await db.commit()
+    storage.invalidate_tracker_configs()
 
     updated_tracker = await get_aggregate_tracker(storage, tracker.name)
     if updated_tracker is None:
@@ -406,57 +430,57 @@ async def update_aggregate_tracker(
 
 async def delete_aggregate_tracker(storage: "SQLiteStorage", name: str) -> None:
     db = await storage._get_connection()
+    await delete_aggregate_tracker_rows(db, name)
+    await db.commit()
+    storage.invalidate_tracker_configs()
+
+
+async def delete_aggregate_tracker_rows(db: aiosqlite.Connection, name: str) -> bool:
+    """Delete an aggregate tracker and its sources without committing
+
+    Returns False when no aggregate tracker with that name exists
+    """
     db.row_factory = aiosqlite.Row
+    # Check existence before writing so a missing tracker never opens a write transaction
+    # on the shared connection
     cursor = await db.execute("SELECT id FROM aggregate_trackers WHERE name = ?", (name,))
     row = await cursor.fetchone()
     if row is None:
-        return
+        return False
 
     aggregate_tracker_id = row["id"]
-    source_cursor = await db.execute(
-        "SELECT id FROM aggregate_tracker_sources WHERE aggregate_tracker_id = ?",
-        (aggregate_tracker_id,),
-    )
-    source_rows = await source_cursor.fetchall()
-    source_ids = [source_row["id"] for source_row in source_rows]
-
-    canonical_cursor = await db.execute(
-        "SELECT id FROM canonical_releases WHERE aggregate_tracker_id = ?",
-        (aggregate_tracker_id,),
-    )
-    canonical_rows = await canonical_cursor.fetchall()
-    canonical_release_ids = [canonical_row["id"] for canonical_row in canonical_rows]
-
-    if canonical_release_ids:
-        canonical_placeholders = ", ".join("?" for _ in canonical_release_ids)
-        await db.execute(
-            f"DELETE FROM canonical_release_observations WHERE canonical_release_id IN ({canonical_placeholders})",
-            tuple(canonical_release_ids),
+    await db.execute("DELETE FROM aggregate_trackers WHERE id = ?", (aggregate_tracker_id,))
+    # The child id sets are resolved inside SQLite so each cascade step is one statement
+    await db.execute(
+        """
+        DELETE FROM canonical_release_observations
+        WHERE canonical_release_id IN (
+            SELECT id FROM canonical_releases WHERE aggregate_tracker_id = ?
         )
-
+        OR source_release_observation_id IN (
+            SELECT sro.id
+            FROM source_release_observations sro
+            JOIN aggregate_tracker_sources ats ON ats.id = sro.tracker_source_id
+            WHERE ats.aggregate_tracker_id = ?
+        )
+        """,
+        (aggregate_tracker_id, aggregate_tracker_id),
+    )
     await db.execute(
         "DELETE FROM canonical_releases WHERE aggregate_tracker_id = ?",
         (aggregate_tracker_id,),
     )
-
-    if source_ids:
-        source_placeholders = ", ".join("?" for _ in source_ids)
-        await db.execute(
-            f"DELETE FROM canonical_release_observations WHERE source_release_observation_id IN (SELECT id FROM source_release_observations WHERE tracker_source_id IN ({source_placeholders}))",
-            tuple(source_ids),
-        )
-        await db.execute(
-            f"DELETE FROM source_release_observations WHERE tracker_source_id IN ({source_placeholders})",
-            tuple(source_ids),
-        )
-
     await db.execute(
-        "UPDATE aggregate_trackers SET primary_changelog_source_id = NULL WHERE id = ?",
+        """
+        DELETE FROM source_release_observations
+        WHERE tracker_source_id IN (
+            SELECT id FROM aggregate_tracker_sources WHERE aggregate_tracker_id = ?
+        )
+        """,
         (aggregate_tracker_id,),
     )
     await db.execute(
         "DELETE FROM aggregate_tracker_sources WHERE aggregate_tracker_id = ?",
         (aggregate_tracker_id,),
     )
-    await db.execute("DELETE FROM aggregate_trackers WHERE id = ?", (aggregate_tracker_id,))
-    await db.commit()
+    return True
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
 from ..models import Session, User
-from ..oidc_models import OIDCProvider, OAuthState
+from ..oidc_models import OIDCProvider
 
 if TYPE_CHECKING:
     from .sqlite import SQLiteStorage
@@ -241,16 +241,28 @@ async def get_total_oauth_providers_count(storage: "SQLiteStorage") -> int:
 async def list_oauth_providers(
     storage: "SQLiteStorage", enabled_only: bool = False
 ) -> list[OIDCProvider]:
-    db = await storage._get_connection()
-    db.row_factory = aiosqlite.Row
-    if enabled_only:
-        cursor = await db.execute("SELECT * FROM oauth_providers WHERE enabled = 1 ORDER BY name")
-    else:
-        cursor = await db.execute("SELECT * FROM oauth_providers ORDER BY name")
-    rows = await cursor.fetchall()
+    async with storage._read_connection() as db:
+        if enabled_only:
+            cursor = await db.execute(
+                "SELECT * FROM oauth_providers WHERE enabled = 1 ORDER BY name"
+            )
+        else:
+            cursor = await db.execute("SELECT * FROM oauth_providers ORDER BY name")
+        rows = await cursor.fetchall()
     return [_row_to_oidc_provider(storage, row) for row in rows]
 
 
+async def list_public_oauth_providers(storage: "SQLiteStorage") -> list[dict[str, Any]]:
+    """Enabled providers with only the fields shown on the login page"""
+    async with storage._read_connection() as db:
+        cursor = await db.execute(
+            "SELECT slug, name, icon_url, description FROM oauth_providers "
+            "WHERE enabled = 1 ORDER BY name"
+        )
+        rows = await cursor.fetchall()
+    return [dict(row) for row in rows]
+
+
 async def get_oauth_provider(storage: "SQLiteStorage", slug: str) -> OIDCProvider | None:
     db = await storage._get_connection()
     db.row_factory = aiosqlite.Row
@@ -363,42 +375,6 @@ def _row_to_oidc_provider(
     )
 
 
-async def save_oauth_state(
-    storage: "SQLiteStorage", state: str, provider_slug: str, code_verifier: str
-) -> None:
-    expires_at = (datetime.now() + timedelta(minutes=10)).isoformat()
-    db = await storage._get_connection()
-    await db.execute(
-        "INSERT OR REPLACE INTO oauth_states (state, provider_slug, code_verifier, expires_at) VALUES (?, ?, ?, ?)",
-        (state, provider_slug, code_verifier, expires_at),
-    )
-    await db.commit()
-
-
-async def get_and_delete_oauth_state(storage: "SQLiteStorage", state: str) -> OAuthState | None:
-    db = await storage._get_connection()
-    db.row_factory = aiosqlite.Row
-    cursor = await db.execute("SELECT * FROM oauth_states WHERE state = ?", (state,))
-    row = await cursor.fetchone()
-    if not row:
-        return None
-    await db.execute("DELETE FROM oauth_states WHERE state = ?", (state,))
-    await db.commit()
-    return OAuthState(
-        state=row["state"],
-        provider_slug=row["provider_slug"],
-        code_verifier=row["code_verifier"],
-        expires_at=datetime.fromisoformat(row["expires_at"]),
-    )
-
-
-async def cleanup_expired_oauth_states(storage: "SQLiteStorage") -> None:
-    now = datetime.now().isoformat()
-    db = await storage._get_connection()
-    await db.execute("DELETE FROM oauth_states WHERE expires_at < ?", (now,))
-    await db.commit()
-
-
 async def get_user_by_oauth(storage: "SQLiteStorage", provider: str, oauth_sub: str) -> User | None:
     db = await storage._get_connection()
     db.row_factory = aiosqlite.Row
@@ -76,6 +76,24 @@ async def get_credentials_paginated(
     return [_row_to_credential(storage, row) for row in rows]
 
 
+async def get_credentials_page(
+    storage: "SQLiteStorage", skip: int = 0, limit: int = 20
+) -> tuple[list[Credential], int]:
+    db = await storage._get_connection()
+    db.row_factory = aiosqlite.Row
+    # The window count rides along with the page rows, so one statement yields both
+    cursor = await db.execute(
+        "SELECT *, COUNT(*) OVER () AS total FROM credentials "
+        "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+        (limit, skip),
+    )
+    rows = await cursor.fetchall()
+    if not rows:
+        # A page past the end carries no total column to read
+        return [], await get_total_credentials_count(storage) if skip else 0
+    return [_row_to_credential(storage, row) for row in rows], rows[0]["total"]
+
+
 async def get_total_credentials_count(storage: "SQLiteStorage") -> int:
     db = await storage._get_connection()
     cursor = await db.execute("SELECT COUNT(*) FROM credentials")
@@ -92,10 +110,9 @@ async def get_credential(storage: "SQLiteStorage", credential_id: int) -> Creden
 
 
 async def get_credential_by_name(storage: "SQLiteStorage", name: str) -> Credential | None:
-    db = await storage._get_connection()
-    db.row_factory = aiosqlite.Row
-    cursor = await db.execute("SELECT * FROM credentials WHERE name = ?", (name,))
-    row = await cursor.fetchone()
+    async with storage._read_connection() as db:
+        cursor = await db.execute("SELECT * FROM credentials WHERE name = ?", (name,))
+        row = await cursor.fetchone()
     return _row_to_credential(storage, row) if row else None
 
 
@@ -234,9 +251,13 @@ def _row_to_credential(storage: "SQLiteStorage", row: Any) -> Credential:
     if "secrets" in keys:
         secrets_payload = storage._decrypt_nested_strings(storage._load_json(row["secrets"]))
     secrets = cast(dict[str, Any], secrets_payload or {})
+    # Rows were validated on the way in, so apply Credential's token/secret
+    # normalization here and skip re-validating every listed credential
     if token and "token" not in secrets:
         secrets["token"] = token
-    return Credential(
+    if not token and isinstance(secrets.get("token"), str):
+        token = secrets["token"]
+    return Credential.model_construct(
         id=row["id"],
         name=row["name"],
         type=row["type"],
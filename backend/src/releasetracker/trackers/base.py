@@ -1,12 +1,19 @@
 """Tracker base module"""
 
+import re
 from abc import ABC, abstractmethod
 
+from ..config import Channel, compile_channel_pattern
 from ..models import Release
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Substrings that mark a version as a pre-release when no channels are configured
+PRERELEASE_VERSION_KEYWORDS = ("alpha", "beta", "rc", "pre", "dev", "snapshot")
+# Tracker types whose releases carry a platform-provided prerelease flag
+RELEASE_TYPE_FILTER_TRACKER_TYPES = frozenset({"github", "gitlab", "gitea"})
+
 
 class BaseTracker(ABC):
     """Tracker abstract base class"""
@@ -48,21 +55,16 @@ class BaseTracker(ABC):
                 return False
 
             version_lower = release.version.lower()
-            prerelease_keywords = ["alpha", "beta", "rc", "pre", "dev", "snapshot"]
-
-            for keyword in prerelease_keywords:
-                if keyword in version_lower:
-                    return False
+            if any(keyword in version_lower for keyword in PRERELEASE_VERSION_KEYWORDS):
+                return False
 
         # Step 2: include pattern filtering (include_pattern)
         # If an include pattern is defined, the version must match to pass
         include_pattern = filter_config.get("include_pattern")
         if include_pattern:
-            import re
-
             try:
                 # Use search matching to allow partial matches
-                if not re.search(include_pattern, release.tag_name):
+                if not compile_channel_pattern(include_pattern).search(release.tag_name):
                     return False
             except re.error as e:
                 # On regex errors, log and skip this rule
@@ -73,12 +75,11 @@ class BaseTracker(ABC):
         # If an exclude pattern is defined, matching versions are excluded; takes precedence over include
         exclude_pattern = filter_config.get("exclude_pattern")
         if exclude_pattern:
-            import re
-
             try:
                 # Exclude immediately if the exclude pattern matches
+                exclude_re = compile_channel_pattern(exclude_pattern)
                 if any(
-                    re.search(exclude_pattern, candidate)
+                    exclude_re.search(candidate)
                     for candidate in self._exclude_match_candidates(release)
                 ):
                     return False
@@ -99,8 +100,6 @@ class BaseTracker(ABC):
         Returns:
             Dictionary keyed by channel identifier (name or type), with filtered releases as values
         """
-        from ..config import Channel
-
         channels = self.config.get("channels", [])
         result = {}
 
@@ -133,9 +132,6 @@ class BaseTracker(ABC):
         Returns:
             True when the release belongs to the channel, otherwise False.
         """
-        from ..config import Channel
-        import re
-
         if isinstance(channel, dict):
             channel = Channel(**channel)
 
@@ -149,7 +145,7 @@ class BaseTracker(ABC):
 
         if channel.include_pattern:
             try:
-                if not re.search(channel.include_pattern, release.tag_name):
+                if not compile_channel_pattern(channel.include_pattern).search(release.tag_name):
                     return False
             except re.error as e:
                 logger.error(
@@ -159,8 +155,9 @@ class BaseTracker(ABC):
 
         if channel.exclude_pattern:
             try:
+                exclude_re = compile_channel_pattern(channel.exclude_pattern)
                 if any(
-                    re.search(channel.exclude_pattern, candidate)
+                    exclude_re.search(candidate)
                     for candidate in self._exclude_match_candidates(release)
                 ):
                     return False
@@ -174,7 +171,7 @@ class BaseTracker(ABC):
 
     @staticmethod
     def _supports_release_type_filter(release: Release) -> bool:
-        return release.tracker_type in {"github", "gitlab", "gitea"}
+        return release.tracker_type in RELEASE_TYPE_FILTER_TRACKER_TYPES
 
     @staticmethod
     def _exclude_match_candidates(release: Release) -> list[str]:
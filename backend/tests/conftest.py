@@ -95,6 +95,7 @@ def client(storage, system_key_manager):
     async def mock_lifespan(_app):
         _app.state.storage = storage
         _app.state.system_key_manager = system_key_manager
+        _app.state.auth_service = AuthService(storage, system_key_manager)
 
         _app.state.scheduler_host = scheduler_host
         _app.state.scheduler = mock_scheduler
@@ -2,14 +2,15 @@
 
 from datetime import datetime
 import json
+import sqlite3
 
 import aiosqlite
 import pytest
 
 from releasetracker.config import TrackerConfig
-from releasetracker.models import AggregateTracker, TrackerSource
+from releasetracker.models import AggregateTracker, TrackerSource, TrackerStatus
 from releasetracker.models import Release
-from releasetracker.storage.sqlite import SQLiteStorage
+from releasetracker.storage.sqlite import SQLiteStorage, TrackerReleaseHistoryUpsert
 from releasetracker.trackers.helm import HelmTracker
 
 
@@ -938,6 +939,74 @@ async def test_delete_aggregate_tracker_removes_sources(storage):
     assert source_count[0] == 0
 
 
+@pytest.mark.asyncio
+async def test_delete_aggregate_tracker_removes_observations_and_canonicals(storage):
+    aggregate_tracker = await storage.create_aggregate_tracker(
+        AggregateTracker(
+            name="aggregate-cascade",
+            primary_changelog_source_key="repo",
+            sources=[
+                TrackerSource(
+                    source_key="repo",
+                    source_type="github",
+                    source_rank=0,
+                    source_config={"repo": "owner/aggregate-cascade"},
+                )
+            ],
+        )
+    )
+    assert aggregate_tracker.id is not None
+    release = Release(
+        tracker_name="aggregate-cascade",
+        tracker_type="github",
+        version="v1.0.0",
+        name="Release v1.0.0",
+        tag_name="v1.0.0",
+        url="https://example.com/release/v1.0.0",
+        published_at=datetime.fromisoformat("2026-04-23T00:00:00+00:00"),
+        prerelease=False,
+    )
+    await storage.save_source_observations(
+        aggregate_tracker.id, aggregate_tracker.sources[0], [release]
+    )
+    assert await storage.get_canonical_releases("aggregate-cascade")
+
+    assert await storage.delete_tracker("aggregate-cascade") is True
+
+    async with aiosqlite.connect(storage.db_path) as db:
+        counts = [
+            (await (await db.execute(f"SELECT COUNT(*) FROM {table}")).fetchone())[0]
+            for table in (
+                "source_release_observations",
+                "canonical_releases",
+                "canonical_release_observations",
+            )
+        ]
+
+    assert counts == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_delete_tracker_removes_runtime_config_and_status(storage):
+    await storage.save_tracker_config(
+        TrackerConfig(name="delete-all", type="github", repo="owner/delete-all", interval=60)
+    )
+    await storage.update_tracker_status(
+        TrackerStatus(name="delete-all", type="github", last_version="v1.0.0")
+    )
+
+    assert await storage.delete_tracker("delete-all") is True
+
+    assert await storage.delete_tracker("delete-all") is False
+    assert await storage.get_aggregate_tracker("delete-all") is None
+    assert await storage.get_tracker_config("delete-all") is None
+    assert await storage.get_tracker_status("delete-all") is None
+    async with aiosqlite.connect(storage.db_path) as db:
+        runtime_row = await (
+            await db.execute("SELECT COUNT(*) FROM trackers WHERE name = ?", ("delete-all",))
+        ).fetchone()
+    assert runtime_row is not None and runtime_row[0] == 0
+
 
 @pytest.mark.asyncio
 async def test_get_tracker_config_prefers_aggregate_source_fields_over_stale_legacy_row(storage):
@@ -2223,3 +2292,102 @@ async def test_backfill_existing_helm_observations_rebuilds_canonicals_idempoten
 
     assert stale_canonical_rows is not None and stale_canonical_rows["count"] == 0
     assert len(provenance_rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_tracker_release_history_batch_rows_are_visible_to_read_pool(storage):
+    aggregate_tracker = await storage.create_aggregate_tracker(
+        AggregateTracker(
+            name="history-batch",
+            primary_changelog_source_key="repo",
+            sources=[
+                TrackerSource(
+                    source_key="repo",
+                    source_type="github",
+                    source_config={"repo": "owner/history-batch"},
+                )
+            ],
+        )
+    )
+    repo_source = aggregate_tracker.sources[0]
+    releases = [
+        Release(
+            tracker_name="history-batch",
+            tracker_type="github",
+            version=version,
+            name=version,
+            tag_name=version,
+            url=f"https://example.com/releases/{version}",
+            published_at=datetime.fromisoformat("2026-04-23T00:00:00+00:00"),
+            prerelease=False,
+        )
+        for version in ["v1.0.0", "v1.1.0"]
+    ]
+    source_fetch_run_id = await storage.create_source_fetch_run(
+        repo_source.id,
+        trigger_mode="manual",
+    )
+    source_history_ids = await storage.append_source_history_for_run(
+        source_fetch_run_id,
+        repo_source,
+        releases,
+        aggregate_tracker_id=aggregate_tracker.id,
+    )
+
+    entries = [
+        TrackerReleaseHistoryUpsert(
+            release=release,
+            primary_source_release_history_id=source_history_ids[
+                storage.release_identity_key_for_source(release, source_type="github")
+            ],
+            source_type="github",
+        )
+        for release in releases
+    ]
+    results = await storage.upsert_tracker_release_history_batch(aggregate_tracker.id, entries)
+
+    assert [is_new for _, is_new in results] == [True, True]
+    assert await storage.upsert_tracker_release_history_batch(aggregate_tracker.id, []) == []
+
+    history = await storage.get_tracker_release_history_releases(aggregate_tracker.id)
+    assert sorted(release.version for release in history) == ["v1.0.0", "v1.1.0"]
+
+    async with storage._read_connection() as read_db:
+        pooled_history = await storage.get_tracker_release_history_releases(
+            aggregate_tracker.id, db=read_db
+        )
+        assert sorted(release.version for release in pooled_history) == ["v1.0.0", "v1.1.0"]
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            await read_db.execute("DELETE FROM tracker_release_history")
+
+
+@pytest.mark.asyncio
+async def test_get_all_aggregate_trackers_groups_sources_by_tracker(storage):
+    for name, repos in (("bulk-beta", ["owner/b2", "owner/b1"]), ("bulk-alpha", ["owner/a"])):
+        await storage.create_aggregate_tracker(
+            AggregateTracker(
+                name=name,
+                primary_changelog_source_key="source-0",
+                sources=[
+                    TrackerSource(
+                        source_key=f"source-{index}",
+                        source_type="github",
+                        source_rank=index,
+                        source_config={"repo": repo},
+                    )
+                    for index, repo in enumerate(repos)
+                ],
+            )
+        )
+
+    trackers = await storage.get_all_aggregate_trackers()
+
+    assert [tracker.name for tracker in trackers] == ["bulk-alpha", "bulk-beta"]
+    for tracker in trackers:
+        loaded_tracker = await storage.get_aggregate_tracker(tracker.name)
+        assert loaded_tracker is not None
+        assert tracker.model_dump() == loaded_tracker.model_dump()
+    assert [source.source_config["repo"] for source in trackers[1].sources] == [
+        "owner/b2",
+        "owner/b1",
+    ]
@@ -143,6 +143,70 @@ async def test_refresh_fails_after_logout(client, auth_service):
     assert refresh_response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_rejected_access_token_is_cached(auth_service, monkeypatch):
+    await auth_service.ensure_admin_user()
+    _, token_pair = await auth_service.login(LoginRequest(username="admin", password="admin"))
+    await auth_service.logout(token_pair.access_token)
+
+    with pytest.raises(ValueError, match="Session expired or invalid"):
+        await auth_service.get_current_user(token_pair.access_token)
+
+    async def fail_get_session(_token_hash):
+        raise AssertionError("rejected token should not reach storage again")
+
+    monkeypatch.setattr(auth_service.storage, "get_session", fail_get_session)
+    with pytest.raises(ValueError, match="Session expired or invalid"):
+        await auth_service.get_current_user(token_pair.access_token)
+
+
+@pytest.mark.asyncio
+async def test_accepted_access_token_is_cached_until_logout(auth_service, monkeypatch):
+    await auth_service.ensure_admin_user()
+    _, token_pair = await auth_service.login(LoginRequest(username="admin", password="admin"))
+    user = await auth_service.get_current_user(token_pair.access_token)
+
+    real_get_session = auth_service.storage.get_session
+
+    async def fail_get_session(_token_hash):
+        raise AssertionError("accepted token should be served from the cache")
+
+    monkeypatch.setattr(auth_service.storage, "get_session", fail_get_session)
+    cached_user = await auth_service.get_current_user(token_pair.access_token)
+    assert cached_user.id == user.id
+
+    monkeypatch.setattr(auth_service.storage, "get_session", real_get_session)
+    await auth_service.logout(token_pair.access_token)
+    with pytest.raises(ValueError, match="Session expired or invalid"):
+        await auth_service.get_current_user(token_pair.access_token)
+
+
+@pytest.mark.asyncio
+async def test_refresh_rejects_access_token_cached_during_update(auth_service, monkeypatch):
+    await auth_service.ensure_admin_user()
+    _, token_pair = await auth_service.login(LoginRequest(username="admin", password="admin"))
+
+    real_update_session_tokens = auth_service.storage.update_session_tokens
+
+    async def update_with_racing_request(**kwargs):
+        # A request using the old access token lands while the session row is being updated
+        await auth_service.get_current_user(token_pair.access_token)
+        return await real_update_session_tokens(**kwargs)
+
+    monkeypatch.setattr(auth_service.storage, "update_session_tokens", update_with_racing_request)
+    await auth_service.refresh_token(token_pair.refresh_token)
+
+    with pytest.raises(ValueError, match="Session expired or invalid"):
+        await auth_service.get_current_user(token_pair.access_token)
+
+
+def test_all_routes_share_one_bearer_scheme():
+    from releasetracker.dependencies import oauth2_scheme
+
+    security_schemes = app.openapi()["components"]["securitySchemes"]
+    assert list(security_schemes) == [oauth2_scheme.scheme_name]
+
+
 @pytest.mark.asyncio
 async def test_concurrent_refresh_reuse_allows_only_one_success(auth_service, storage):
     await auth_service.ensure_admin_user()
@@ -150,8 +214,10 @@ async def test_concurrent_refresh_reuse_allows_only_one_success(auth_service, st
 
     previous_storage = getattr(app.state, "storage", None)
     previous_system_key_manager = getattr(app.state, "system_key_manager", None)
+    previous_auth_service = getattr(app.state, "auth_service", None)
     app.state.storage = storage
     app.state.system_key_manager = storage.system_key_manager
+    app.state.auth_service = auth_service
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -192,6 +258,10 @@ async def test_concurrent_refresh_reuse_allows_only_one_success(auth_service, st
                 delattr(app.state, "system_key_manager")
             else:
                 app.state.system_key_manager = previous_system_key_manager
+            if previous_auth_service is None:
+                delattr(app.state, "auth_service")
+            else:
+                app.state.auth_service = previous_auth_service
 
 
 @pytest.mark.asyncio
@@ -293,3 +363,94 @@ async def test_oidc_callback_redirect_includes_refresh_token_payload(client, aut
     assert fragment["refresh_token"][0]
     assert fragment["token_type"] == ["Bearer"]
     assert int(fragment["expires_in"][0]) > 0
+
+
+@pytest.mark.asyncio
+async def test_oidc_provider_and_discovery_are_cached_between_logins(storage, monkeypatch):
+    import httpx
+
+    from releasetracker.services import oidc_service as oidc_service_module
+
+    provider = await storage.save_oauth_provider(
+        OIDCProvider(
+            name="Cached",
+            slug="cached",
+            issuer_url="https://cached-idp.example.com",
+            client_id="client-id",
+            client_secret="secret",
+            discovery_enabled=True,
+            enabled=True,
+        )
+    )
+    discovery_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        discovery_requests.append(str(request.url))
+        return httpx.Response(
+            200,
+            json={
+                "authorization_endpoint": "https://cached-idp.example.com/authorize",
+                "token_endpoint": "https://cached-idp.example.com/token",
+            },
+        )
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        oidc_service_module.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(oidc_service_module, "_discovery_cache", {})
+    monkeypatch.setattr(oidc_service_module, "_discovery_locks", {})
+    oidc_service = oidc_service_module.OIDCService(storage, auth_service=None)  # type: ignore[arg-type]
+
+    urls = await asyncio.gather(
+        *(
+            oidc_service.get_authorization_url("cached", "https://app/cb", f"state-{i}", "c")
+            for i in range(3)
+        )
+    )
+
+    assert all(url.startswith("https://cached-idp.example.com/authorize?") for url in urls)
+    assert discovery_requests == ["https://cached-idp.example.com/.well-known/openid-configuration"]
+
+    assert provider.id is not None
+    await storage.update_oauth_provider(
+        provider.id, provider.model_copy(update={"client_id": "rotated-client"})
+    )
+    cached_provider = await storage.get_oauth_provider("cached")
+    assert cached_provider is not None
+    assert cached_provider.client_id == "rotated-client"
+
+
+def test_state_and_pkce_pair_are_independent_and_s256_linked():
+    import base64
+    import hashlib
+
+    from releasetracker.services.oidc_service import generate_state_and_pkce_pair
+
+    state, code_verifier, code_challenge = generate_state_and_pkce_pair()
+
+    assert len(state) == len(code_verifier) == 43
+    assert state != code_verifier
+    expected = base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode()).digest())
+    assert code_challenge == expected.decode().rstrip("=")
+
+
+@pytest.mark.asyncio
+async def test_oauth_state_is_consumed_once_and_expired_states_are_rejected(storage):
+    from datetime import datetime
+
+    await storage.save_oauth_state("stale-state", "mock", "verifier")
+    await storage.save_oauth_state("live-state", "mock", "verifier")
+    storage._oauth_states["stale-state"].expires_at = datetime(2000, 1, 1)
+
+    consumed = await storage.get_and_delete_oauth_state("live-state")
+    assert consumed is not None
+    assert consumed.code_verifier == "verifier"
+    assert await storage.get_and_delete_oauth_state("live-state") is None
+
+    await storage.save_oauth_state("late-state", "mock", "verifier")
+    await storage.cleanup_expired_oauth_states()
+    assert list(storage._oauth_states) == ["late-state"]
+    assert await storage.get_and_delete_oauth_state("stale-state") is None
@@ -118,3 +118,20 @@ async def test_missing_changelog_file_raises_http_error(monkeypatch):
         await RepositoryChangelogFetcher(token=None).fetch_file(
             source, "CHANGELOG.md", "default_branch", _release(), None
         )
+
+
+@pytest.mark.asyncio
+async def test_raw_fetch_uses_caller_client_without_opening_one(monkeypatch):
+    _FakeAsyncClient.calls = []
+
+    def _unexpected_client(**kwargs):
+        raise AssertionError("a shared client was provided")
+
+    monkeypatch.setattr("releasetracker.services.changelog.httpx.AsyncClient", _unexpected_client)
+    source = TrackerSource(source_key="repo", source_type="github", source_config={"repo": "owner/repo"})
+    fetcher = RepositoryChangelogFetcher(token=None, client=_FakeAsyncClient())
+
+    for _ in range(2):
+        await fetcher.fetch_file(source, "CHANGELOG.md", "default_branch", _release(), None)
+
+    assert len(_FakeAsyncClient.calls) == 2
@@ -3,7 +3,7 @@ from datetime import datetime
 import aiosqlite
 import pytest
 
-from releasetracker.models import AggregateTracker, TrackerSource
+from releasetracker.models import AggregateTracker, Credential, TrackerSource
 
 
 @pytest.mark.asyncio
@@ -236,3 +236,62 @@ async def test_credential_can_be_deleted_after_references_are_removed(authed_cli
     delete_response = authed_client.delete(f"/api/credentials/{credential_id}")
     assert delete_response.status_code == 200, delete_response.text
     assert await storage.get_credential(credential_id) is None
+
+
+@pytest.mark.asyncio
+async def test_credential_by_name_cache_is_invalidated_on_write(storage):
+    credential_id = await storage.create_credential(
+        Credential(name="cached-token", type="github", token="ghp_first")
+    )
+    first = await storage.get_credential_by_name("cached-token")
+    assert first is not None and first.token == "ghp_first"
+
+    # Callers mutating nested fields must not reach the cached copy
+    first.secrets["token"] = "tampered"
+    cached = await storage.get_credential_by_name("cached-token")
+    assert cached is not None and cached.secrets.get("token") == "ghp_first"
+
+    await storage.update_credential(
+        credential_id, Credential(name="cached-token", type="github", token="ghp_second")
+    )
+    second = await storage.get_credential_by_name("cached-token")
+    assert second is not None and second.token == "ghp_second"
+
+    await storage.delete_credential(credential_id)
+    assert await storage.get_credential_by_name("cached-token") is None
+
+
+@pytest.mark.asyncio
+async def test_stored_credentials_keep_token_and_secret_token_in_sync(storage):
+    await storage.create_credential(
+        Credential(name="secret-only", type="docker", secrets={"token": "from-secrets"})
+    )
+    await storage.create_credential(Credential(name="token-only", type="github", token="ghp_x"))
+
+    credentials = {
+        credential.name: credential for credential in await storage.get_all_credentials()
+    }
+
+    assert credentials["secret-only"].token == "from-secrets"
+    assert credentials["token-only"].secrets == {"token": "ghp_x"}
+
+
+@pytest.mark.asyncio
+async def test_credential_update_keeps_token_and_secrets_when_omitted(authed_client, storage):
+    response = authed_client.post(
+        "/api/credentials",
+        json={"name": "keep-token", "type": "github", "token": "ghp_keep_this_token"},
+    )
+    credential_id = response.json()["id"]
+
+    response = authed_client.put(
+        f"/api/credentials/{credential_id}",
+        json={"token": "", "secrets": None, "description": "renamed"},
+    )
+    assert response.status_code == 200
+
+    updated = await storage.get_credential(credential_id)
+    assert updated.name == "keep-token"
+    assert updated.token == "ghp_keep_this_token"
+    assert updated.secrets == {"token": "ghp_keep_this_token"}
+    assert updated.description == "renamed"
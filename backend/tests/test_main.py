@@ -15,6 +15,9 @@ class FakeStorage:
     async def get_system_log_level(self):
         return "INFO"
 
+    async def cleanup_expired_oauth_states(self):
+        return None
+
     async def close(self):
         self.closed = True
 
@@ -35,6 +38,12 @@ class FakeSchedulerHost:
         self.start_called = False
         self.shutdown_called = False
         self.schedulers: list[object] = []
+        self.interval_jobs: dict[str, object] = {}
+
+    def add_interval_job(self, namespace, key, func, *, seconds, args=None):
+        job_id = f"{namespace}_{key}"
+        self.interval_jobs[job_id] = func
+        return job_id
 
     async def start(self):
         self.start_called = True
@@ -53,6 +62,7 @@ class FakeScheduler:
         self.scheduler_host = scheduler_host
         self.initialize_called = False
         self.start_called = False
+        self.shutdown_called = False
 
         if scheduler_host is not None and hasattr(scheduler_host, "schedulers"):
             scheduler_host.schedulers.append(self)
@@ -65,6 +75,9 @@ class FakeScheduler:
         self.start_called = True
         self.storage.events.append("scheduler.start")
 
+    async def shutdown(self):
+        self.shutdown_called = True
+
 
 class FakeExecutorScheduler:
     def __init__(self, storage, *, scheduler_host=None):
@@ -139,9 +152,14 @@ async def test_lifespan_starts_without_identity_drift_repair(monkeypatch):
         assert main_module.app.state.storage is storage
         assert main_module.app.state.system_key_manager is storage.system_key_manager
         assert auth.system_key_manager is storage.system_key_manager
+        assert main_module.app.state.auth_service is auth
         assert main_module.app.state.scheduler_host is scheduler_host
         assert auth.ensure_admin_called is True
         assert scheduler_host.start_called is True
+        assert (
+            scheduler_host.interval_jobs["oauth_state_cleanup_expired"]
+            == storage.cleanup_expired_oauth_states
+        )
         assert scheduler.scheduler_host is scheduler_host
         assert executor.scheduler_host is scheduler_host
         assert scheduler.initialize_called is True
@@ -160,4 +178,60 @@ async def test_lifespan_starts_without_identity_drift_repair(monkeypatch):
 
     assert fake_storage_holder["storage"].closed is True
     assert fake_scheduler_host_holder["scheduler_host"].shutdown_called is True
+    assert fake_scheduler_holder["scheduler"].shutdown_called is True
     assert fake_executor_holder["executor"].shutdown_called is True
+
+
+def test_spa_static_files_fall_back_to_index(tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "app.js").write_text("console.log('app')")
+    (tmp_path / "index.html").write_text("<html>spa</html>")
+
+    spa_app = FastAPI()
+
+    @spa_app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    spa_app.router.routes.append(
+        main_module.SPAMount("/", app=main_module.SPAStaticFiles(directory=tmp_path), name="spa")
+    )
+
+    with TestClient(spa_app) as client:
+        assert client.get("/").text == "<html>spa</html>"
+        assert client.get("/trackers/demo").text == "<html>spa</html>"
+        assert client.get("/assets/app.js").text == "console.log('app')"
+        assert client.get("/api/ping").json() == {"ok": True}
+
+        missing_api = client.get("/api/missing")
+        assert missing_api.status_code == 404
+        assert missing_api.json() == {"detail": "Not Found"}
+        assert client.get("/auth/oidc/callback").status_code == 404
+
+        # API paths stay with the router rather than the SPA shell
+        assert client.post("/api/ping").status_code == 405
+        redirect = client.get("/api/ping/", follow_redirects=False)
+        assert redirect.status_code == 307
+        assert redirect.headers["location"].endswith("/api/ping")
+
+
+def test_cors_preflight_is_cacheable_and_not_credentialed():
+    from fastapi.testclient import TestClient
+
+    client = TestClient(main_module.app)
+    response = client.options(
+        "/api/releases",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "authorization",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["access-control-max-age"] == "86400"
+    assert "access-control-allow-credentials" not in response.headers
@@ -49,3 +49,24 @@ class TestExecutorSnapshot:
     def test_image_at_capture_accepts_none(self):
         snapshot = ExecutorSnapshot(executor_id=1, image_at_capture=None)
         assert snapshot.image_at_capture is None
+
+
+class TestTrackerConfigFromTrusted:
+    def test_matches_validated_construction(self):
+        from releasetracker.config import Channel, TrackerConfig
+
+        fields = {
+            "name": " demo ",
+            "type": "github",
+            "repo": "owner/repo",
+            "channels": [
+                Channel(name="stable", type="release"),
+                {"name": "beta", "include_pattern": "beta", "release_channel_key": "beta-key"},
+            ],
+        }
+
+        trusted = TrackerConfig.from_trusted(**fields)
+        validated = TrackerConfig(**fields)
+
+        assert trusted.model_dump() == validated.model_dump()
+        assert all(isinstance(channel, Channel) for channel in trusted.channels)
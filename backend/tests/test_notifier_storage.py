@@ -34,3 +34,42 @@ async def test_notifier_language_persists_on_create_and_update(storage):
     updated = await storage.update_notifier(notifier.id, {"language": "en"})
 
     assert updated.language == "en"
+
+
+@pytest.mark.asyncio
+async def test_notifier_routes_validate_and_apply_partial_updates(authed_client):
+    missing_url = authed_client.post("/api/notifiers", json={"name": "no-url"})
+    assert missing_url.status_code == 400
+    assert missing_url.json()["detail"] == "URL is required"
+
+    created = authed_client.post(
+        "/api/notifiers",
+        json={"name": "routed-webhook", "url": "https://example.com/hook", "language": "zh"},
+    )
+    assert created.status_code == 201
+    notifier = created.json()
+    assert notifier["events"] == ["new_release"]
+    assert notifier["enabled"] is True
+
+    updated = authed_client.put(f"/api/notifiers/{notifier['id']}", json={"enabled": False})
+    assert updated.status_code == 200
+    data = updated.json()
+    assert data["enabled"] is False
+    assert data["language"] == "zh"
+    assert data["url"] == "https://example.com/hook"
+
+
+@pytest.mark.asyncio
+async def test_notifiers_page_returns_rows_with_total(storage):
+    for index in range(3):
+        await storage.create_notifier(
+            {"name": f"paged-webhook-{index}", "url": "https://example.com/webhook"}
+        )
+
+    page, total = await storage.get_notifiers_page(skip=1, limit=1)
+    assert len(page) == 1
+    assert total == 3
+
+    past_end, total = await storage.get_notifiers_page(skip=10, limit=5)
+    assert past_end == []
+    assert total == 3
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 
 
@@ -161,3 +163,48 @@ async def test_public_providers_list_one_enabled(client, auth_service):
     assert entry["name"] == "Public Test Provider"
     assert "client_secret" not in entry
     assert "client_id" not in entry
+
+
+@pytest.mark.asyncio
+async def test_admin_provider_list_omits_secret_and_formats_timestamps(client, auth_service):
+    await auth_service.ensure_admin_user()
+    headers = _admin_headers(client)
+    payload = _provider_payload("primary", "Primary Provider")
+    client.post("/api/oidc-providers", json=payload, headers=headers)
+
+    response = client.get("/api/oidc-providers", headers=headers)
+
+    assert response.status_code == 200
+    [entry] = response.json()
+    assert "client_secret" not in entry
+    assert entry["client_id"] == payload["client_id"]
+    assert datetime.fromisoformat(entry["created_at"])
+    assert datetime.fromisoformat(entry["updated_at"])
+
+
+@pytest.mark.asyncio
+async def test_provider_lists_refresh_after_writes(client, auth_service):
+    """Cached admin and public provider lists follow create, update and delete."""
+    await auth_service.ensure_admin_user()
+    headers = _admin_headers(client)
+    assert client.get("/api/oidc-providers", headers=headers).json() == []
+    assert client.get("/api/auth/oidc/providers").json() == []
+
+    create_resp = client.post(
+        "/api/oidc-providers",
+        json=_provider_payload("cached", "Cached Provider"),
+        headers=headers,
+    )
+    assert create_resp.status_code == 201, create_resp.text
+    provider_id = create_resp.json()["id"]
+    assert [p["slug"] for p in client.get("/api/oidc-providers", headers=headers).json()] == [
+        "cached"
+    ]
+    assert [p["slug"] for p in client.get("/api/auth/oidc/providers").json()] == ["cached"]
+
+    client.put(f"/api/oidc-providers/{provider_id}", json={"enabled": False}, headers=headers)
+    assert client.get("/api/auth/oidc/providers").json() == []
+    assert client.get("/api/oidc-providers", headers=headers).json()[0]["enabled"] is False
+
+    client.delete(f"/api/oidc-providers/{provider_id}", headers=headers)
+    assert client.get("/api/oidc-providers", headers=headers).json() == []
@@ -275,6 +275,91 @@ async def test_releases_stats(authed_client, storage):
     assert stats["total_releases"] >= 1
 
 
+@pytest.mark.asyncio
+async def test_stats_are_cached_until_storage_writes(storage):
+    def stats_release(version: str) -> Release:
+        return Release(
+            tracker_name="cached-stats-tracker",
+            version=version,
+            name=f"Release {version}",
+            tag_name=version,
+            url=f"http://example.com/{version}",
+            published_at=datetime.now(),
+            prerelease=False,
+        )
+
+    await _seed_runtime_release(storage, stats_release("v1.0.0"))
+    first = await storage.get_stats()
+    assert await storage.get_stats() is first
+
+    await _seed_runtime_release(storage, stats_release("v1.1.0"))
+    refreshed = await storage.get_stats()
+    assert refreshed is not first
+    assert refreshed.total_releases == first.total_releases + 1
+
+
+@pytest.mark.asyncio
+async def test_source_release_history_ids_are_resolved_in_one_lookup(storage):
+    releases = [
+        Release(
+            tracker_name="batched-history-ids",
+            version=version,
+            name=f"Release {version}",
+            tag_name=version,
+            url=f"http://example.com/{version}",
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            prerelease=False,
+        )
+        for version in ("v1.0.0", "v1.1.0")
+    ]
+    for release in releases:
+        await _seed_runtime_release(storage, release)
+    aggregate_tracker = await storage.get_aggregate_tracker("batched-history-ids")
+    assert aggregate_tracker is not None
+    source = storage._select_runtime_source(aggregate_tracker)
+    assert source is not None and source.id is not None
+    identity_keys = [
+        storage.release_identity_key_for_source(release, source_type=source.source_type)
+        for release in releases
+    ]
+
+    ids = await storage.get_source_release_history_ids(source.id, [*identity_keys, "missing"])
+
+    assert ids == {
+        key: await storage.get_source_release_history_id(source.id, key) for key in identity_keys
+    }
+    assert await storage.get_source_release_history_ids(source.id, []) == {}
+
+
+@pytest.mark.asyncio
+async def test_latest_releases_support_conditional_get(authed_client, storage):
+    def latest_release(version: str) -> Release:
+        return Release(
+            tracker_name="etag-tracker",
+            version=version,
+            name=f"Release {version}",
+            tag_name=version,
+            url=f"http://example.com/{version}",
+            published_at=datetime.now(),
+            prerelease=False,
+        )
+
+    await _seed_runtime_release(storage, latest_release("v1.0.0"))
+    first = authed_client.get("/api/releases/latest")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    unchanged = authed_client.get("/api/releases/latest", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+
+    await _seed_runtime_release(storage, latest_release("v1.1.0"))
+    changed = authed_client.get("/api/releases/latest", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
 @pytest.mark.asyncio
 async def test_releases_stats_groups_naive_published_at_in_system_timezone(authed_client, storage):
     await storage.set_setting("system.timezone", "Asia/Shanghai")
@@ -2075,6 +2160,42 @@ async def test_releases_include_history_query_param_fails_with_migration_guidanc
     assert "/api/trackers/{tracker_name}/current" in false_response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_releases_search_matches_substrings_through_the_search_index(authed_client, storage):
+    for tracker_name, tag_name in (("Search-Alpha", "v1.4.2"), ("search-beta", "v2.0.0-rc1")):
+        await _seed_runtime_release(
+            storage,
+            Release(
+                tracker_name=tracker_name,
+                version=tag_name,
+                name=f"Release {tag_name}",
+                tag_name=tag_name,
+                channel_name="stable",
+                url=f"http://example.com/{tag_name}",
+                published_at=datetime(2024, 5, 1, 12, 0, 0),
+                prerelease=False,
+            ),
+        )
+
+    def search(term: str) -> list[str]:
+        response = authed_client.get("/api/releases", params={"search": term})
+        assert response.status_code == 200, response.text
+        return sorted(item["tracker_name"] for item in response.json()["items"])
+
+    assert search("ALPHA") == ["Search-Alpha"]
+    assert search("0-RC") == ["search-beta"]
+    assert search("search-") == ["Search-Alpha", "search-beta"]
+    assert search("missing") == []
+
+    db = await storage._get_connection()
+    await db.execute(
+        "UPDATE source_release_history SET name = ? WHERE tag_name = ?",
+        ("Renamed Gamma", "v1.4.2"),
+    )
+    await db.commit()
+    assert search("gamma") == ["Search-Alpha"]
+
+
 @pytest.mark.asyncio
 async def test_releases_history_orders_by_append_created_at_and_paginates_after_filters(
     authed_client, storage
@@ -2159,6 +2280,21 @@ async def test_releases_history_orders_by_append_created_at_and_paginates_after_
     assert filtered_payload["total"] == 2
     assert [item["version"] for item in filtered_payload["items"]] == ["1.0.0"]
 
+    past_end_response = authed_client.get(
+        "/api/releases?tracker=append-ordered-history&skip=10&limit=2"
+    )
+    assert past_end_response.status_code == 200, past_end_response.text
+    assert past_end_response.json()["total"] == 3
+    assert past_end_response.json()["items"] == []
+
+    negative_skip_response = authed_client.get(
+        "/api/releases?tracker=append-ordered-history&skip=-5&limit=10"
+    )
+    assert negative_skip_response.status_code == 200, negative_skip_response.text
+    assert negative_skip_response.json()["total"] == 3
+    assert negative_skip_response.json()["skip"] == 0
+    assert len(negative_skip_response.json()["items"]) == 3
+
 
 @pytest.mark.asyncio
 async def test_releases_history_canonical_channel_selector_requires_tracker_and_valid_tracker_channel(
@@ -3381,6 +3517,41 @@ async def test_get_latest_release_for_channels_stays_scoped_to_requested_tracker
     assert winner.channel_name == "stable"
 
 
+@pytest.mark.asyncio
+async def test_get_releases_for_trackers_bulk_matches_per_tracker_reads(storage):
+    for tracker_name, version, day in (
+        ("bulk-a", "1.0.0", 1),
+        ("bulk-a", "1.1.0", 2),
+        ("bulk-b", "2.0.0", 3),
+    ):
+        await _seed_runtime_release(
+            storage,
+            Release(
+                tracker_name=tracker_name,
+                tracker_type="github",
+                version=version,
+                name=f"Release {version}",
+                tag_name=f"v{version}",
+                channel_name="stable",
+                url=f"http://example.com/{tracker_name}/v{version}",
+                published_at=datetime(2024, 3, day, 12, 0, 0),
+                prerelease=False,
+            ),
+        )
+
+    bulk = await storage.get_releases_for_trackers_bulk(["bulk-a", "bulk-b", "bulk-missing"])
+
+    for tracker_name in ("bulk-a", "bulk-b"):
+        expected = await storage.get_releases(
+            tracker_name=tracker_name, limit=200, include_history=False
+        )
+        assert [release.tag_name for release in bulk[tracker_name]] == [
+            release.tag_name for release in expected
+        ]
+        assert all(release.tracker_name == tracker_name for release in bulk[tracker_name])
+    assert bulk["bulk-missing"] == []
+
+
 @pytest.mark.asyncio
 async def test_releases_list_includes_archived_channel_state_for_republished_winner(storage):
     tracker_name = "history-channel-api"
@@ -3517,3 +3688,36 @@ async def test_get_releases_current_mode_does_not_fallback_to_canonical_when_pro
 
     assert current_releases == []
     assert [release.version for release in history_releases] == ["1.0.0"]
+
+
+@pytest.mark.asyncio
+async def test_batched_tracker_status_derivations_match_single_lookups(storage):
+    for tracker_name, version in [("batch-alpha", "v1.0.0"), ("batch-beta", "v2.0.0")]:
+        await _seed_runtime_release(
+            storage,
+            Release(
+                tracker_name=tracker_name,
+                tracker_type="github",
+                version=version,
+                name=version,
+                tag_name=version,
+                url=f"https://example.com/{tracker_name}/{version}",
+                published_at=datetime(2026, 4, 1, tzinfo=timezone.utc),
+                prerelease=False,
+            ),
+        )
+    await storage.save_tracker_config(
+        TrackerConfig(name="batch-empty", type="github", repo="owner/batch-empty", interval=60)
+    )
+
+    trackers = await storage.get_all_aggregate_trackers()
+    runtime_config_map = await storage.get_tracker_configs_for_aggregates(trackers)
+    derivations = await storage.get_tracker_current_status_derivations(trackers, runtime_config_map)
+
+    for tracker in trackers:
+        assert runtime_config_map[tracker.name] == await storage.get_tracker_config(tracker.name)
+        assert derivations[tracker.name] == await storage.get_tracker_current_status_derivation(
+            tracker.name
+        )
+    assert derivations["batch-beta"]["latest_version"] == "v2.0.0"
+    assert derivations["batch-empty"]["latest_version"] is None
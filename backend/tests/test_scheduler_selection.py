@@ -676,6 +676,58 @@ async def test_auto_check_stable_semver_beats_later_lower_branch(storage, monkey
     assert persisted[0].channel_name == "stable"
 
 
+@pytest.mark.asyncio
+async def test_scheduled_check_reuses_registered_tracker_config(storage, monkeypatch):
+    tracker_name = "registered-config"
+    channels = [Channel(name="stable", type="release")]
+    config = make_config(tracker_name, channels, fetch_limit=10, version_sort_mode="semver")
+    await storage.save_tracker_config(config)
+    await _set_primary_source_release_channels(storage, tracker_name, channels)
+    releases = [make_release(tracker_name, "1.2.0", datetime(2024, 1, 10, tzinfo=timezone.utc))]
+
+    scheduler = ReleaseScheduler(storage)
+
+    async def _fake_create_tracker(_config):
+        return FakeTracker(tracker_name, releases, channels)
+
+    monkeypatch.setattr(scheduler, "_create_tracker", _fake_create_tracker)
+    await scheduler.refresh_tracker(tracker_name)
+
+    config_reads = 0
+    original_get_tracker_config = storage.get_tracker_config
+
+    async def _counting_get_tracker_config(name, **kwargs):
+        nonlocal config_reads
+        # Count top-level reads only; the read itself re-enters with a borrowed db
+        if "db" not in kwargs:
+            config_reads += 1
+        return await original_get_tracker_config(name, **kwargs)
+
+    monkeypatch.setattr(storage, "get_tracker_config", _counting_get_tracker_config)
+
+    status = await scheduler._check_tracker(tracker_name)
+
+    assert status is not None
+    assert status.last_version == "1.2.0"
+    assert config_reads == 0
+
+    # A config write that bypasses refresh_tracker still reaches the next check
+    await storage.save_tracker_config(config.model_copy(update={"enabled": False}))
+    config_reads = 0
+
+    status = await scheduler._check_tracker(tracker_name)
+
+    assert config_reads == 1
+    assert status is not None
+    assert status.error == "Tracker is disabled"
+
+    await scheduler._check_tracker(tracker_name)
+    assert config_reads == 1
+
+    await scheduler.remove_tracker(tracker_name)
+    assert tracker_name not in scheduler.tracker_configs
+
+
 @pytest.mark.asyncio
 async def test_manual_check_respects_fetch_limit_as_candidate_depth(tmp_path, monkeypatch):
     tracker_name = "limit-manual"
@@ -1910,6 +1962,33 @@ async def test_scheduler_check_all_limits_tracker_concurrency(tmp_path):
         await _close_storage(storage)
 
 
+@pytest.mark.asyncio
+async def test_scheduler_check_all_survives_failing_checks(tmp_path):
+    db_path = tmp_path / "scheduler-check-all-failure.db"
+    storage = await _create_test_storage(db_path)
+    await initialize_storage_with_schema(storage)
+    try:
+        scheduler = ReleaseScheduler(storage)
+        scheduler.trackers = cast(
+            dict[str, BaseTracker], {name: object() for name in ("slow", "broken", "fast")}
+        )
+        finished: list[str] = []
+
+        async def fake_check_tracker(name: str):
+            if name == "broken":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.02 if name == "slow" else 0)
+            finished.append(name)
+
+        scheduler._check_tracker = fake_check_tracker  # type: ignore[method-assign]
+
+        await scheduler.check_all()
+
+        assert finished == ["fast", "slow"]
+    finally:
+        await _close_storage(storage)
+
+
 @pytest.mark.asyncio
 async def test_fetch_tracker_releases_limits_same_provider_concurrency(tmp_path):
     db_path = tmp_path / "provider-limit.db"
@@ -1980,3 +2059,153 @@ async def test_fetch_tracker_releases_uses_separate_provider_buckets(tmp_path):
         await batch
     finally:
         await _close_storage(storage)
+
+
+@pytest.mark.asyncio
+async def test_started_scheduler_queues_notifications_for_background_workers(storage, monkeypatch):
+    await storage.create_notifier(
+        {"name": "queued-hook", "url": "https://example.invalid/hook", "events": ["new_release"]}
+    )
+    release_gate = asyncio.Event()
+    delivered: list[tuple[str, str]] = []
+
+    async def _slow_notify(self, event, payload):
+        await release_gate.wait()
+        delivered.append((event, payload.version))
+
+    monkeypatch.setattr("releasetracker.notifiers.webhook.WebhookNotifier.notify", _slow_notify)
+
+    scheduler = ReleaseScheduler(storage)
+    await scheduler.start()
+    try:
+        release = make_release("queued", "2.0.0", datetime(2024, 1, 1, tzinfo=timezone.utc))
+        await asyncio.wait_for(scheduler._send_notifications("new_release", release), 1)
+        assert delivered == []
+
+        release_gate.set()
+        await asyncio.wait_for(scheduler._notification_queue.join(), 1)
+        assert delivered == [("new_release", "2.0.0")]
+    finally:
+        await scheduler.shutdown()
+        await scheduler.scheduler_host.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_notifications_fan_out_to_webhooks_concurrently(storage, monkeypatch):
+    for index in range(3):
+        await storage.create_notifier(
+            {"name": f"fan-out-{index}", "url": f"https://example.invalid/{index}"}
+        )
+    in_flight: set[str] = set()
+    all_in_flight = asyncio.Event()
+
+    async def _blocking_notify(self, event, payload):
+        in_flight.add(self.name)
+        if len(in_flight) == 3:
+            all_in_flight.set()
+        await all_in_flight.wait()
+
+    monkeypatch.setattr("releasetracker.notifiers.webhook.WebhookNotifier.notify", _blocking_notify)
+
+    scheduler = ReleaseScheduler(storage)
+    await scheduler.start()
+    try:
+        release = make_release("fan-out", "3.0.0", datetime(2024, 1, 1, tzinfo=timezone.utc))
+        await scheduler._send_notifications("new_release", release)
+        await asyncio.wait_for(scheduler._notification_queue.join(), 1)
+        assert in_flight == {"fan-out-0", "fan-out-1", "fan-out-2"}
+    finally:
+        await scheduler.shutdown()
+        await scheduler.scheduler_host.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_notifier_list_is_reused_until_notifiers_change(storage, monkeypatch):
+    notifier = await storage.create_notifier(
+        {"name": "cached-hook", "url": "https://example.invalid/cached"}
+    )
+    delivered: list[str] = []
+
+    async def _record_notify(self, event, payload):
+        delivered.append(payload.version)
+
+    monkeypatch.setattr("releasetracker.notifiers.webhook.WebhookNotifier.notify", _record_notify)
+
+    scheduler = ReleaseScheduler(storage)
+
+    def _release(version: str):
+        return make_release("cached", version, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    await scheduler._send_notifications("new_release", _release("1.0.0"))
+    cached_notifiers = scheduler.notifiers
+    await scheduler._send_notifications("new_release", _release("1.1.0"))
+
+    assert scheduler.notifiers is cached_notifiers
+    assert delivered == ["1.0.0", "1.1.0"]
+
+    await storage.update_notifier(notifier.id, {"enabled": False})
+    await scheduler._send_notifications("new_release", _release("1.2.0"))
+
+    assert scheduler.notifiers == []
+    assert delivered == ["1.0.0", "1.1.0"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_reload_stale_notifier_list_once(storage, monkeypatch):
+    await storage.create_notifier({"name": "race-hook", "url": "https://example.invalid/race"})
+    delivered: list[str] = []
+
+    async def _record_notify(self, event, payload):
+        delivered.append(payload.version)
+
+    monkeypatch.setattr("releasetracker.notifiers.webhook.WebhookNotifier.notify", _record_notify)
+
+    real_get_notifiers = storage.get_notifiers
+    loads = 0
+
+    async def _slow_get_notifiers():
+        nonlocal loads
+        loads += 1
+        # Yield so both senders are inside the refresh window together
+        await asyncio.sleep(0.01)
+        return await real_get_notifiers()
+
+    monkeypatch.setattr(storage, "get_notifiers", _slow_get_notifiers)
+    scheduler = ReleaseScheduler(storage)
+
+    def _release(version: str):
+        return make_release("race", version, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    await asyncio.gather(
+        scheduler._send_notifications("new_release", _release("1.0.0")),
+        scheduler._send_notifications("new_release", _release("1.1.0")),
+    )
+
+    assert loads == 1
+    assert len(scheduler.notifiers) == 1
+    assert sorted(delivered) == ["1.0.0", "1.1.0"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_delivers_queued_notifications(storage, monkeypatch):
+    await storage.create_notifier({"name": "drain-hook", "url": "https://example.invalid/drain"})
+    delivered: list[str] = []
+
+    async def _slow_notify(self, event, payload):
+        await asyncio.sleep(0.02)
+        delivered.append(payload.version)
+
+    monkeypatch.setattr("releasetracker.notifiers.webhook.WebhookNotifier.notify", _slow_notify)
+
+    scheduler = ReleaseScheduler(storage)
+    await scheduler.start()
+    try:
+        for version in ("1.0.0", "1.1.0"):
+            release = make_release("drain", version, datetime(2024, 1, 1, tzinfo=timezone.utc))
+            await scheduler._send_notifications("new_release", release)
+        assert delivered == []
+    finally:
+        await scheduler.shutdown()
+        await scheduler.scheduler_host.shutdown()
+
+    assert sorted(delivered) == ["1.0.0", "1.1.0"]
@@ -92,6 +92,21 @@ async def test_settings_crud_endpoints(authed_client):
     assert all(item["key"] != "test.setting" for item in after_delete_response.json())
 
 
+@pytest.mark.asyncio
+async def test_settings_list_supports_conditional_get(authed_client):
+    first = authed_client.get("/api/settings")
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+
+    unchanged = authed_client.get("/api/settings", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    authed_client.post("/api/settings", json={"key": "etag.setting", "value": "on"})
+    changed = authed_client.get("/api/settings", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert any(item["key"] == "etag.setting" for item in changed.json())
+
+
 @pytest.mark.asyncio
 async def test_release_history_retention_setting_accepts_valid_integer(authed_client):
     response = authed_client.post(
@@ -1212,6 +1212,34 @@ async def test_update_tracker_still_rejects_true_rename(authed_client):
     assert "Renaming a tracker is not supported" in response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_update_missing_tracker_returns_404(authed_client, storage):
+    response = authed_client.put(
+        "/api/trackers/missing-update",
+        json=make_tracker_payload("missing-update"),
+    )
+
+    assert response.status_code == 404
+    assert await storage.get_tracker_config("missing-update") is None
+    # The 404 path must not leave the shared writer inside an open transaction
+    db = await storage._get_connection()
+    assert not db.in_transaction
+
+
+@pytest.mark.asyncio
+async def test_create_tracker_storage_fault_is_not_a_client_error(
+    authed_client, storage, monkeypatch
+):
+    async def locked_create(_tracker):
+        raise aiosqlite.OperationalError("database is locked")
+
+    monkeypatch.setattr(storage, "create_aggregate_tracker", locked_create)
+
+    # Not mapped to 400: the test client re-raises what the server would answer with a 500
+    with pytest.raises(aiosqlite.OperationalError):
+        authed_client.post("/api/trackers", json=make_tracker_payload("locked-create"))
+
+
 @pytest.mark.asyncio
 async def test_delete_tracker(authed_client, storage):
     authed_client.post("/api/trackers", json=make_tracker_payload("del-test"))
@@ -1225,6 +1253,21 @@ async def test_delete_tracker(authed_client, storage):
     assert await storage.get_aggregate_tracker("del-test") is None
 
 
+@pytest.mark.asyncio
+async def test_delete_missing_tracker_returns_404_without_writing(authed_client, storage):
+    await storage.update_tracker_status(
+        TrackerStatus(name="missing-delete", type="github", last_version="v1.0.0")
+    )
+
+    response = authed_client.delete("/api/trackers/missing-delete")
+
+    assert response.status_code == 404
+    status = await storage.get_tracker_status("missing-delete")
+    assert status is not None and status.last_version == "v1.0.0"
+    db = await storage._get_connection()
+    assert not db.in_transaction
+
+
 @pytest.mark.asyncio
 async def test_get_trackers_cleans_up_blank_tracker_rows(authed_client, storage):
     authed_client.post("/api/trackers", json=make_tracker_payload("valid-tracker"))
@@ -1,4 +1,18 @@
-from releasetracker.notifiers.webhook import _build_webhook_payload
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from releasetracker.models import Release
+from releasetracker.notifiers import notify_all
+from releasetracker.notifiers import webhook as webhook_module
+from releasetracker.notifiers.webhook import (
+    WebhookNotifier,
+    _build_webhook_payload,
+    _emojize_release_body,
+)
 
 
 def test_executor_webhook_uses_version_labels_for_helm_release():
@@ -97,3 +111,186 @@ def test_generic_webhook_payload_uses_chinese_message_when_language_is_zh():
     assert payload["message"] == "[test] 收到通知"
     assert payload["content"] == "[test] 收到通知"
     assert payload["text"] == "[test] 收到通知"
+
+
+@pytest.mark.asyncio
+async def test_webhook_notifiers_share_one_client_until_closed():
+    first = WebhookNotifier(name="first", url="https://example.invalid/a")
+    second = WebhookNotifier(name="second", url="https://example.invalid/b")
+
+    client = first.get_client()
+    assert second.get_client() is client
+
+    await WebhookNotifier.close_client()
+    assert client.is_closed
+    assert first.get_client() is not client
+    await WebhookNotifier.close_client()
+
+
+def test_release_webhook_description_expands_alias_and_english_shortcodes():
+    release = Release(
+        tracker_name="demo",
+        tracker_type="github",
+        version="v1.0.0",
+        name="v1.0.0",
+        tag_name="v1.0.0",
+        url="https://example.com/v1.0.0",
+        published_at=datetime(2026, 5, 3, tzinfo=timezone.utc),
+        prerelease=False,
+        body=":bug: fixed, :thumbs_up: and :+1:",
+    )
+
+    payload = _build_webhook_payload("new_release", release)
+
+    assert payload["embeds"][0]["description"] == "🐛 fixed, 👍 and 👍"
+
+
+@pytest.mark.asyncio
+async def test_webhook_retries_server_errors_with_backoff(monkeypatch):
+    statuses = iter([503, 502, 200])
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(next(statuses))
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(
+        WebhookNotifier, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(WebhookNotifier, "_client_loop", asyncio.get_running_loop())
+    monkeypatch.setattr(webhook_module.asyncio, "sleep", fake_sleep)
+
+    notifier = WebhookNotifier(name="hook", url="https://example.invalid/hook", events=["test"])
+    await notifier.notify("test", {"ok": True})
+    await WebhookNotifier.close_client()
+
+    assert len(requests) == 3
+    assert {request.content for request in requests} == {requests[0].content}
+    assert len(sleeps) == 2
+    assert 1.0 <= sleeps[0] <= 1.5
+    assert 2.0 <= sleeps[1] <= 3.0
+
+
+def test_webhook_notifier_subscribes_only_to_configured_events():
+    notifier = WebhookNotifier(
+        name="hook", url="https://example.invalid/hook", events=["republish", "republish"]
+    )
+    default_notifier = WebhookNotifier(name="default", url="https://example.invalid/default")
+
+    assert notifier.events == frozenset({"republish"})
+    assert notifier.subscribes_to("republish")
+    assert not notifier.subscribes_to("new_release")
+    assert default_notifier.subscribes_to("new_release")
+
+
+def test_release_body_without_shortcodes_is_left_untouched():
+    assert _emojize_release_body("Released at 12:30 UTC") == "Released at 12:30 UTC"
+    assert _emojize_release_body("Fix :bug: in parser") == "Fix 🐛 in parser"
+
+
+def test_webhook_body_is_encoded_once_per_payload_and_language(monkeypatch):
+    builds = []
+    original_build = webhook_module._build_webhook_payload
+
+    def counting_build(event, payload, *, language="en"):
+        builds.append(language)
+        return original_build(event, payload, language=language)
+
+    monkeypatch.setattr(webhook_module, "_build_webhook_payload", counting_build)
+    payload = {"ok": True}
+
+    first = webhook_module._encoded_webhook_payload("test", payload, "en")
+    second = webhook_module._encoded_webhook_payload("test", payload, "en")
+    chinese = webhook_module._encoded_webhook_payload("test", payload, "zh")
+    other = webhook_module._encoded_webhook_payload("test", {"ok": True}, "en")
+
+    assert first is second
+    assert json.loads(first)["message"] == "[test] Notification received"
+    assert json.loads(chinese)["message"] == "[test] 收到通知"
+    assert other == first
+    assert builds == ["en", "zh", "en"]
+
+
+def test_webhook_body_is_re_encoded_after_payload_mutation():
+    payload = {"entity": "other", "value": 1}
+
+    first = webhook_module._encoded_webhook_payload("test", payload, "en")
+    payload["value"] = 2
+    second = webhook_module._encoded_webhook_payload("test", payload, "en")
+
+    assert json.loads(first)["data"]["value"] == 1
+    assert json.loads(second)["data"]["value"] == 2
+
+
+@pytest.mark.asyncio
+async def test_notify_all_delivers_to_subscribers_despite_failures():
+    delivered = []
+
+    class RecordingNotifier(WebhookNotifier):
+        async def notify(self, event, payload):
+            if self.name == "broken":
+                raise RuntimeError("boom")
+            delivered.append(self.name)
+
+    notifiers = [
+        RecordingNotifier(name="broken", url="https://example.invalid/broken"),
+        RecordingNotifier(name="working", url="https://example.invalid/working"),
+        RecordingNotifier(name="other", url="https://example.invalid/o", events=["republish"]),
+    ]
+
+    await notify_all(notifiers, "new_release", {"ok": True})
+
+    assert delivered == ["working"]
+
+
+def test_retry_after_hint_is_honoured_with_jitter():
+    response = httpx.Response(429, headers={"Retry-After": "2"})
+
+    waits = {webhook_module._retry_wait_seconds(0, response) for _ in range(20)}
+
+    assert all(2.5 <= wait <= 3.0 for wait in waits)
+    assert len(waits) > 1
+
+
+def test_discord_rate_limit_header_is_used_before_the_body():
+    class UnreadableBody(httpx.Response):
+        @property
+        def content(self):
+            raise AssertionError("the body should not be decoded when headers carry the wait")
+
+    headed = UnreadableBody(429, headers={"X-RateLimit-Reset-After": "1.5"})
+    assert 2.0 <= webhook_module._retry_wait_seconds(0, headed) <= 2.5
+
+    body_only = httpx.Response(429, json={"retry_after": 1500})
+    assert 2.0 <= webhook_module._retry_wait_seconds(0, body_only) <= 2.5
+
+
+@pytest.mark.asyncio
+async def test_exhausted_rate_limit_defers_the_next_post_to_that_webhook(monkeypatch):
+    url = "https://example.invalid/limited"
+    sent_at = []
+
+    def handler(request):
+        sent_at.append(webhook_module.time.monotonic())
+        return httpx.Response(
+            204, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "0.2"}
+        )
+
+    monkeypatch.setattr(webhook_module, "_webhook_deferred_until", {})
+    monkeypatch.setattr(
+        WebhookNotifier, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(WebhookNotifier, "_client_loop", asyncio.get_running_loop())
+
+    notifier = WebhookNotifier(name="limited", url=url, events=["test"])
+    await notifier.notify("test", {"ok": True})
+    await notifier.notify("test", {"ok": True})
+    await WebhookNotifier.close_client()
+
+    assert len(sent_at) == 2
+    assert sent_at[1] - sent_at[0] >= 0.2